@@ -14,10 +14,24 @@ STACK_NAME="creze-test-stack"
 aws ecr describe-repositories --repository-names $STACK_NAME || aws ecr create-repository --repository-name $STACK_NAME
 
 
+# La imagen no admite capas: la extensión de secretos se descarga y se copia
+# a /opt en el build (SECRETS_EXTENSION_ARN debe ser el de la región). Sin
+# ella, las funciones leen los secretos con boto3.
+echo "Downloading Parameters and Secrets Lambda Extension"
+if make secrets-extension; then
+  SECRETS_SOURCE="extension"
+else
+  echo -e "${WARNING}Secrets extension not downloaded, using the SDK${NC}"
+  rm -f lambdas/auth/extensions/secrets-extension.zip
+  SECRETS_SOURCE="sdk"
+fi
+
+PARAMETERS="ParameterKey=EnvStageName,ParameterValue=$ENV ParameterKey=Region,ParameterValue=$REGION ParameterKey=SecretsSource,ParameterValue=$SECRETS_SOURCE"
+
 echo "Building Docker images"
 sam build \
 --use-container \
---parameter-overrides "ParameterKey=EnvStageName,ParameterValue=$ENV ParameterKey=Region,ParameterValue=$REGION"
+--parameter-overrides "$PARAMETERS"
 
 echo "Deploying stack"
 sam package \
@@ -33,7 +47,7 @@ sam deploy \
 --s3-bucket "app-deploys-bucket" \
 --capabilities CAPABILITY_IAM CAPABILITY_AUTO_EXPAND \
 --image-repository "$AWS_ACCOUNT_ID.dkr.ecr.$REGION.amazonaws.com/$STACK_NAME" \
---parameter-overrides "ParameterKey=EnvStageName,ParameterValue=$ENV ParameterKey=Region,ParameterValue=$REGION" \
+--parameter-overrides "$PARAMETERS" \
 --no-fail-on-empty-changeset \
 --disable-rollback \
 --tags project=creze_test environment="${ENV}" owner=CrezeTest stackName="${STACK_NAME}" GitHubRepoName=technical-test-be
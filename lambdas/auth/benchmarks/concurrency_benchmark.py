@@ -0,0 +1,66 @@
+"""
+Concurrent-request throughput of SignInService, blocking vs offloaded.
+
+"blocking" awaits nothing and calls ``execute`` inline from the coroutine, the
+way the route handlers used to; "offloaded" awaits ``execute_async``.
+Cognito is simulated by benchmarks.fakes.FakeCognitoRepository.
+
+Usage (from lambdas/auth):
+    python -m benchmarks.concurrency_benchmark --requests 50 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.fakes import FakeCognitoRepository, LatencyProfile
+from src.application.sign_in_service import SignInService
+from src.domain.models.sign_in import SignInRequest
+from src.infrastructure.utils.logger import CustomLogger
+
+
+async def blocking_handler(service: SignInService, payload: SignInRequest):
+    return service.execute(payload)
+
+
+async def offloaded_handler(service: SignInService, payload: SignInRequest):
+    return await service.execute_async(payload)
+
+
+async def run(handler, service: SignInService, requests: int) -> float:
+    payload = SignInRequest(user="bench@example.com", password="secret123")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(service, payload) for _ in range(requests)))
+
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    cognito = FakeCognitoRepository(
+        latency=LatencyProfile(p50=args.latency, p99=args.latency)
+    )
+    cognito.seed_user("bench@example.com", "secret123")
+
+    service = SignInService(
+        logger=CustomLogger(level_log="WARNING"), cognito_repository=cognito
+    )
+
+    for name, handler in (
+        ("blocking", blocking_handler),
+        ("offloaded", offloaded_handler),
+    ):
+        elapsed = asyncio.run(run(handler, service, args.requests))
+        print(
+            f"{name:>10}: {args.requests} requests in {elapsed:.3f}s "
+            f"-> {args.requests / elapsed:.1f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
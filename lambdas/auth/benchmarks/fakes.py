@@ -0,0 +1,326 @@
+"""
+In-process stand-ins for Cognito and Secrets Manager.
+
+They implement the same repository interfaces as the real implementations,
+keep users in memory and simulate network latency and error rates, so the
+API can be benchmarked offline.
+"""
+
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+
+from src.domain.models.sm_lambda_auth_cognito import SmLambdaAuthCognito
+from src.domain.repositories.cognito_repository import ICognitoRepository
+from src.domain.repositories.secrets_manager_repository import (
+    ISecretsManagerRepository,
+)
+
+FAKE_CONFIRMATION_CODE = "123456"
+FAKE_MFA_CODE = "654321"
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Simulated latency of a remote call: a log-normal distribution defined by
+    its median and 99th percentile, in seconds.
+    """
+
+    p50: float = 0.03
+    p99: float = 0.12
+
+    def sample(self, rng: random.Random) -> float:
+        if self.p50 <= 0:
+            return 0.0
+        if self.p99 <= self.p50:
+            return self.p50
+
+        # Para una log-normal: p99 = p50 * exp(2.326 * sigma)
+        sigma = math.log(self.p99 / self.p50) / 2.326
+
+        return self.p50 * rng.lognormvariate(0, sigma)
+
+
+@dataclass
+class ErrorProfile:
+    """Probability of failing a call with one of ``error_codes``."""
+
+    error_rate: float = 0.0
+    error_codes: Sequence[str] = ("TooManyRequestsException",)
+
+
+@dataclass
+class FakeUser:
+    email: str
+    password: str
+    name: str
+    confirmed: bool = False
+    sub: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+
+PROFILES: Dict[str, Tuple[LatencyProfile, ErrorProfile]] = {
+    "instant": (LatencyProfile(p50=0, p99=0), ErrorProfile()),
+    "typical": (LatencyProfile(p50=0.03, p99=0.12), ErrorProfile()),
+    "degraded": (
+        LatencyProfile(p50=0.15, p99=1.5),
+        ErrorProfile(
+            error_rate=0.05,
+            error_codes=("TooManyRequestsException", "InternalErrorException"),
+        ),
+    ),
+}
+
+
+def client_error(code: str, operation_name: str, message: str = "") -> ClientError:
+    status_code = 500 if code == "InternalErrorException" else 400
+
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": message or code},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
+        operation_name,
+    )
+
+
+class _RemoteSimulator:
+    def __init__(
+        self,
+        latency: Optional[LatencyProfile] = None,
+        errors: Optional[ErrorProfile] = None,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency or LatencyProfile()
+        self.errors = errors or ErrorProfile()
+        self.calls: Dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def _remote_call(self, operation_name: str) -> None:
+        with self._rng_lock:
+            delay = self.latency.sample(self._rng)
+            failed = self._rng.random() < self.errors.error_rate
+            code = self._rng.choice(list(self.errors.error_codes)) if failed else None
+            self.calls[operation_name] = self.calls.get(operation_name, 0) + 1
+
+        if delay:
+            time.sleep(delay)
+
+        if code is not None:
+            raise client_error(code, operation_name)
+
+
+class FakeCognitoRepository(_RemoteSimulator, ICognitoRepository):
+    """
+    In-memory Cognito user pool with USER_PASSWORD_AUTH + SOFTWARE_TOKEN_MFA.
+
+    Sign-up codes are always FAKE_CONFIRMATION_CODE and TOTP codes
+    FAKE_MFA_CODE.
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyProfile] = None,
+        errors: Optional[ErrorProfile] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(latency=latency, errors=errors, seed=seed)
+        self.users: Dict[str, FakeUser] = {}
+        self.sessions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def seed_user(
+        self,
+        email: str,
+        password: str,
+        name: str = "Load Test",
+        confirmed: bool = True,
+    ) -> FakeUser:
+        user = FakeUser(email=email, password=password, name=name, confirmed=confirmed)
+        with self._lock:
+            self.users[email] = user
+        return user
+
+    def signin_with_email(self, email: str, password: str):
+        self._remote_call("InitiateAuth")
+
+        user = self.users.get(email)
+        if user is None or user.password != password:
+            raise client_error(
+                "NotAuthorizedException",
+                "InitiateAuth",
+                "Incorrect username or password.",
+            )
+        if not user.confirmed:
+            raise client_error("UserNotConfirmedException", "InitiateAuth")
+
+        session = f"session-{uuid.uuid4()}"
+        with self._lock:
+            self.sessions[session] = email
+
+        return {
+            "ChallengeName": "SOFTWARE_TOKEN_MFA",
+            "Session": session,
+            "ChallengeParameters": {},
+        }
+
+    def refresh_tokens(self, refresh_token: str, username: Optional[str] = None):
+        self._remote_call("InitiateAuth")
+
+        if not refresh_token.startswith("refresh-"):
+            raise client_error(
+                "NotAuthorizedException", "InitiateAuth", "Invalid Refresh Token"
+            )
+
+        return {
+            "ChallengeParameters": {},
+            "AuthenticationResult": {
+                "AccessToken": f"access-{uuid.uuid4()}",
+                "IdToken": f"id-{uuid.uuid4()}",
+                "ExpiresIn": 3600,
+                "TokenType": "Bearer",
+            },
+        }
+
+    def get_mfa_secret(self, access_token: str) -> Optional[str]:
+        self._remote_call("AssociateSoftwareToken")
+        return "JBSWY3DPEHPK3PXP"
+
+    def verify_mfa(
+        self,
+        mfa_code: str,
+        access_token: Optional[str] = None,
+        session: Optional[str] = None,
+    ):
+        self._remote_call("VerifySoftwareToken")
+
+        if mfa_code != FAKE_MFA_CODE:
+            raise client_error("CodeMismatchException", "VerifySoftwareToken")
+
+        return {"Status": "SUCCESS"}
+
+    def software_token_auth_challenge(
+        self, username: str, session: str, authenticator_code: str
+    ):
+        self._remote_call("RespondToAuthChallenge")
+
+        with self._lock:
+            email = self.sessions.pop(session, None)
+
+        if email is None or email != username:
+            raise client_error(
+                "NotAuthorizedException", "RespondToAuthChallenge", "Invalid session"
+            )
+        if authenticator_code != FAKE_MFA_CODE:
+            raise client_error("CodeMismatchException", "RespondToAuthChallenge")
+
+        return {
+            "ChallengeParameters": {},
+            "AuthenticationResult": {
+                "AccessToken": f"access-{uuid.uuid4()}",
+                "IdToken": f"id-{uuid.uuid4()}",
+                "RefreshToken": f"refresh-{uuid.uuid4()}",
+                "ExpiresIn": 3600,
+                "TokenType": "Bearer",
+            },
+        }
+
+    def signup(self, email: str, password: str, name: str) -> Any:
+        self._remote_call("SignUp")
+
+        with self._lock:
+            if email in self.users:
+                raise client_error("UsernameExistsException", "SignUp")
+            user = FakeUser(email=email, password=password, name=name)
+            self.users[email] = user
+
+        return {
+            "UserConfirmed": False,
+            "UserSub": user.sub,
+            "CodeDeliveryDetails": {
+                "Destination": f"{email[0]}***",
+                "DeliveryMedium": "EMAIL",
+                "AttributeName": "email",
+            },
+        }
+
+    def confirm_user_sign_up(self, user: str, confirmation_code: str) -> bool:
+        self._remote_call("ConfirmSignUp")
+
+        fake_user = self.users.get(user)
+        if fake_user is None:
+            raise client_error("UserNotFoundException", "ConfirmSignUp")
+        if confirmation_code != FAKE_CONFIRMATION_CODE:
+            raise client_error("CodeMismatchException", "ConfirmSignUp")
+
+        fake_user.confirmed = True
+        return True
+
+    def resend_confirmation(self, user: str):
+        self._remote_call("ResendConfirmationCode")
+
+        if user not in self.users:
+            raise client_error("UserNotFoundException", "ResendConfirmationCode")
+
+        return {
+            "Destination": f"{user[0]}***",
+            "DeliveryMedium": "EMAIL",
+            "AttributeName": "email",
+        }
+
+    def set_user_mfa_preference(
+        self, software_token_mfa_settings: dict, access_token: str
+    ) -> Any:
+        self._remote_call("SetUserMFAPreference")
+        return {}
+
+
+class FakeSecretsManagerRepository(_RemoteSimulator, ISecretsManagerRepository):
+    """Secrets Manager stand-in serving fixed values with simulated latency."""
+
+    def __init__(
+        self,
+        secrets: Optional[Dict[str, Any]] = None,
+        latency: Optional[LatencyProfile] = None,
+        errors: Optional[ErrorProfile] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(latency=latency, errors=errors, seed=seed)
+        self.secrets = secrets or {}
+
+    def get_secret(self, secret_name: str, default: Optional[Any] = None, **kwargs):
+        value, _ = self.get_secret_version(secret_name, default=default)
+        return value
+
+    def get_secret_version(
+        self,
+        secret_name: str,
+        version_stage: Optional[str] = None,
+        default: Optional[Any] = None,
+    ):
+        self._remote_call("GetSecretValue")
+        if secret_name not in self.secrets:
+            return default, None
+        return self.secrets[secret_name], "fake-version"
+
+
+def fake_cognito_configs() -> SmLambdaAuthCognito:
+    return SmLambdaAuthCognito(
+        name="fake",
+        authority="https://cognito-idp.us-east-1.amazonaws.com/us-east-1_fake",
+        client_id="fake-client-id",
+        client_secret="",
+        server_metadata_url=(
+            "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_fake"
+            "/.well-known/openid-configuration"
+        ),
+        client_kwargs={"scope": "openid email"},
+        user_pool_id="us-east-1_fake",
+    )
@@ -0,0 +1,155 @@
+"""
+Per-invocation CPU time of the Lambda handler, Mangum vs the fast path.
+
+Invokes ``main.http_handler`` (Mangum + FastAPI) and ``main.fast_path`` with
+the same API Gateway REST (v1) and HTTP API (v2) events for /auth/signin and
+/auth/mfa/verify, with Cognito replaced by benchmarks.fakes without latency,
+and reports the CPU time (``time.process_time``) spent per invocation. CPU
+time, not wall time, is what a 128 MB function pays for.
+
+Usage (from lambdas/auth):
+    python -m benchmarks.fast_path_benchmark --invocations 2000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("METRICS_ENABLED", "false")
+os.environ.setdefault("TOKEN_VERIFICATION_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SMLAMBDAAUTHORIZERCOGNITO", "fake-cognito-secret")
+os.environ["FAST_PATH_ENABLED"] = "true"
+
+from benchmarks.fakes import FAKE_MFA_CODE  # noqa: E402
+from benchmarks.load_test import PASSWORD, install_fakes  # noqa: E402
+from src.domain.enums.paths_enum import PathsEnum  # noqa: E402
+
+USER = "fast-path@example.com"
+
+
+class FakeLambdaContext:
+    aws_request_id = "fast-path-benchmark"
+
+    @staticmethod
+    def get_remaining_time_in_millis() -> int:
+        return 30000
+
+
+def v1_event(path: str, body: dict) -> dict:
+    headers = {"Content-Type": "application/json", "Origin": "https://app.local"}
+    return {
+        "resource": "/{proxy+}",
+        "path": path,
+        "httpMethod": "POST",
+        "headers": headers,
+        "multiValueHeaders": {name: [value] for name, value in headers.items()},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "requestContext": {
+            "resourcePath": "/{proxy+}",
+            "httpMethod": "POST",
+            "path": f"/dev{path}",
+            "stage": "dev",
+            "identity": {"sourceIp": "203.0.113.10"},
+        },
+        "body": json.dumps(body),
+        "isBase64Encoded": False,
+    }
+
+
+def v2_event(path: str, body: dict) -> dict:
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"content-type": "application/json", "origin": "https://app.local"},
+        "requestContext": {
+            "http": {
+                "method": "POST",
+                "path": path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": "203.0.113.10",
+                "userAgent": "benchmark",
+            },
+            "stage": "$default",
+        },
+        "body": json.dumps(body),
+        "isBase64Encoded": False,
+    }
+
+
+def measure(
+    handler: Callable, build_event: Callable[[], dict], invocations: int
+) -> Dict:
+    """CPU microseconds per invocation of ``handler``."""
+    context = FakeLambdaContext()
+    samples: List[float] = []
+    statuses = set()
+
+    for _ in range(invocations):
+        event = build_event()
+        started = time.process_time()
+        response = handler(event, context)
+        samples.append((time.process_time() - started) * 1_000_000)
+        statuses.add(response["statusCode"])
+
+    return {
+        "mean_us": round(statistics.fmean(samples), 1),
+        "p50_us": round(statistics.median(samples), 1),
+        "statuses": sorted(statuses),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--invocations", type=int, default=1000)
+    parser.add_argument("--warm-up", type=int, default=50)
+    args = parser.parse_args()
+
+    cognito = install_fakes("instant")
+    cognito.seed_user(USER, PASSWORD)
+
+    import main as lambda_main
+
+    def new_session() -> str:
+        return cognito.signin_with_email(USER, PASSWORD)["Session"]
+
+    scenarios = {
+        PathsEnum.sign_in.value: lambda: {"user": USER, "password": PASSWORD},
+        PathsEnum.mfa_verify.value: lambda: {
+            "user": USER,
+            "session": new_session(),
+            "authenticator_code": FAKE_MFA_CODE,
+        },
+    }
+    handlers = {"mangum": lambda_main.http_handler, "fast_path": lambda_main.fast_path}
+
+    print(f"{'endpoint':<20}{'event':<7}{'mangum us':>11}{'fast us':>10}{'ratio':>8}")
+    for path, build_body in scenarios.items():
+        for version, build_event in (("v1", v1_event), ("v2", v2_event)):
+            results = {}
+            for name, handler in handlers.items():
+                measure(handler, lambda: build_event(path, build_body()), args.warm_up)
+                results[name] = measure(
+                    handler, lambda: build_event(path, build_body()), args.invocations
+                )
+
+            if results["mangum"]["statuses"] != results["fast_path"]["statuses"]:
+                raise SystemExit(f"Different statuses for {path} {version}: {results}")
+
+            print(
+                f"{path:<20}{version:<7}"
+                f"{results['mangum']['mean_us']:>11}"
+                f"{results['fast_path']['mean_us']:>10}"
+                f"{results['mangum']['mean_us'] / results['fast_path']['mean_us']:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
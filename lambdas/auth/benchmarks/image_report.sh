@@ -0,0 +1,43 @@
+#!/usr/bin/env bash
+# Construye la imagen de la Lambda y registra su tamaño y el tiempo de la
+# primera invocación (cold start) usando el Runtime Interface Emulator que trae
+# la imagen base. Cada corrida agrega una línea a benchmarks/results/image_report.csv.
+set -euo pipefail
+
+AUTH_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+IMAGE_TAG="${IMAGE_TAG:=auth-lambda:report}"
+PORT="${PORT:=9000}"
+RESULTS_FILE="${RESULTS_FILE:=$AUTH_DIR/benchmarks/results/image_report.csv}"
+EVENT='{"resource": "/{proxy+}", "path": "/openapi.json", "httpMethod": "GET", "headers": {}, "requestContext": {"resourcePath": "/{proxy+}", "httpMethod": "GET", "path": "/openapi.json", "stage": "local", "identity": {"sourceIp": "127.0.0.1"}}, "isBase64Encoded": false}'
+
+docker build -t "$IMAGE_TAG" "$AUTH_DIR"
+
+IMAGE_SIZE=$(docker image inspect "$IMAGE_TAG" --format '{{.Size}}')
+
+CONTAINER_ID=$(docker run -d -p "$PORT:8080" \
+  -e REGION=us-east-1 -e AWS_LAMBDA_FUNCTION_MEMORY_SIZE=128 \
+  "$IMAGE_TAG")
+trap 'docker rm -f "$CONTAINER_ID" > /dev/null' EXIT
+
+# Esperar a que el emulador acepte conexiones sin invocar la función
+until curl -s -o /dev/null "http://localhost:$PORT/"; do sleep 0.1; done
+
+COLD_START_MS=$(curl -s -o /dev/null -w '%{time_total}' \
+  -XPOST "http://localhost:$PORT/2015-03-31/functions/function/invocations" \
+  -d "$EVENT" | awk '{printf "%d", $1 * 1000}')
+
+WARM_MS=$(curl -s -o /dev/null -w '%{time_total}' \
+  -XPOST "http://localhost:$PORT/2015-03-31/functions/function/invocations" \
+  -d "$EVENT" | awk '{printf "%d", $1 * 1000}')
+
+mkdir -p "$(dirname "$RESULTS_FILE")"
+if [ ! -f "$RESULTS_FILE" ]; then
+  echo "date,commit,image_size_bytes,cold_start_ms,warm_ms" > "$RESULTS_FILE"
+fi
+
+COMMIT=$(git -C "$AUTH_DIR" rev-parse --short HEAD 2> /dev/null || echo unknown)
+echo "$(date -u +%Y-%m-%dT%H:%M:%SZ),$COMMIT,$IMAGE_SIZE,$COLD_START_MS,$WARM_MS" >> "$RESULTS_FILE"
+
+echo "Image size: $((IMAGE_SIZE / 1024 / 1024)) MB"
+echo "Cold start: ${COLD_START_MS} ms"
+echo "Warm:       ${WARM_MS} ms"
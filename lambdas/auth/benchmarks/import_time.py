@@ -0,0 +1,124 @@
+"""
+Import-time profile of the Lambda entry point (``python -X importtime``).
+
+Reports the total cumulative import time and the heaviest top-level packages.
+With ``--baseline`` the run fails when the total grows by more than
+``--tolerance`` percent, so cold-start regressions show up in CI.
+
+Usage (from lambdas/auth):
+    python -m benchmarks.import_time --output benchmarks/results/import_time.json
+    python -m benchmarks.import_time --baseline benchmarks/results/import_time.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+def profile_once(module: str) -> Tuple[int, Dict[str, int]]:
+    """Import ``module`` in a fresh interpreter and parse the importtime report."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    packages: Dict[str, int] = defaultdict(int)
+    total = 0
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        raw_self, raw_cumulative, raw_name = line[len("import time:") :].split("|")
+        self_us = int(raw_self)
+        cumulative_us = int(raw_cumulative)
+
+        # Only top-level entries (no indentation) add up to the total
+        if not raw_name.startswith("  "):
+            total += cumulative_us
+
+        packages[raw_name.strip().split(".")[0]] += self_us
+
+    return total, dict(packages)
+
+
+def profile(module: str, runs: int) -> Dict:
+    totals: List[int] = []
+    packages: Dict[str, List[int]] = defaultdict(list)
+
+    for _ in range(runs):
+        total, per_package = profile_once(module)
+        totals.append(total)
+        for name, value in per_package.items():
+            packages[name].append(value)
+
+    return {
+        "module": module,
+        "runs": runs,
+        "total_us": int(statistics.median(totals)),
+        "packages_us": dict(
+            sorted(
+                (
+                    (name, int(statistics.median(values)))
+                    for name, values in packages.items()
+                ),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # Sin baseline se falla antes de medir, con un mensaje y no un traceback
+    if args.baseline and not os.path.exists(args.baseline):
+        sys.exit(f"No baseline at {args.baseline}: run `make bench-import` first")
+
+    report = profile(args.module, args.runs)
+
+    print(
+        f"import {report['module']}: {report['total_us'] / 1000:.1f} ms (median of {args.runs})"
+    )
+    for name, value in list(report["packages_us"].items())[: args.top]:
+        print(f"  {name:<30} {value / 1000:8.1f} ms")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        growth = (
+            (report["total_us"] - baseline["total_us"]) * 100 / baseline["total_us"]
+        )
+        print(f"vs baseline: {growth:+.1f}%")
+
+        if growth > args.tolerance:
+            sys.exit(
+                f"Import time regressed by {growth:.1f}% (tolerance {args.tolerance}%)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Offline load test of the auth API.
+
+Drives ``main.app`` in-process through httpx's ASGI transport with Cognito
+and Secrets Manager replaced by benchmarks.fakes, and reports throughput and
+p50/p95/p99 latency per endpoint. With ``--baseline`` it fails when any
+endpoint's p95 grows more than ``--tolerance`` percent, so it can run as a
+regression benchmark.
+
+Usage (from lambdas/auth):
+    python -m benchmarks.load_test --requests 500 --concurrency 20 --profile typical
+    python -m benchmarks.load_test --output benchmarks/results/load_test.json
+    python -m benchmarks.load_test --baseline benchmarks/results/load_test.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+# Configuración previa a importar la app: sin logs por request ni métricas EMF
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("METRICS_ENABLED", "false")
+os.environ.setdefault("TOKEN_VERIFICATION_ENABLED", "false")
+# Todas las peticiones salen de la misma IP; el limitador las rechazaría
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SMLAMBDAAUTHORIZERCOGNITO", "fake-cognito-secret")
+
+import httpx  # noqa: E402
+
+from benchmarks.fakes import (  # noqa: E402
+    FAKE_CONFIRMATION_CODE,
+    FAKE_MFA_CODE,
+    PROFILES,
+    FakeCognitoRepository,
+    FakeSecretsManagerRepository,
+    fake_cognito_configs,
+)
+from src.application.services import container  # noqa: E402
+from src.domain.enums.paths_enum import PathsEnum  # noqa: E402
+
+PASSWORD = "LoadTest123."
+
+Request = Tuple[str, str, dict]
+
+
+def install_fakes(profile: str) -> FakeCognitoRepository:
+    """Replace the AWS-backed repositories of the container with fakes."""
+    latency, errors = PROFILES[profile]
+    cognito = FakeCognitoRepository(latency=latency, errors=errors, seed=1)
+    secrets = FakeSecretsManagerRepository(
+        secrets={os.environ["SMLAMBDAAUTHORIZERCOGNITO"]: fake_cognito_configs()},
+        latency=latency,
+        seed=2,
+    )
+
+    container.register("cognito_repository", lambda c: cognito)
+    container.register("sm_repository", lambda c: secrets)
+    container.reset()
+
+    return cognito
+
+
+async def prepare_sessions(
+    client: httpx.AsyncClient, cognito: FakeCognitoRepository, count: int
+) -> List[Tuple[str, str]]:
+    """Sign in ``count`` seeded users and return (user, session) pairs."""
+    sessions = []
+    for index in range(count):
+        user = f"verify-{index}@example.com"
+        cognito.seed_user(user, PASSWORD)
+        response = await client.post(
+            PathsEnum.sign_in.value, json={"user": user, "password": PASSWORD}
+        )
+        sessions.append((user, response.json()["resultado"]["session"]))
+    return sessions
+
+
+def scenarios(
+    cognito: FakeCognitoRepository, requests: int, sessions: List[Tuple[str, str]]
+) -> Dict[str, Callable[[int], Request]]:
+    for index in range(requests):
+        cognito.seed_user(f"signin-{index}@example.com", PASSWORD)
+        cognito.seed_user(f"confirm-{index}@example.com", PASSWORD, confirmed=False)
+
+    return {
+        PathsEnum.sign_in.value: lambda i: (
+            "POST",
+            PathsEnum.sign_in.value,
+            {"user": f"signin-{i}@example.com", "password": PASSWORD},
+        ),
+        PathsEnum.mfa_verify.value: lambda i: (
+            "POST",
+            PathsEnum.mfa_verify.value,
+            {
+                "user": sessions[i][0],
+                "session": sessions[i][1],
+                "authenticator_code": FAKE_MFA_CODE,
+            },
+        ),
+        PathsEnum.sign_up.value: lambda i: (
+            "POST",
+            PathsEnum.sign_up.value,
+            {
+                "email": f"signup-{i}-{time.time_ns()}@example.com",
+                "password": PASSWORD,
+                "repeat_password": PASSWORD,
+                "name": "Load Test",
+            },
+        ),
+        PathsEnum.confirm_sign_up.value: lambda i: (
+            "POST",
+            PathsEnum.confirm_sign_up.value,
+            {
+                "user": f"confirm-{i}@example.com",
+                "confirmation_code": FAKE_CONFIRMATION_CODE,
+            },
+        ),
+    }
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    build_request: Callable[[int], Request],
+    requests: int,
+    concurrency: int,
+) -> Dict:
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+
+    async def worker():
+        while not queue.empty():
+            method, path, body = build_request(queue.get_nowait())
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[str(response.status_code)] = (
+                statuses.get(str(response.status_code), 0) + 1
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentiles[49], 2),
+        "p95_ms": round(percentiles[94], 2),
+        "p99_ms": round(percentiles[98], 2),
+        "statuses": statuses,
+    }
+
+
+async def run(args) -> Dict:
+    cognito = install_fakes(args.profile)
+
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        sessions = await prepare_sessions(client, cognito, args.requests)
+        report = {"profile": args.profile, "concurrency": args.concurrency}
+
+        for path, build_request in scenarios(cognito, args.requests, sessions).items():
+            if args.endpoints and path not in args.endpoints:
+                continue
+            report[path] = await run_endpoint(
+                client, build_request, args.requests, args.concurrency
+            )
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="typical")
+    parser.add_argument("--endpoints", nargs="*", help="Only run these paths")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="Compare p95 against a previous report")
+    parser.add_argument("--tolerance", type=float, default=20.0)
+    args = parser.parse_args()
+
+    # Sin baseline se falla antes de medir, con un mensaje y no un traceback
+    if args.baseline and not os.path.exists(args.baseline):
+        sys.exit(f"No baseline at {args.baseline}: run `make bench-load` first")
+
+    report = asyncio.run(run(args))
+
+    print(f"profile={report['profile']} concurrency={report['concurrency']}")
+    for path, result in report.items():
+        if not isinstance(result, dict):
+            continue
+        print(
+            f"  {path:<22} {result['throughput_rps']:>8} req/s  "
+            f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+            f"p99 {result['p99_ms']:>8} ms  {result['statuses']}"
+        )
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        regressions = []
+        for path, result in report.items():
+            previous = baseline.get(path)
+            if not isinstance(result, dict) or not isinstance(previous, dict):
+                continue
+            growth = (result["p95_ms"] - previous["p95_ms"]) * 100 / previous["p95_ms"]
+            if growth > args.tolerance:
+                regressions.append(f"{path} p95 +{growth:.1f}%")
+
+        if regressions:
+            sys.exit("Latency regressions: " + ", ".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
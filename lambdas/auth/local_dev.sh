@@ -1,10 +1,13 @@
 #!/bin/bash
 
-# Construir la función Lambda con contenedor
-sam build LambdaSignInFunction --use-container
+# Construir la función Lambda con contenedor; el stage local incluye en la
+# imagen los secretos de ejemplo
+sam build LambdaSignInFunction --use-container \
+--parameter-overrides "ParameterKey=EnvStageName,ParameterValue=local"
 
 # Ejecutar el API Gateway localmente con las variables de entorno de locals.json
-sam local start-api --env-vars lambdas/auth/locals.json --debug
+sam local start-api --env-vars lambdas/auth/locals.json \
+--parameter-overrides "ParameterKey=EnvStageName,ParameterValue=local" --debug
 
 # (Opcional) Invocar la función Lambda localmente con un archivo de evento
 # sam local invoke LambdaSignInFunction --event lambdas/auth/mocks/signin.json \
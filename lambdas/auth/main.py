@@ -1,26 +1,162 @@
+import os
+import time
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 
 from src.infrastructure.controllers.signin_controller import router
 from src.infrastructure.controllers.signup_controller import signup_router
+from src.application.services import (
+    get_client_ip_resolver,
+    get_idempotency_guard,
+    get_logger,
+    get_metrics,
+    get_rate_limiter,
+    get_signin_service,
+    get_verify_mfa_service,
+    warm_up,
+)
+from src.infrastructure.controllers.fast_path import FastPathRouter, default_routes
+from src.infrastructure.middlewares.idempotency_middleware import (
+    IdempotencyMiddleware,
+)
+from src.infrastructure.middlewares.rate_limit_middleware import RateLimitMiddleware
+from src.infrastructure.middlewares.request_context_middleware import (
+    RequestContextMiddleware,
+)
+from src.infrastructure.utils.exceptions import circuit_open_handler
+from src.infrastructure.utils.resilience import CircuitOpenError
+from src.infrastructure.utils.warm_up import (
+    is_warm_up_event,
+    warm_up_connections,
+    warm_up_validators,
+)
+
+CORS_ALLOW_ORIGINS = ["*"]
+CORS_ALLOW_CREDENTIALS = True
 
 # Crear la aplicación FastAPI
 app = FastAPI(swagger_ui_parameters={"syntaxHighlight": False})
 
 
+# Los middlewares agregados al final envuelven a los anteriores: el rate
+# limit y la idempotencia quedan dentro de CORS para que sus respuestas (429,
+# 409, 422 y las repetidas) lleven sus headers.
+app.add_middleware(
+    IdempotencyMiddleware,
+    idempotency_guard_provider=get_idempotency_guard,
+    logger=get_logger(),
+)
+app.add_middleware(
+    RateLimitMiddleware,
+    rate_limiter_provider=get_rate_limiter,
+    logger=get_logger(),
+    client_ip_resolver=get_client_ip_resolver(),
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ALLOW_ORIGINS,
+    allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestContextMiddleware, logger=get_logger(), metrics=get_metrics())
+app.add_exception_handler(CircuitOpenError, circuit_open_handler)
 
 # Incluir los controladores
 app.include_router(router=router)
 app.include_router(router=signup_router)
 
 
+# Por defecto todo se inicializa en el primer uso. Con WARM_UP_ON_INIT=true los
+# clientes, el secreto y los servicios se crean durante la fase init de Lambda.
+if os.getenv("WARM_UP_ON_INIT", "false").lower() == "true":
+    try:
+        warm_up()
+    except Exception as err:
+        get_logger().error("Warm up failed", extra={"error": str(err)})
+
+
 # Integración con AWS Lambda
-lambda_handler = Mangum(app)
+http_handler = Mangum(app)
+
+# Con FAST_PATH_ENABLED=true /auth/signin y /auth/mfa/verify se atienden sin
+# pasar por Mangum ni FastAPI; el resto de eventos sigue por http_handler.
+fast_path = (
+    FastPathRouter(
+        routes=default_routes(get_signin_service, get_verify_mfa_service),
+        logger=get_logger(),
+        metrics=get_metrics(),
+        rate_limiter_provider=get_rate_limiter,
+        client_ip_resolver=get_client_ip_resolver(),
+        allow_origins=CORS_ALLOW_ORIGINS,
+        allow_credentials=CORS_ALLOW_CREDENTIALS,
+    )
+    if os.getenv("FAST_PATH_ENABLED", "false").lower() == "true"
+    else None
+)
+
+_cold_start = True
+
+
+def handle_warm_up(event: dict) -> dict:
+    """
+    Initialize everything a request needs and return without touching the API.
+
+    The event may set ``connections`` to open that many Cognito connections
+    in parallel (WARM_UP_CONNECTIONS by default).
+
+    Args:
+        event: Keep-warm event
+
+    Returns:
+        Summary of the warm-up, visible in the invocation result.
+    """
+    global _cold_start
+
+    started = time.perf_counter()
+    cold_start, _cold_start = _cold_start, False
+    connections = warm_up_connections(
+        event, default=int(os.getenv("WARM_UP_CONNECTIONS", "0"))
+    )
+
+    try:
+        warm_up(connections=connections)
+        validators = warm_up_validators(router, signup_router)
+        warmed = True
+    except Exception as err:
+        get_logger().error("Warm up failed", extra={"error": str(err)})
+        validators = 0
+        warmed = False
+
+    result = {
+        "warmed": warmed,
+        "cold_start": cold_start,
+        "connections": connections,
+        "validators": validators,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+    get_logger().info("Warm up event handled", extra=result)
+
+    return result
+
+
+def lambda_handler(event, context):
+    """
+    Route keep-warm pings to handle_warm_up, the hot endpoints to the fast
+    path when enabled and everything else to Mangum.
+    """
+    global _cold_start
+
+    if is_warm_up_event(event):
+        return handle_warm_up(event)
+
+    _cold_start = False
+
+    if fast_path is not None:
+        response = fast_path(event, context)
+        if response is not None:
+            return response
+
+    return http_handler(event, context)
@@ -0,0 +1,16 @@
+from typing import Any
+
+from src.domain.models.dev_response import DevResponse
+from src.infrastructure.utils.executor import run_blocking
+
+
+class AsyncExecuteMixin:
+    """
+    Adds a non-blocking ``execute_async`` to services with a sync ``execute``.
+
+    The whole service call (Cognito round trips included) runs in the bounded
+    executor, so async route handlers never block the event loop.
+    """
+
+    async def execute_async(self, *args: Any, **kwargs: Any) -> DevResponse:
+        return await run_blocking(self.execute, *args, **kwargs)
@@ -0,0 +1,194 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional, Self, Set
+
+from fastapi import status
+from pydantic import ValidationError
+
+from src.application.sign_up_service import SignUpService
+from src.domain.enums.messages import MessagesEnum
+from src.domain.models.rate_limit import TokenBucketPolicy
+from src.domain.models.sign_up import (
+    BulkSignUpRowResult,
+    SignUpRequest,
+    SignUpResponse,
+)
+from src.domain.repositories.rate_limit_repository import IRateLimitRepository
+from src.infrastructure.repositories.in_memory_rate_limit_repository_impl import (
+    InMemoryRateLimitRepositoryImpl,
+)
+from src.infrastructure.utils.bulk_input import RowRecord
+from src.infrastructure.utils.exceptions import process_validation_error
+from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.resilience import CircuitOpenError
+
+
+class BulkSignUpService:
+    """
+    Signs up many users, running SignUpService for each row of a file.
+
+    Rows are validated with SignUpRequest, and the valid ones are sent to
+    Cognito through at most ``max_concurrency`` threads, paced by a token
+    bucket of ``rate_per_second`` so the SignUp quota of the account is not
+    exhausted. Results are yielded as the calls finish, so the caller can
+    stream the report.
+    """
+
+    def __init__(
+        self: Self,
+        logger: CustomLogger,
+        signup_service: SignUpService,
+        max_concurrency: int = 5,
+        rate_per_second: float = 10,
+        max_rows: Optional[int] = None,
+        rate_limit_repository: Optional[IRateLimitRepository] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            logger: Logger object
+            signup_service: Service used for every row
+            max_concurrency: Sign ups in flight at the same time
+            rate_per_second: Maximum sign ups started per second
+            max_rows: Rows accepted per execution, None for no limit
+            rate_limit_repository: Store of the pacing bucket, in memory by default
+            sleep: Sleep function, injectable for tests
+        """
+        self.logger = logger
+        self.signup_service = signup_service
+        self.max_concurrency = max_concurrency
+        self.max_rows = max_rows
+        self.pacing = TokenBucketPolicy(
+            capacity=max(rate_per_second, 1), refill_per_second=rate_per_second
+        )
+        self.rate_limit_repository = (
+            rate_limit_repository or InMemoryRateLimitRepositoryImpl(max_keys=1)
+        )
+        self.sleep = sleep
+
+    def execute(
+        self: Self, records: Iterable[RowRecord]
+    ) -> Iterator[BulkSignUpRowResult]:
+        """
+        Sign up the users of ``records``.
+
+        Args:
+            records: (row number, fields) pairs, see bulk_input.iter_records
+
+        Returns:
+            Iterator of one result per row, in completion order.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="bulk-signup"
+        ) as executor:
+            pending: Set[Future] = set()
+
+            for row, fields in records:
+                if self.max_rows is not None and row > self.max_rows:
+                    yield BulkSignUpRowResult(
+                        row=row,
+                        status="invalid",
+                        status_code=413,  # Payload Too Large
+                        mensaje=f"Only {self.max_rows} rows are accepted; "
+                        "this and the following rows were not processed",
+                    )
+                    break
+
+                request = self.validate_row(row, fields)
+                if isinstance(request, BulkSignUpRowResult):
+                    yield request
+                    continue
+
+                if len(pending) >= self.max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+                self._wait_for_token()
+                context = contextvars.copy_context()
+                pending.add(executor.submit(context.run, self._sign_up, row, request))
+
+            for future in wait(pending).done:
+                yield future.result()
+
+    def validate_row(
+        self: Self, row: int, fields
+    ) -> SignUpRequest | BulkSignUpRowResult:
+        """Return the SignUpRequest of a row, or its result when it is invalid."""
+        if isinstance(fields, ValueError):
+            return BulkSignUpRowResult(
+                row=row,
+                status="invalid",
+                status_code=422,  # Unprocessable Entity
+                mensaje=str(fields),
+            )
+
+        try:
+            return SignUpRequest.model_validate(fields)
+        except ValidationError as err:
+            email = fields.get("email")
+
+            return BulkSignUpRowResult(
+                row=row,
+                status="invalid",
+                status_code=422,  # Unprocessable Entity
+                email=email if isinstance(email, str) else None,
+                mensaje=MessagesEnum.PAYLOAD_ERROR.value,
+                errors=process_validation_error(err).result["errors"],
+            )
+
+    def _wait_for_token(self: Self) -> None:
+        while True:
+            decision = self.rate_limit_repository.consume("bulk-signup", self.pacing)
+            if decision.allowed:
+                return
+            self.sleep(decision.retry_after_seconds)
+
+    def _sign_up(self: Self, row: int, request: SignUpRequest) -> BulkSignUpRowResult:
+        try:
+            response = self.signup_service.execute(request)
+        except CircuitOpenError:
+            return BulkSignUpRowResult(
+                row=row,
+                status="failed",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                email=request.email,
+                mensaje=MessagesEnum.SERVICE_UNAVAILABLE.value,
+            )
+        except Exception as err:
+            self.logger.error(
+                "Bulk sign up row failed", extra={"row": row, "error": str(err)}
+            )
+            return BulkSignUpRowResult(
+                row=row,
+                status="failed",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                email=request.email,
+                mensaje=MessagesEnum.INTERNAL_SERVER_ERROR.value,
+            )
+
+        result: SignUpResponse = response.result
+        resultado = result.resultado
+
+        if response.statusCode == status.HTTP_200_OK:
+            return BulkSignUpRowResult(
+                row=row,
+                status="created",
+                status_code=response.statusCode,
+                email=request.email,
+                mensaje=result.mensaje,
+                user_sub=(
+                    resultado.get("UserSub") if isinstance(resultado, dict) else None
+                ),
+            )
+
+        return BulkSignUpRowResult(
+            row=row,
+            status="rejected" if response.statusCode < 500 else "failed",
+            status_code=response.statusCode,
+            email=request.email,
+            mensaje=resultado if isinstance(resultado, str) else result.mensaje,
+        )
@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Self
+
+from botocore.exceptions import ClientError
+from fastapi import status
+
+from src.domain.enums.messages import MessagesEnum
+from src.domain.models.dev_response import DevResponse
+from src.infrastructure.utils.metrics import MetricsEmitter
+from src.infrastructure.utils.request_context import get_request_context
+
+
+@dataclass(frozen=True, slots=True)
+class CognitoErrorRule:
+    """
+    How the API answers a Cognito error code.
+
+    Attributes:
+        status_code: HTTP status of the response
+        message: ``mensaje`` of the response
+        detail: ``resultado`` of the response, used by the sign up endpoints
+        retryable: Whether the same request may succeed later
+        retry_after_seconds: Value of the Retry-After header, if any
+    """
+
+    status_code: int
+    message: MessagesEnum
+    detail: Optional[MessagesEnum] = None
+    retryable: bool = False
+    retry_after_seconds: Optional[int] = None
+
+    def response(self, final_response: Any) -> DevResponse:
+        """
+        Fill the response dataclass (mensaje, resultado) of a service.
+
+        Args:
+            final_response: Response dataclass of the service
+
+        Returns:
+            The DevResponse of the error.
+        """
+        final_response.mensaje = self.message.value
+        final_response.resultado = self.detail.value if self.detail else None
+
+        return DevResponse(
+            statusCode=self.status_code,
+            result=final_response,
+            headers=(
+                {"retry-after": str(self.retry_after_seconds)}
+                if self.retry_after_seconds
+                else None
+            ),
+        )
+
+
+UNKNOWN_ERROR_RULE = CognitoErrorRule(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    message=MessagesEnum.INTERNAL_SERVER_ERROR,
+)
+
+
+def default_rules(
+    throttle_retry_after_seconds: int = 1,
+) -> Dict[str, CognitoErrorRule]:
+    """
+    Answer of each Cognito error code shared by all the services.
+
+    Args:
+        throttle_retry_after_seconds: Retry-After of the throttling errors
+
+    Returns:
+        Rules by error code.
+    """
+    throttled = CognitoErrorRule(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        message=MessagesEnum.LIMIT_EXCEEDED,
+        retryable=True,
+        retry_after_seconds=throttle_retry_after_seconds,
+    )
+    code_invalid = CognitoErrorRule(
+        status_code=status.HTTP_400_BAD_REQUEST, message=MessagesEnum.CODE_INVALID
+    )
+    payload_error = CognitoErrorRule(
+        status_code=status.HTTP_400_BAD_REQUEST, message=MessagesEnum.PAYLOAD_ERROR
+    )
+
+    return {
+        "CodeMismatchException": code_invalid,
+        "ExpiredCodeException": code_invalid,
+        "InvalidParameterException": payload_error,
+        "InvalidPasswordException": payload_error,
+        "NotAuthorizedException": CognitoErrorRule(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=MessagesEnum.SESSION_INVALID_OR_EXPIRED,
+        ),
+        "UserNotFoundException": CognitoErrorRule(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+        ),
+        "UserNotConfirmedException": CognitoErrorRule(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message=MessagesEnum.USER_NOT_CONFIRMED,
+        ),
+        "UsernameExistsException": CognitoErrorRule(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+            detail=MessagesEnum.USERNAME_EXISTS,
+        ),
+        "TooManyRequestsException": throttled,
+        "TooManyFailedAttemptsException": throttled,
+        "LimitExceededException": throttled,
+        "ThrottlingException": throttled,
+        "InternalErrorException": CognitoErrorRule(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=MessagesEnum.INTERNAL_SERVER_ERROR,
+            retryable=True,
+        ),
+    }
+
+
+class CognitoErrorMapper:
+    """
+    Table driven translation of Cognito errors into API responses.
+
+    Services get the shared table with their own overrides merged once
+    (``with_overrides``), so answering an error is a dict lookup. Every
+    mapped error is counted as a CognitoErrors EMF metric by error code,
+    with the Cognito latency of the request.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Mapping[str, CognitoErrorRule]] = None,
+        default: CognitoErrorRule = UNKNOWN_ERROR_RULE,
+        metrics: Optional[MetricsEmitter] = None,
+    ):
+        """
+        Initialize the mapper.
+
+        Args:
+            rules: Rules by error code, default_rules() if not given
+            default: Rule of the codes not in ``rules``
+            metrics: Emitter of the per error code metrics, None to disable
+        """
+        self.rules: Mapping[str, CognitoErrorRule] = MappingProxyType(
+            dict(default_rules() if rules is None else rules)
+        )
+        self.default = default
+        self.metrics = metrics
+
+    def with_overrides(
+        self: Self, overrides: Mapping[str, CognitoErrorRule]
+    ) -> "CognitoErrorMapper":
+        """Mapper with the same table and metrics, plus the rules of ``overrides``."""
+        return CognitoErrorMapper(
+            rules={**self.rules, **overrides},
+            default=self.default,
+            metrics=self.metrics,
+        )
+
+    def rule(self: Self, error_code: str) -> CognitoErrorRule:
+        """Rule of an error code, without counting it."""
+        return self.rules.get(error_code, self.default)
+
+    def map(self: Self, err: ClientError) -> CognitoErrorRule:
+        """
+        Rule of a Cognito error, counted in the metrics.
+
+        Args:
+            err: Error raised by the Cognito repository
+
+        Returns:
+            The rule of the error code.
+        """
+        error_code = err.response.get("Error", {}).get("Code", "Unknown")
+        rule = self.rule(error_code)
+        self._count(error_code, rule, getattr(err, "operation_name", None))
+
+        return rule
+
+    def response(self: Self, err: ClientError, final_response: Any) -> DevResponse:
+        """Shortcut for ``map(err).response(final_response)``."""
+        return self.map(err).response(final_response)
+
+    def _count(
+        self: Self, error_code: str, rule: CognitoErrorRule, operation: Optional[str]
+    ) -> None:
+        if self.metrics is None:
+            return
+
+        context = get_request_context()
+        metrics = {"CognitoErrors": 1}
+        if context is not None and "Cognito" in context.phases:
+            metrics["CognitoErrorLatency"] = context.phases["Cognito"]
+
+        self.metrics.emit(
+            metrics=metrics,
+            units={"CognitoErrors": "Count"},
+            dimensions={"ErrorCode": error_code},
+            properties={
+                "operation": operation,
+                "status_code": rule.status_code,
+                "retryable": rule.retryable,
+                "request_id": context.request_id if context is not None else None,
+            },
+        )
@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Callable, Optional, Self, Sequence
+
+from src.domain.models.config_snapshot import ConfigSnapshot
+from src.domain.repositories.secrets_manager_repository import (
+    ISecretsManagerRepository,
+)
+
+
+class ConfigProvider:
+    """
+    Builds the ConfigSnapshot of the configured secrets.
+
+    Every secret is requested in one ``get_secret_versions`` call, so on a
+    cold start they are loaded with a single round trip whatever their
+    number. With a caching repository underneath, later calls are served from
+    memory and return the same snapshot object until a version changes.
+    """
+
+    def __init__(
+        self: Self,
+        sm_repository: ISecretsManagerRepository,
+        secret_names: Sequence[str],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            sm_repository: Repository the secrets are read from
+            secret_names: Secrets included in the snapshot
+            clock: Wall clock used for ``loaded_at``
+        """
+        self.sm_repository = sm_repository
+        self.secret_names = list(dict.fromkeys(secret_names))
+        self.clock = clock
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self: Self) -> ConfigSnapshot:
+        """Return the current snapshot, building a new one if a secret changed."""
+        loaded = self.sm_repository.get_secret_versions(self.secret_names)
+        current = self._snapshot
+
+        if current is not None and all(
+            current.secrets.get(name) is value
+            and current.versions.get(name) == version_id
+            for name, (value, version_id) in loaded.items()
+        ):
+            return current
+
+        with self._lock:
+            self._snapshot = ConfigSnapshot(
+                secrets={name: value for name, (value, _) in loaded.items()},
+                versions={name: version_id for name, (_, version_id) in loaded.items()},
+                loaded_at=self.clock(),
+            )
+            return self._snapshot
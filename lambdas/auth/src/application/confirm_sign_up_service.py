@@ -1,22 +1,44 @@
-from typing import Self
+from typing import Optional, Self
 from fastapi import status
 from botocore.exceptions import ClientError
 
 from src.domain.enums.messages import MessagesEnum
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper, CognitoErrorRule
+from src.application.user_status_cache import UserStatusCache
 from src.domain.models.dev_response import DevResponse
 from src.domain.models.sign_up import ConfirmSignUpRequest, SignUpResponse
 from src.domain.repositories.cognito_repository import ICognitoRepository
 from src.infrastructure.utils.logger import CustomLogger
 
-
-class ConfirmSignUpService:
+CONFIRM_SIGN_UP_ERRORS = {
+    "CodeMismatchException": CognitoErrorRule(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+        detail=MessagesEnum.CODE_INVALID,
+    ),
+    # El usuario ya está confirmado
+    "NotAuthorizedException": CognitoErrorRule(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+    ),
+}
+
+
+class ConfirmSignUpService(AsyncExecuteMixin):
     def __init__(
         self: Self,
         logger: CustomLogger,
         cognito_repository: ICognitoRepository,
+        user_status_cache: Optional[UserStatusCache] = None,
+        error_mapper: Optional[CognitoErrorMapper] = None,
     ):
         self.logger = logger
         self.cognito_repository = cognito_repository
+        self.user_status_cache = user_status_cache
+        self.errors = (error_mapper or CognitoErrorMapper()).with_overrides(
+            CONFIRM_SIGN_UP_ERRORS
+        )
 
     def execute(self: Self, payload: ConfirmSignUpRequest) -> DevResponse:
         """
@@ -34,6 +56,10 @@ class ConfirmSignUpService:
 
         self.logger.info("Init Proccess", extra={"payload": payload})
 
+        # Cualquier intento de confirmación puede cambiar el estado del usuario
+        if self.user_status_cache is not None:
+            self.user_status_cache.forget(payload.user)
+
         try:
             try_signup = self.cognito_repository.confirm_user_sign_up(
                 user=payload.user,
@@ -43,45 +69,10 @@ class ConfirmSignUpService:
         except ClientError as err:
             self.logger.error("Error in sign up service", extra={"error": str(err)})
 
-            if err.response["Error"]["Code"] == "UsernameExistsException":
-                final_response.mensaje = MessagesEnum.OPERATION_UNSUCCESSFULL.value
-                final_response.resultado = MessagesEnum.USERNAME_EXISTS.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "ExpiredCodeException":
-                final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
-                final_response.resultado = "El código de confirmación ha expirado. Se ha enviado un nuevo código a su correo electrónico."
-
-                process = self.cognito_repository.resend_confirmation(
-                    user=payload.user,
-                )
-
-                if process:
-                    return DevResponse(
-                        statusCode=status.HTTP_401_UNAUTHORIZED,
-                        result=final_response.__dict__,
-                    )
-
-            elif err.response["Error"]["Code"] == "CodeMismatchException":
-                final_response.mensaje = MessagesEnum.OPERATION_UNSUCCESSFULL.value
-                final_response.resultado = MessagesEnum.CODE_INVALID.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_401_UNAUTHORIZED,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "LimitExceededException":
-                final_response.mensaje = MessagesEnum.LIMIT_EXCEEDED.value
+            if err.response["Error"]["Code"] == "ExpiredCodeException":
+                return self.__resend_expired_code(payload, err, final_response)
 
-                return DevResponse(
-                    statusCode=status.HTTP_429_TOO_MANY_REQUESTS,
-                    result=final_response.__dict__,
-                )
+            return self.errors.response(err, final_response)
 
         final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
         final_response.resultado = try_signup
@@ -93,5 +84,31 @@ class ConfirmSignUpService:
 
         return DevResponse(
             statusCode=status.HTTP_200_OK,
-            result=final_response.__dict__,
+            result=final_response,
+        )
+
+    def __resend_expired_code(
+        self: Self,
+        payload: ConfirmSignUpRequest,
+        err: ClientError,
+        final_response: SignUpResponse,
+    ) -> DevResponse:
+        try:
+            process = self.cognito_repository.resend_confirmation(user=payload.user)
+        except ClientError as resend_err:
+            self.logger.error(
+                "Error resending the confirmation code",
+                extra={"error": str(resend_err)},
+            )
+            return self.errors.response(resend_err, final_response)
+
+        if not process:
+            return self.errors.response(err, final_response)
+
+        final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
+        final_response.resultado = "El código de confirmación ha expirado. Se ha enviado un nuevo código a su correo electrónico."
+
+        return DevResponse(
+            statusCode=status.HTTP_401_UNAUTHORIZED,
+            result=final_response,
         )
@@ -0,0 +1,134 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+Provider = Callable[["Container"], Any]
+
+
+@dataclass
+class _OverrideScope:
+    overrides: Dict[str, Any]
+    # Instancias construidas dentro del scope, con las overrides aplicadas
+    instances: Dict[str, Any] = field(default_factory=dict)
+
+
+_scope: ContextVar[Optional[_OverrideScope]] = ContextVar(
+    "container_override_scope", default=None
+)
+
+
+class Container:
+    """
+    Lazy dependency container that lives as long as the Lambda container.
+
+    Every registered provider is built once, on first resolve, and the instance
+    is shared by all following invocations. Overrides are stored in a context
+    variable so they only apply to the current request or test; inside an
+    override scope every other dependency is also built once, privately to
+    the scope, so stateful dependants (caches, breakers, limiters) keep their
+    state for the whole scope.
+    """
+
+    def __init__(self) -> None:
+        self._providers: Dict[str, Provider] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, provider: Provider) -> None:
+        """
+        Register a provider under a name.
+
+        Args:
+            name: Name used to resolve the dependency
+            provider: Callable receiving the container and returning the instance
+        """
+        with self._lock:
+            self._providers[name] = provider
+            self._instances.pop(name, None)
+
+    def resolve(self, name: str) -> Any:
+        """
+        Return the instance registered under ``name``, building it if needed.
+
+        Args:
+            name: Name of the dependency
+
+        Returns:
+            The overridden instance for the current context, or the shared one.
+        """
+        scope = _scope.get()
+        if scope is not None:
+            if name in scope.overrides:
+                return scope.overrides[name]
+
+            # Build a private graph so dependants pick up the overrides
+            # without leaking them into the shared instances.
+            if name in scope.instances:
+                return scope.instances[name]
+
+            with self._lock:
+                if name not in scope.instances:
+                    scope.instances[name] = self._build(name)
+
+                return scope.instances[name]
+
+        # Providers may legitimately build None (e.g. a disabled feature)
+        if name in self._instances:
+            return self._instances[name]
+
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = self._build(name)
+
+            return self._instances[name]
+
+    def warm_up(self, *names: str) -> None:
+        """
+        Build the given dependencies (or every registered one) ahead of time.
+
+        Args:
+            names: Names to build; all providers when empty
+        """
+        for name in names or tuple(self._providers):
+            self.resolve(name)
+
+    def is_built(self, name: str) -> bool:
+        """Tell whether the shared instance for ``name`` was already created."""
+        return name in self._instances
+
+    @contextmanager
+    def override(self, **instances: Any) -> Iterator["Container"]:
+        """
+        Temporarily replace dependencies for the current context.
+
+        Dependencies resolved inside the block are built at most once per
+        block; a nested override starts a new private graph.
+
+        Example:
+            with container.override(cognito_repository=FakeCognito()):
+                ...
+        """
+        current = _scope.get()
+        overrides = {**(current.overrides if current else {}), **instances}
+        token = _scope.set(_OverrideScope(overrides=overrides))
+        try:
+            yield self
+        finally:
+            _scope.reset(token)
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Forget one shared instance (or all of them) so it is rebuilt."""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    def _build(self, name: str) -> Any:
+        provider = self._providers.get(name)
+        if provider is None:
+            raise KeyError(f"No provider registered for {name}")
+
+        return provider(self)
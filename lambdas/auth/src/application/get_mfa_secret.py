@@ -1,22 +1,32 @@
-from typing import Self
+from typing import Optional, Self
 from botocore.exceptions import ClientError
 from fastapi import status
 
 from src.domain.models.mfa_secret import MFASecret, MFASecretResponse
 from src.domain.enums.messages import MessagesEnum
 from src.domain.repositories.cognito_repository import ICognitoRepository
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper
 from src.domain.models.dev_response import DevResponse
 from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.token_verifier import (
+    CognitoAccessTokenVerifier,
+    TokenVerificationError,
+)
 
 
-class GetMFASecretService:
+class GetMFASecretService(AsyncExecuteMixin):
     def __init__(
         self,
         logger: CustomLogger,
         cognito_repository: ICognitoRepository,
+        token_verifier: Optional[CognitoAccessTokenVerifier] = None,
+        error_mapper: Optional[CognitoErrorMapper] = None,
     ):
         self.logger = logger
         self.cognito_repository = cognito_repository
+        self.token_verifier = token_verifier
+        self.errors = error_mapper or CognitoErrorMapper()
 
     def execute(self: Self, access_token: str) -> DevResponse:
         """
@@ -38,51 +48,39 @@ class GetMFASecretService:
 
                 return DevResponse(
                     statusCode=status.HTTP_401_UNAUTHORIZED,
-                    result=final_response.__dict__,
+                    result=final_response,
                 )
 
             bearer_token = access_token.split("Bearer ")[1]
 
+            # Rechazo local de tokens inválidos o expirados, sin llamar a Cognito
+            if self.token_verifier is not None:
+                try:
+                    self.token_verifier.verify(bearer_token)
+                except TokenVerificationError as err:
+                    self.logger.info(
+                        "Access token rejected", extra={"reason": str(err)}
+                    )
+                    final_response.mensaje = (
+                        MessagesEnum.SESSION_INVALID_OR_EXPIRED.value
+                    )
+
+                    return DevResponse(
+                        statusCode=status.HTTP_400_BAD_REQUEST,
+                        result=final_response,
+                    )
+
             get_mfa_secret = self.cognito_repository.get_mfa_secret(bearer_token)
 
             final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
-            final_response.resultado = MFASecret(secret=get_mfa_secret).__dict__
+            final_response.resultado = MFASecret(secret=get_mfa_secret)
 
             return DevResponse(
                 statusCode=status.HTTP_200_OK,
-                result=final_response.__dict__,
+                result=final_response,
             )
 
         except ClientError as err:
             self.logger.error("error", extra={"error": err})
 
-            if err.response["Error"]["Code"] == "CodeMismatchException":
-                final_response.mensaje = MessagesEnum.CODE_INVALID.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "InvalidParameterException":
-                final_response.mensaje = MessagesEnum.PAYLOAD_ERROR.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "NotAuthorizedException":
-                final_response.mensaje = MessagesEnum.SESSION_INVALID_OR_EXPIRED.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            final_response.mensaje = MessagesEnum.INTERNAL_SERVER_ERROR.value
-
-            return DevResponse(
-                statusCode=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                result=final_response.__dict__,
-            )
+            return self.errors.response(err, final_response)
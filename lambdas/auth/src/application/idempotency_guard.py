@@ -0,0 +1,101 @@
+import hashlib
+from typing import Mapping, Optional, Self
+
+from src.domain.models.idempotency import IdempotencyRecord, StoredResponse
+from src.domain.repositories.idempotency_repository import IIdempotencyRepository
+from src.infrastructure.utils.logger import CustomLogger
+
+
+class IdempotencyGuard:
+    """
+    Replays the first response of a request retried with the same
+    Idempotency-Key instead of calling Cognito again.
+
+    Keys are scoped to the endpoint and the caller's Authorization header, so
+    a key (or a leaked one) never replays someone else's response; the store
+    only sees hashes of the keys and bodies of the requests. Only successful
+    (2xx) responses are kept: errors run again on the next retry, and
+    validation errors, which echo the request input (passwords included),
+    never reach the store.
+    """
+
+    def __init__(
+        self: Self,
+        repository: IIdempotencyRepository,
+        logger: CustomLogger,
+        ttl_seconds: float = 3600,
+        lock_seconds: float = 30,
+        path_ttl_seconds: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Initialize the guard.
+
+        Args:
+            repository: Store holding the records
+            logger: Logger object
+            ttl_seconds: Time a response is replayed
+            lock_seconds: Time a key stays claimed by a request that never
+                finished (should exceed the API Gateway timeout)
+            path_ttl_seconds: ``ttl_seconds`` of specific paths, e.g. shorter
+                for responses carrying secrets
+        """
+        self.repository = repository
+        self.logger = logger
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.path_ttl_seconds = dict(path_ttl_seconds or {})
+
+    @staticmethod
+    def key(
+        method: str, path: str, idempotency_key: str, authorization: Optional[str]
+    ) -> str:
+        """Store key of an Idempotency-Key sent to ``method path``."""
+        scope = "\n".join((method, path, authorization or "", idempotency_key))
+        return hashlib.sha256(scope.encode()).hexdigest()
+
+    @staticmethod
+    def fingerprint(body: bytes) -> str:
+        """Hash of the request body, to detect a key reused for another request."""
+        return hashlib.sha256(body).hexdigest()
+
+    def begin(self: Self, key: str, fingerprint: str) -> Optional[IdempotencyRecord]:
+        """
+        Claim ``key`` for the current request.
+
+        Args:
+            key: Store key from ``key()``
+            fingerprint: Hash of the request body
+
+        Returns:
+            None when the request must run, otherwise the record of the first
+            request (in progress or completed).
+        """
+        return self.repository.claim(key, fingerprint, self.lock_seconds)
+
+    def finish(
+        self: Self,
+        key: str,
+        fingerprint: str,
+        response: Optional[StoredResponse],
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Keep the response of a claimed key, or release the key when there is
+        no response (the request failed) or it was not successful.
+
+        Args:
+            key: Store key from ``key()``
+            fingerprint: Hash of the request body
+            response: Response of the request, None if it did not finish
+            path: Path of the request, to pick its TTL
+        """
+        if response is None or not 200 <= response.status_code < 300:
+            self.repository.release(key)
+            return
+
+        self.repository.complete(
+            key,
+            fingerprint,
+            response,
+            self.path_ttl_seconds.get(path, self.ttl_seconds),
+        )
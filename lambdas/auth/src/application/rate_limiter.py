@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Optional, Self
+
+from src.domain.models.rate_limit import RateLimitDecision, TokenBucketPolicy
+from src.domain.repositories.rate_limit_repository import IRateLimitRepository
+from src.infrastructure.utils.logger import CustomLogger
+
+
+@dataclass(frozen=True)
+class RateLimitRules:
+    user: TokenBucketPolicy
+    source_ip: TokenBucketPolicy
+    # Tokens extra que cuesta un intento fallido (credenciales o código inválido)
+    failure_cost: float = 1
+
+
+class RateLimiter:
+    """
+    Adaptive per-user and per-source-IP limiter for the authentication endpoints.
+
+    Every attempt takes one token from the bucket of the source IP and one from
+    the bucket of the user; failed attempts take ``failure_cost`` more, so
+    guessing burns through the budget faster than normal use. Buckets are per
+    endpoint scope, so resending codes does not lock a user out of signing in.
+    """
+
+    def __init__(
+        self: Self,
+        repository: IRateLimitRepository,
+        logger: CustomLogger,
+        rules: RateLimitRules,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            repository: Store holding the token buckets
+            logger: Logger object
+            rules: Bucket policies and failure cost
+        """
+        self.repository = repository
+        self.logger = logger
+        self.rules = rules
+
+    def check(
+        self: Self, scope: str, user: Optional[str], source_ip: Optional[str]
+    ) -> RateLimitDecision:
+        """
+        Take one token for an attempt before it reaches Cognito.
+
+        Args:
+            scope: Endpoint the attempt is for
+            user: Username of the attempt, when the payload has one
+            source_ip: Client address
+
+        Returns:
+            The most restrictive decision of the IP and user buckets.
+        """
+        decision = RateLimitDecision(allowed=True, remaining=self.rules.user.capacity)
+
+        if source_ip:
+            decision = self.repository.consume(
+                self._key(scope, "ip", source_ip), self.rules.source_ip
+            )
+            if not decision.allowed:
+                return decision
+
+        if user:
+            decision = self.repository.consume(
+                self._key(scope, "user", user), self.rules.user
+            )
+
+        return decision
+
+    def record_failure(
+        self: Self, scope: str, user: Optional[str], source_ip: Optional[str]
+    ) -> None:
+        """Charge the extra cost of a failed attempt to its IP and user buckets."""
+        if self.rules.failure_cost <= 0:
+            return
+
+        if source_ip:
+            self.repository.consume(
+                self._key(scope, "ip", source_ip),
+                self.rules.source_ip,
+                cost=self.rules.failure_cost,
+                force=True,
+            )
+        if user:
+            self.repository.consume(
+                self._key(scope, "user", user),
+                self.rules.user,
+                cost=self.rules.failure_cost,
+                force=True,
+            )
+
+    @staticmethod
+    def _key(scope: str, kind: str, value: str) -> str:
+        return f"{scope}#{kind}#{value.strip().lower()}"
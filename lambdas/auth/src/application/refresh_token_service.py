@@ -0,0 +1,127 @@
+import hashlib
+from typing import Optional, Self
+
+from botocore.exceptions import ClientError
+from fastapi import status
+
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper, CognitoErrorRule
+from src.domain.enums.messages import MessagesEnum
+from src.domain.models.dev_response import DevResponse
+from src.domain.models.sign_in import (
+    RefreshTokenRequest,
+    SignInResponse,
+    SignInResult,
+)
+from src.domain.repositories.cognito_repository import ICognitoRepository
+from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.single_flight import SingleFlight
+from src.infrastructure.utils.ttl_cache import TTLCache
+
+REFRESH_TOKEN_ERRORS = {
+    "NotAuthorizedException": CognitoErrorRule(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        message=MessagesEnum.REFRESH_TOKEN_INVALID,
+    ),
+}
+
+
+class RefreshTokenService(AsyncExecuteMixin):
+    """
+    Exchanges a refresh token for new access and id tokens.
+
+    Concurrent refreshes with the same token share one Cognito call, and a
+    successful result is reused for ``cache_ttl_seconds`` so a burst of
+    parallel refreshes from one client costs a single InitiateAuth. Entries
+    are keyed by a SHA-256 of the token, never by the token itself.
+    """
+
+    def __init__(
+        self: Self,
+        logger: CustomLogger,
+        cognito_repository: ICognitoRepository,
+        cache_ttl_seconds: float = 10,
+        cache_max_size: int = 1000,
+        error_mapper: Optional[CognitoErrorMapper] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            logger: Logger object
+            cognito_repository: Cognito repository
+            cache_ttl_seconds: Time a refreshed result is reused, 0 to disable
+            cache_max_size: Results kept at most
+            error_mapper: Shared Cognito error table
+        """
+        self.logger = logger
+        self.cognito_repository = cognito_repository
+        self.errors = (error_mapper or CognitoErrorMapper()).with_overrides(
+            REFRESH_TOKEN_ERRORS
+        )
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache: Optional[TTLCache[str, DevResponse]] = (
+            TTLCache(ttl_seconds=cache_ttl_seconds, max_size=cache_max_size)
+            if cache_ttl_seconds > 0
+            else None
+        )
+        self._single_flight: SingleFlight[DevResponse] = SingleFlight()
+
+    def execute(self: Self, payload: RefreshTokenRequest) -> DevResponse:
+        """
+        Refresh the tokens of a user.
+
+        Args:
+            payload: RefreshTokenRequest
+
+        Returns:
+            The new tokens in the SignInResponse shape.
+        """
+        key = self.__cache_key(payload)
+
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.logger.debug("Refresh answered from cache")
+                return cached
+
+        response, shared = self._single_flight.do(key, lambda: self.__refresh(payload))
+        if shared:
+            self.logger.debug("Refresh shared with a concurrent request")
+        elif self._cache is not None and response.statusCode == status.HTTP_200_OK:
+            self._cache.set(key, response)
+
+        return response
+
+    def __refresh(self: Self, payload: RefreshTokenRequest) -> DevResponse:
+        final_response = SignInResponse(
+            mensaje=MessagesEnum.OPERATION_UNSUCCESSFULL.value
+        )
+
+        try:
+            refreshed = self.cognito_repository.refresh_tokens(
+                refresh_token=payload.refresh_token, username=payload.user
+            )
+        except ClientError as err:
+            self.logger.error(
+                "Refresh token failed",
+                extra={"error": err.response["Error"]["Code"]},
+            )
+
+            return self.errors.response(err, final_response)
+
+        final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
+        final_response.resultado = SignInResult(
+            challege_parameters=refreshed.get("ChallengeParameters"),
+            authentication_result=refreshed.get("AuthenticationResult"),
+            retry_attempts=int(
+                refreshed.get("ChallengeParameters", {}).get("RetryAttempts", 0)
+            ),
+        )
+
+        return DevResponse(statusCode=status.HTTP_200_OK, result=final_response)
+
+    @staticmethod
+    def __cache_key(payload: RefreshTokenRequest) -> str:
+        material = f"{payload.user or ''}\n{payload.refresh_token}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
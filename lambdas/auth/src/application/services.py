@@ -1,10 +1,25 @@
+import hmac
 import os
-import boto3
+from typing import Optional
 
+from fastapi import Header, HTTPException, status
+
+from src.application.config_provider import ConfigProvider
+from src.application.container import Container
 from src.application.resend_mfa import ResendMFAService
 from src.application.confirm_mfa import ConfirmMFAService
 from src.application.get_mfa_secret import GetMFASecretService
 from src.application.confirm_sign_up_service import ConfirmSignUpService
+from src.application.cognito_error_mapper import CognitoErrorMapper, default_rules
+from src.application.bulk_sign_up_service import BulkSignUpService
+from src.application.idempotency_guard import IdempotencyGuard
+from src.application.rate_limiter import RateLimiter, RateLimitRules
+from src.application.refresh_token_service import RefreshTokenService
+from src.application.user_status_cache import UserStatusCache
+from src.domain.enums.paths_enum import PathsEnum
+from src.domain.models.rate_limit import TokenBucketPolicy
+from src.domain.repositories.idempotency_repository import IIdempotencyRepository
+from src.domain.repositories.rate_limit_repository import IRateLimitRepository
 from src.domain.repositories.secrets_manager_repository import (
     ISecretsManagerRepository,
 )
@@ -13,86 +28,529 @@ from src.application.sign_in_service import SignInService
 from src.application.sign_up_service import SignUpService
 from src.domain.repositories.cognito_repository import ICognitoRepository
 from src.domain.models.sm_lambda_auth_cognito import SmLambdaAuthCognito
+from src.infrastructure.utils.aws_clients import (
+    create_boto3_client,
+    prime_connections,
+)
+from src.infrastructure.utils.client_ip import ClientIpResolver
 from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.metrics import MetricsEmitter
+from src.infrastructure.utils.secret_decoders import SecretDecoders
+from src.infrastructure.utils.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    ResilientCaller,
+    RetryPolicy,
+)
+from src.infrastructure.utils.token_verifier import CognitoAccessTokenVerifier
 from src.infrastructure.repositories.cognito_repository_impl import (
     CognitoRepositoryImpl,
 )
 from src.infrastructure.repositories.secrets_manager_repository_impl import (
     SecretsManagerRepositoryImpl,
 )
-
+from src.infrastructure.repositories.secret_sources import (
+    EXTENSION_DEFAULT_PORT,
+    ExtensionSecretSource,
+    LocalFileSecretSource,
+    SdkSecretSource,
+    SecretSource,
+)
+from src.infrastructure.repositories.cached_secrets_manager_repository_impl import (
+    CachedSecretsManagerRepositoryImpl,
+)
+from src.infrastructure.repositories.dynamodb_idempotency_repository_impl import (
+    DynamoDBIdempotencyRepositoryImpl,
+)
+from src.infrastructure.repositories.in_memory_idempotency_repository_impl import (
+    InMemoryIdempotencyRepositoryImpl,
+)
+from src.infrastructure.repositories.dynamodb_rate_limit_repository_impl import (
+    DynamoDBRateLimitRepositoryImpl,
+)
+from src.infrastructure.repositories.in_memory_rate_limit_repository_impl import (
+    InMemoryRateLimitRepositoryImpl,
+)
 
 region = os.getenv("REGION")
 sm_lambda_auth_cognito_secretname = os.getenv("SMLAMBDAAUTHORIZERCOGNITO")
 
 
-def create_boto3_client(service_name: str, region: str):
-    return boto3.Session().client(service_name, region_name=region)
+# Contenedor de dependencias: cada instancia se crea una sola vez por
+# contenedor de Lambda (en el primer uso) y se comparte entre invocaciones.
+container = Container()
 
 
-sm_client = create_boto3_client("secretsmanager", region)
-cognito_client = create_boto3_client("cognito-idp", region)
+############ CLIENTS ############
+container.register("sm_client", lambda c: create_boto3_client("secretsmanager", region))
+container.register(
+    "cognito_client", lambda c: create_boto3_client("cognito-idp", region)
+)
 
 
 ############ REPOSITORIES ############
-def get_logger() -> CustomLogger:
-    level_log = os.getenv("LOGLEVEL", "INFO")
-    return CustomLogger(level_log=level_log)
+container.register(
+    "logger",
+    lambda c: CustomLogger(
+        logger_name="auth",
+        level_log=os.getenv("LOG_LEVEL", os.getenv("LOGLEVEL", "INFO")),
+    ),
+)
 
+container.register("metrics", lambda c: MetricsEmitter.from_env())
 
-def get_sm_repository() -> ISecretsManagerRepository:
-    return SecretsManagerRepositoryImpl(
-        sm_client=sm_client, secret_type=SmLambdaAuthCognito
+
+def _secret_decoders(c: Container) -> SecretDecoders:
+    # Esquema de cada secreto: los decoders se compilan una sola vez aquí
+    decoders = SecretDecoders(default_type=dict)
+    decoders.register(
+        sm_lambda_auth_cognito_secretname,
+        SmLambdaAuthCognito,
+        env_prefix="COGNITO_CONFIG_",
     )
+    return decoders
 
 
-def cognito_repository() -> ICognitoRepository:
-    sm_repository = get_sm_repository()
-    sm_lambda_auth_cognito_value = sm_repository.get_secret(
-        secret_name=sm_lambda_auth_cognito_secretname
+def _secret_source(c: Container) -> SecretSource:
+    local_file = os.getenv("SECRETS_LOCAL_FILE")
+    source = os.getenv("SECRETS_SOURCE", "file" if local_file else "sdk").lower()
+
+    if source == "file":
+        return LocalFileSecretSource(path=local_file)
+
+    if source == "extension":
+        return ExtensionSecretSource(
+            # El cliente de boto3 solo se crea si la extensión no responde
+            fallback=lambda: SdkSecretSource(sm_client=c.resolve("sm_client")),
+            logger=c.resolve("logger"),
+            port=int(
+                os.getenv(
+                    "PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", EXTENSION_DEFAULT_PORT
+                )
+            ),
+            timeout=float(os.getenv("SECRETS_EXTENSION_TIMEOUT_MS", "1000")) / 1000,
+        )
+
+    return SdkSecretSource(sm_client=c.resolve("sm_client"))
+
+
+container.register("secret_decoders", _secret_decoders)
+container.register("secret_source", _secret_source)
+
+
+# Cache compartido por el contenedor de Lambda: las invocaciones en caliente
+# solo consultan Secrets Manager una vez por TTL.
+container.register(
+    "sm_repository",
+    lambda c: CachedSecretsManagerRepositoryImpl(
+        sm_repository=SecretsManagerRepositoryImpl(
+            source=c.resolve("secret_source"), decoders=c.resolve("secret_decoders")
+        ),
+        logger=c.resolve("logger"),
+        ttl_seconds=float(os.getenv("SECRET_CACHE_TTL_SECONDS", "300")),
+        refresh_ahead_seconds=float(
+            os.getenv("SECRET_CACHE_REFRESH_AHEAD_SECONDS", "30")
+        ),
+        max_stale_seconds=float(os.getenv("SECRET_CACHE_MAX_STALE_SECONDS", "3600")),
+        default_version_stage=os.getenv("SECRET_VERSION_STAGE", "AWSCURRENT"),
+    ),
+)
+
+
+# Todos los secretos registrados se cargan juntos (un solo round trip en frío)
+container.register(
+    "config_provider",
+    lambda c: ConfigProvider(
+        sm_repository=c.resolve("sm_repository"),
+        secret_names=c.resolve("secret_decoders").names(),
+    ),
+)
+
+
+def _cognito_configs_provider(c: Container):
+    config_provider = c.resolve("config_provider")
+
+    def get_cognito_configs() -> SmLambdaAuthCognito:
+        return config_provider.snapshot().get(sm_lambda_auth_cognito_secretname)
+
+    return get_cognito_configs
+
+
+container.register("cognito_configs_provider", _cognito_configs_provider)
+
+
+def _cognito_circuit_breaker(c: Container) -> Optional[CircuitBreaker]:
+    if os.getenv("COGNITO_BREAKER_ENABLED", "true").lower() != "true":
+        return None
+
+    logger = c.resolve("logger")
+    metrics = c.resolve("metrics")
+
+    def on_state_change(name: str, state: CircuitState) -> None:
+        logger.warning(
+            "Circuit breaker state changed",
+            extra={"breaker": name, "state": state.name},
+        )
+        metrics.emit(
+            metrics={"CircuitBreakerState": state.value},
+            dimensions={"Breaker": name},
+            units={"CircuitBreakerState": "None"},
+        )
+
+    return CircuitBreaker(
+        name="cognito",
+        failure_threshold=float(os.getenv("COGNITO_BREAKER_FAILURE_THRESHOLD", "0.5")),
+        minimum_calls=int(os.getenv("COGNITO_BREAKER_MINIMUM_CALLS", "20")),
+        window_seconds=float(os.getenv("COGNITO_BREAKER_WINDOW_SECONDS", "30")),
+        open_seconds=float(os.getenv("COGNITO_BREAKER_OPEN_SECONDS", "30")),
+        on_state_change=on_state_change,
+    )
+
+
+container.register("cognito_circuit_breaker", _cognito_circuit_breaker)
+container.register(
+    "cognito_resilient_caller",
+    lambda c: ResilientCaller(
+        retry_policy=RetryPolicy(
+            max_attempts=int(os.getenv("COGNITO_RETRY_MAX_ATTEMPTS", "3")),
+            base_delay=float(os.getenv("COGNITO_RETRY_BASE_DELAY_MS", "50")) / 1000,
+            max_delay=float(os.getenv("COGNITO_RETRY_MAX_DELAY_MS", "1000")) / 1000,
+            min_remaining_ms=float(os.getenv("COGNITO_RETRY_MIN_REMAINING_MS", "1500")),
+        ),
+        circuit_breaker=c.resolve("cognito_circuit_breaker"),
+    ),
+)
+container.register(
+    "cognito_repository",
+    lambda c: CognitoRepositoryImpl(
+        logger=c.resolve("logger"),
+        cognito_client=c.resolve("cognito_client"),
+        cognito_configs_provider=c.resolve("cognito_configs_provider"),
+        resilient_caller=c.resolve("cognito_resilient_caller"),
+        secret_hash_cache_size=int(os.getenv("SECRET_HASH_CACHE_SIZE", "1024")),
+    ),
+)
+
+
+def _token_verifier(c: Container) -> Optional[CognitoAccessTokenVerifier]:
+    if os.getenv("TOKEN_VERIFICATION_ENABLED", "true").lower() != "true":
+        return None
+
+    return CognitoAccessTokenVerifier(
+        logger=c.resolve("logger"),
+        cognito_configs_provider=c.resolve("cognito_configs_provider"),
+        jwks_ttl_seconds=float(os.getenv("JWKS_CACHE_TTL_SECONDS", "3600")),
+        jwks_min_refresh_seconds=float(os.getenv("JWKS_MIN_REFRESH_SECONDS", "60")),
+    )
+
+
+container.register("token_verifier", _token_verifier)
+
+
+def _rate_limit_repository(c: Container) -> IRateLimitRepository:
+    if os.getenv("RATE_LIMIT_BACKEND", "memory").lower() == "dynamodb":
+        # El cliente se crea aquí y no como dependencia propia para no
+        # construirlo en warm_up cuando el backend es en memoria.
+        return DynamoDBRateLimitRepositoryImpl(
+            dynamodb_client=create_boto3_client("dynamodb", region),
+            table_name=os.environ["RATE_LIMIT_TABLE"],
+        )
+
+    return InMemoryRateLimitRepositoryImpl(
+        max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "10000"))
+    )
+
+
+def _rate_limiter(c: Container) -> Optional[RateLimiter]:
+    if os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "true":
+        return None
+
+    return RateLimiter(
+        repository=c.resolve("rate_limit_repository"),
+        logger=c.resolve("logger"),
+        rules=RateLimitRules(
+            user=TokenBucketPolicy(
+                capacity=float(os.getenv("RATE_LIMIT_USER_CAPACITY", "5")),
+                refill_per_second=float(
+                    os.getenv("RATE_LIMIT_USER_REFILL_PER_MINUTE", "5")
+                )
+                / 60,
+            ),
+            source_ip=TokenBucketPolicy(
+                capacity=float(os.getenv("RATE_LIMIT_IP_CAPACITY", "20")),
+                refill_per_second=float(
+                    os.getenv("RATE_LIMIT_IP_REFILL_PER_MINUTE", "60")
+                )
+                / 60,
+            ),
+            failure_cost=float(os.getenv("RATE_LIMIT_FAILURE_COST", "1")),
+        ),
+    )
+
+
+container.register("rate_limit_repository", _rate_limit_repository)
+container.register("rate_limiter", _rate_limiter)
+container.register(
+    "client_ip_resolver",
+    lambda c: ClientIpResolver(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")),
+)
+
+
+def _idempotency_repository(c: Container) -> IIdempotencyRepository:
+    if os.getenv("IDEMPOTENCY_BACKEND", "memory").lower() == "dynamodb":
+        return DynamoDBIdempotencyRepositoryImpl(
+            dynamodb_client=create_boto3_client("dynamodb", region),
+            table_name=os.environ["IDEMPOTENCY_TABLE"],
+        )
+
+    return InMemoryIdempotencyRepositoryImpl(
+        max_keys=int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+    )
+
+
+def _idempotency_guard(c: Container) -> Optional[IdempotencyGuard]:
+    if os.getenv("IDEMPOTENCY_ENABLED", "true").lower() != "true":
+        return None
+
+    return IdempotencyGuard(
+        repository=c.resolve("idempotency_repository"),
+        logger=c.resolve("logger"),
+        ttl_seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "3600")),
+        lock_seconds=float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "30")),
+        # La respuesta lleva el secreto TOTP: se guarda solo unos minutos
+        path_ttl_seconds={
+            PathsEnum.mfa_code.value: float(
+                os.getenv("IDEMPOTENCY_MFA_CODE_TTL_SECONDS", "300")
+            )
+        },
     )
 
-    return CognitoRepositoryImpl(
-        logger=get_logger(),
-        cognito_client=cognito_client,
-        cognito_configs=sm_lambda_auth_cognito_value,
+
+container.register("idempotency_repository", _idempotency_repository)
+container.register("idempotency_guard", _idempotency_guard)
+
+
+def _user_status_cache(c: Container) -> Optional[UserStatusCache]:
+    ttl_seconds = float(os.getenv("SIGNIN_NEGATIVE_CACHE_TTL_SECONDS", "30"))
+    if ttl_seconds <= 0:
+        return None
+
+    return UserStatusCache(
+        ttl_seconds=ttl_seconds,
+        unconfirmed_ttl_seconds=float(
+            os.getenv("SIGNIN_UNCONFIRMED_CACHE_TTL_SECONDS", "5")
+        ),
+        max_size=int(os.getenv("SIGNIN_NEGATIVE_CACHE_MAX_SIZE", "10000")),
     )
 
 
+container.register("user_status_cache", _user_status_cache)
+container.register(
+    "cognito_error_mapper",
+    lambda c: CognitoErrorMapper(
+        rules=default_rules(
+            throttle_retry_after_seconds=int(
+                os.getenv("COGNITO_THROTTLE_RETRY_AFTER_SECONDS", "1")
+            )
+        ),
+        metrics=c.resolve("metrics"),
+    ),
+)
+
+
 ############ SERVICES ############
+container.register(
+    "signin_service",
+    lambda c: SignInService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        user_status_cache=c.resolve("user_status_cache"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "refresh_token_service",
+    lambda c: RefreshTokenService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        cache_ttl_seconds=float(os.getenv("REFRESH_TOKEN_CACHE_TTL_SECONDS", "10")),
+        cache_max_size=int(os.getenv("REFRESH_TOKEN_CACHE_MAX_SIZE", "1000")),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "verify_mfa_service",
+    lambda c: VerifyMFATokenService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "signup_service",
+    lambda c: SignUpService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        user_status_cache=c.resolve("user_status_cache"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+
+
+def _bulk_signup_service(c: Container) -> Optional[BulkSignUpService]:
+    if os.getenv("BULK_SIGNUP_ENABLED", "false").lower() != "true":
+        return None
+
+    return BulkSignUpService(
+        logger=c.resolve("logger"),
+        signup_service=c.resolve("signup_service"),
+        max_concurrency=int(os.getenv("BULK_SIGNUP_MAX_CONCURRENCY", "5")),
+        rate_per_second=float(os.getenv("BULK_SIGNUP_RATE_PER_SECOND", "10")),
+        max_rows=int(os.getenv("BULK_SIGNUP_MAX_ROWS", "200")),
+    )
+
+
+container.register("bulk_signup_service", _bulk_signup_service)
+container.register(
+    "confirm_signup_service",
+    lambda c: ConfirmSignUpService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        user_status_cache=c.resolve("user_status_cache"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "mfa_secret_service",
+    lambda c: GetMFASecretService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        token_verifier=c.resolve("token_verifier"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "confirm_mfa_service",
+    lambda c: ConfirmMFAService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        token_verifier=c.resolve("token_verifier"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+container.register(
+    "resend_mfa_service",
+    lambda c: ResendMFAService(
+        logger=c.resolve("logger"),
+        cognito_repository=c.resolve("cognito_repository"),
+        user_status_cache=c.resolve("user_status_cache"),
+        error_mapper=c.resolve("cognito_error_mapper"),
+    ),
+)
+
+
+############ FASTAPI DEPENDENCIES ############
+def get_logger() -> CustomLogger:
+    return container.resolve("logger")
+
+
+def get_metrics() -> MetricsEmitter:
+    return container.resolve("metrics")
+
+
+def get_sm_repository() -> ISecretsManagerRepository:
+    return container.resolve("sm_repository")
+
+
+def cognito_repository() -> ICognitoRepository:
+    return container.resolve("cognito_repository")
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    return container.resolve("rate_limiter")
+
+
+def get_client_ip_resolver() -> ClientIpResolver:
+    return container.resolve("client_ip_resolver")
+
+
+def get_idempotency_guard() -> Optional[IdempotencyGuard]:
+    return container.resolve("idempotency_guard")
+
+
 def get_signin_service() -> SignInService:
-    return SignInService(logger=get_logger(), cognito_repository=cognito_repository())
+    return container.resolve("signin_service")
+
+
+def get_refresh_token_service() -> RefreshTokenService:
+    return container.resolve("refresh_token_service")
 
 
 def get_verify_mfa_service() -> VerifyMFATokenService:
-    return VerifyMFATokenService(
-        logger=get_logger(), cognito_repository=cognito_repository()
-    )
+    return container.resolve("verify_mfa_service")
 
 
 def get_signup_service() -> SignUpService:
-    return SignUpService(logger=get_logger(), cognito_repository=cognito_repository())
+    return container.resolve("signup_service")
+
+
+def get_bulk_signup_service(
+    x_api_key: Optional[str] = Header(default=None),
+) -> BulkSignUpService:
+    bulk_signup_service = container.resolve("bulk_signup_service")
+    if bulk_signup_service is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    # Sin BULK_SIGNUP_API_KEY configurada el endpoint rechaza todo
+    api_key = os.getenv("BULK_SIGNUP_API_KEY", "")
+    if not api_key or not hmac.compare_digest(
+        (x_api_key or "").encode(), api_key.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return bulk_signup_service
 
 
 def get_confirm_signup_service() -> ConfirmSignUpService:
-    return ConfirmSignUpService(
-        logger=get_logger(), cognito_repository=cognito_repository()
-    )
+    return container.resolve("confirm_signup_service")
 
 
 def get_mfa_secret_service() -> GetMFASecretService:
-    return GetMFASecretService(
-        logger=get_logger(), cognito_repository=cognito_repository()
-    )
+    return container.resolve("mfa_secret_service")
 
 
 def confirm_mfa_service() -> ConfirmMFAService:
-    return ConfirmMFAService(
-        logger=get_logger(), cognito_repository=cognito_repository()
-    )
+    return container.resolve("confirm_mfa_service")
 
 
 def get_resend_mfa_service() -> ResendMFAService:
-    return ResendMFAService(
-        logger=get_logger(), cognito_repository=cognito_repository()
-    )
+    return container.resolve("resend_mfa_service")
+
+
+def warm_up(connections: int = 0) -> None:
+    """
+    Create every client, repository and service, load the configured secrets and
+    download the JWKS used to verify access tokens.
+
+    Runs during the Lambda init phase (WARM_UP_ON_INIT=true) and on keep-warm
+    events, so the first request does not pay for it.
+
+    Args:
+        connections: Cognito connections to open in parallel to fill the pool
+    """
+    container.warm_up()
+    container.resolve("config_provider").snapshot()
+
+    token_verifier = container.resolve("token_verifier")
+    if token_verifier is not None:
+        token_verifier.warm_up()
+
+    if connections > 0:
+        cognito_client = container.resolve("cognito_client")
+        # GetUser con un token inválido es rechazado sin efectos secundarios ni
+        # permisos IAM, pero deja la conexión TLS abierta en el pool.
+        prime_connections(
+            cognito_client,
+            connections,
+            lambda: cognito_client.get_user(AccessToken="warm-up"),
+        )
@@ -11,19 +11,41 @@ from src.domain.models.sign_in import (
 )
 from src.domain.repositories.cognito_repository import ICognitoRepository
 from src.domain.models.cognito import CognitoInitiateAuth, CognitoInitiateAuthMFA
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper, CognitoErrorRule
+from src.application.user_status_cache import UserStatusCache
 from src.domain.models.dev_response import DevResponse
 from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.resilience import CircuitOpenError
 from src.domain.enums.messages import MessagesEnum
 
+# Password incorrecto y usuario inexistente responden igual, sin revelar cuál
+SIGN_IN_ERRORS = {
+    "NotAuthorizedException": CognitoErrorRule(
+        status_code=status.HTTP_404_NOT_FOUND,
+        message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+    ),
+    "PasswordResetRequiredException": CognitoErrorRule(
+        status_code=status.HTTP_404_NOT_FOUND,
+        message=MessagesEnum.OPERATION_UNSUCCESSFULL,
+    ),
+}
 
-class SignInService:
+
+class SignInService(AsyncExecuteMixin):
     def __init__(
         self: Self,
         logger: CustomLogger,
         cognito_repository: ICognitoRepository,
+        user_status_cache: Optional[UserStatusCache] = None,
+        error_mapper: Optional[CognitoErrorMapper] = None,
     ):
         self.logger = logger
         self.cognito_repository = cognito_repository
+        self.user_status_cache = user_status_cache
+        self.errors = (error_mapper or CognitoErrorMapper()).with_overrides(
+            SIGN_IN_ERRORS
+        )
 
     def execute(self: Self, payload: SignInRequest) -> DevResponse:
         """
@@ -39,6 +61,15 @@ class SignInService:
             mensaje=MessagesEnum.OPERATION_UNSUCCESSFULL.value, resultado=None
         )
 
+        if self.user_status_cache is not None:
+            cached_error = self.user_status_cache.get(payload.user)
+            if cached_error is not None:
+                self.logger.info(
+                    "Sign in answered from user status cache",
+                    extra={"error_code": cached_error},
+                )
+                return self.errors.rule(cached_error).response(final_response)
+
         try:
             try_sign_in = self.cognito_repository.signin_with_email(
                 payload.user, payload.password
@@ -46,26 +77,25 @@ class SignInService:
 
             final_response = self.__format_response(try_sign_in)
 
-            return DevResponse(
-                statusCode=status.HTTP_200_OK, result=final_response.__dict__
-            )
+            return DevResponse(statusCode=status.HTTP_200_OK, result=final_response)
 
         except ClientError as e:
             self.logger.error(f"An error occurred: {e}")
 
-            if e.response["Error"]["Code"] == "UserNotConfirmedException":
-                final_response.mensaje = MessagesEnum.USER_NOT_CONFIRMED.value
+            error_code = e.response["Error"]["Code"]
+            if self.user_status_cache is not None:
+                self.user_status_cache.remember(payload.user, error_code)
 
-            return DevResponse(
-                statusCode=status.HTTP_404_NOT_FOUND,
-                result=final_response.__dict__,
-            )
+            return self.errors.response(e, final_response)
+
+        except CircuitOpenError:
+            raise
 
         except Exception as err:
             self.logger.error(err)
 
             return DevResponse(
-                statusCode=status.HTTP_409_CONFLICT, result=final_response.__dict__
+                statusCode=status.HTTP_409_CONFLICT, result=final_response
             )
 
     def __format_response(
@@ -1,21 +1,30 @@
-from typing import Self
+from typing import Optional, Self
 from fastapi import status
 
+from botocore.exceptions import ClientError
+
 from src.domain.enums.messages import MessagesEnum
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper
+from src.application.user_status_cache import UserStatusCache
 from src.domain.models.dev_response import DevResponse
 from src.domain.models.sign_up import SignUpRequest, SignUpResponse
 from src.domain.repositories.cognito_repository import ICognitoRepository
 from src.infrastructure.utils.logger import CustomLogger
 
 
-class SignUpService:
+class SignUpService(AsyncExecuteMixin):
     def __init__(
         self: Self,
         logger: CustomLogger,
         cognito_repository: ICognitoRepository,
+        user_status_cache: Optional[UserStatusCache] = None,
+        error_mapper: Optional[CognitoErrorMapper] = None,
     ):
         self.logger = logger
         self.cognito_repository = cognito_repository
+        self.user_status_cache = user_status_cache
+        self.errors = error_mapper or CognitoErrorMapper()
 
     def execute(self: Self, payload: SignUpRequest) -> DevResponse:
         """
@@ -39,22 +48,19 @@ class SignUpService:
                 password=payload.password,
                 name=payload.name,
             )
-        except Exception as err:
+        except ClientError as err:
             self.logger.error("Error in sign up service", extra={"error": str(err)})
 
-            if err.response["Error"]["Code"] == "UsernameExistsException":
-                final_response.mensaje = MessagesEnum.OPERATION_UNSUCCESSFULL.value
-                final_response.resultado = MessagesEnum.USERNAME_EXISTS.value
+            return self.errors.response(err, final_response)
 
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
+        # El usuario ya existe (sin confirmar): no debe seguir como inexistente
+        if self.user_status_cache is not None:
+            self.user_status_cache.forget(payload.email)
 
         final_response.mensaje = MessagesEnum.OPERATION_SUCCESSFULL.value
         final_response.resultado = try_signup
 
         return DevResponse(
             statusCode=status.HTTP_200_OK,
-            result=final_response.__dict__,
+            result=final_response,
         )
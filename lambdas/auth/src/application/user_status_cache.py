@@ -0,0 +1,66 @@
+import time
+from typing import Callable, FrozenSet, Optional, Self
+
+from src.infrastructure.utils.ttl_cache import TTLCache
+
+# Errores de Cognito que dependen del estado del usuario y no del intento
+CACHEABLE_ERROR_CODES: FrozenSet[str] = frozenset(
+    {"UserNotConfirmedException", "UserNotFoundException"}
+)
+
+
+class UserStatusCache:
+    """
+    Short-lived negative cache of users Cognito just reported as unconfirmed
+    or nonexistent.
+
+    SignInService answers repeated attempts for those users from here instead
+    of calling Cognito again. The cache lives in each Lambda container: an
+    entry is dropped when the user signs up, confirms or asks for a new code
+    through the same container, while changes made through other containers
+    (or the console) are only seen once the entry expires. Unconfirmed users
+    get their own, shorter TTL since confirming is the expected next step.
+    """
+
+    def __init__(
+        self: Self,
+        ttl_seconds: float = 30,
+        unconfirmed_ttl_seconds: float = 5,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Time an error is replayed without asking Cognito
+            unconfirmed_ttl_seconds: ``ttl_seconds`` of UserNotConfirmedException
+            max_size: Maximum number of users kept
+            clock: Monotonic clock, injectable for tests
+        """
+        self.unconfirmed_ttl_seconds = unconfirmed_ttl_seconds
+        self._cache: TTLCache[str, str] = TTLCache(
+            ttl_seconds=ttl_seconds, max_size=max_size, clock=clock
+        )
+
+    def get(self: Self, username: str) -> Optional[str]:
+        """Return the cached Cognito error code of ``username``, if any."""
+        return self._cache.get(self.normalize(username))
+
+    def remember(self: Self, username: str, error_code: str) -> None:
+        if error_code not in CACHEABLE_ERROR_CODES:
+            return
+
+        ttl_seconds = None
+        if error_code == "UserNotConfirmedException":
+            ttl_seconds = self.unconfirmed_ttl_seconds
+
+        if ttl_seconds is None or ttl_seconds > 0:
+            self._cache.set(self.normalize(username), error_code, ttl_seconds)
+
+    def forget(self: Self, username: str) -> None:
+        self._cache.delete(self.normalize(username))
+
+    @staticmethod
+    def normalize(username: str) -> str:
+        return username.strip().lower()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from botocore.exceptions import ClientError
 from fastapi import status
 
@@ -5,18 +7,22 @@ from src.domain.models.cognito import CognitoInitiateAuth
 from src.domain.models.sign_in import SignInResponse, SignInResult, SignInVerifyRequest
 from src.domain.enums.messages import MessagesEnum
 from src.domain.repositories.cognito_repository import ICognitoRepository
+from src.application.base_service import AsyncExecuteMixin
+from src.application.cognito_error_mapper import CognitoErrorMapper
 from src.domain.models.dev_response import DevResponse
 from src.infrastructure.utils.logger import CustomLogger
 
 
-class VerifyMFATokenService:
+class VerifyMFATokenService(AsyncExecuteMixin):
     def __init__(
         self,
         logger: CustomLogger,
         cognito_repository: ICognitoRepository,
+        error_mapper: Optional[CognitoErrorMapper] = None,
     ):
         self.logger = logger
         self.cognito_repository = cognito_repository
+        self.errors = error_mapper or CognitoErrorMapper()
 
     def execute(self, payload: SignInVerifyRequest) -> DevResponse:
         """
@@ -46,42 +52,13 @@ class VerifyMFATokenService:
 
             return DevResponse(
                 statusCode=status.HTTP_200_OK,
-                result=final_response.__dict__,
+                result=final_response,
             )
 
         except ClientError as err:
             self.logger.error("error", extra={"error": err})
 
-            if err.response["Error"]["Code"] == "CodeMismatchException":
-                final_response.mensaje = MessagesEnum.CODE_INVALID.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "InvalidParameterException":
-                final_response.mensaje = MessagesEnum.PAYLOAD_ERROR.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            elif err.response["Error"]["Code"] == "NotAuthorizedException":
-                final_response.mensaje = MessagesEnum.SESSION_INVALID_OR_EXPIRED.value
-
-                return DevResponse(
-                    statusCode=status.HTTP_400_BAD_REQUEST,
-                    result=final_response.__dict__,
-                )
-
-            final_response.mensaje = MessagesEnum.INTERNAL_SERVER_ERROR.value
-
-            return DevResponse(
-                statusCode=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                result=final_response.__dict__,
-            )
+            return self.errors.response(err, final_response)
 
     def __format_response(self, signin_response: CognitoInitiateAuth) -> SignInResponse:
         response = SignInResponse(
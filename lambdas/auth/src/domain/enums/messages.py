@@ -9,8 +9,18 @@ class MessagesEnum(Enum):
     )
     CODE_INVALID = "Invalid code received for user"
     SESSION_INVALID_OR_EXPIRED = "Sesión no válida o expirada."
+    REFRESH_TOKEN_INVALID = "Refresh token no válido o expirado."
     INTERNAL_SERVER_ERROR = "Tenemos problemas con nuestro servicio, intente más tarde. Si persiste, favor de repostarlo."
     USERNAME_EXISTS = "El usuario ya existe."
     UNAUTHORIZED = "No autorizado."
     USER_NOT_CONFIRMED = "Usuario no confirmado."
     LIMIT_EXCEEDED = "Límite de intentos excedido, favor de intentar más tarde."
+    SERVICE_UNAVAILABLE = (
+        "El servicio no está disponible por el momento, intente más tarde."
+    )
+    IDEMPOTENCY_KEY_REUSED = (
+        "La llave de idempotencia ya se usó con una petición distinta."
+    )
+    IDEMPOTENCY_IN_PROGRESS = (
+        "La petición original sigue en proceso, intente más tarde."
+    )
@@ -3,7 +3,9 @@ from enum import Enum
 
 class PathsEnum(Enum):
     sign_in = "/auth/signin"
+    token_refresh = "/auth/token/refresh"
     sign_up = "/auth/signup"
+    sign_up_bulk = "/auth/signup/bulk"
     confirm_sign_up = "/auth/confirm-signup"
     mfa_verify = "/auth/mfa/verify"
     mfa_code = "/auth/mfa/code"
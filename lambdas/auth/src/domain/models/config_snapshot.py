@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable view of every configured secret, loaded together.
+
+    Consumers read all their settings from the same snapshot, so a rotation
+    is never seen half applied; a new snapshot replaces the old one when any
+    secret version changes.
+    """
+
+    secrets: Mapping[str, Any] = field(default_factory=dict)
+    versions: Mapping[str, Optional[str]] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+    def __post_init__(self):
+        object.__setattr__(self, "secrets", MappingProxyType(dict(self.secrets)))
+        object.__setattr__(self, "versions", MappingProxyType(dict(self.versions)))
+
+    def __getitem__(self, secret_name: str) -> Any:
+        return self.secrets[secret_name]
+
+    def get(self, secret_name: str, default: Optional[Any] = None) -> Optional[Any]:
+        value = self.secrets.get(secret_name)
+        return default if value is None else value
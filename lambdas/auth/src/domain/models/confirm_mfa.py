@@ -25,7 +25,7 @@ class ConfirmMFARequest(BaseModel):
         return v
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfirmMFAResponse:
     mensaje: str
     resultado: Optional[Any] = None
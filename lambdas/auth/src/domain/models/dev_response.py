@@ -1,7 +1,11 @@
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
 
-class DevResponse(BaseModel):
-    statusCode: int = Field(200, ge=200, le=599)
-    result: Optional[Dict[str, Any]] = None
+@dataclass(slots=True)
+class DevResponse:
+    statusCode: int = 200
+    # Dataclass de respuesta del servicio (mensaje, resultado) o un dict
+    result: Optional[Any] = None
+    # Headers extra de la respuesta, p. ej. Retry-After
+    headers: Optional[Dict[str, str]] = None
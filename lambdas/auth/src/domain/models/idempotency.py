@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.domain.enums.idempotency_status import IdempotencyStatusEnum
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status_code: int
+    # (nombre, valor) tal como los envió la aplicación
+    headers: Tuple[Tuple[str, str], ...]
+    body: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """
+    State of an Idempotency-Key: claimed by a request still in progress, or
+    completed with the response to replay.
+    """
+
+    fingerprint: str
+    status: IdempotencyStatusEnum
+    response: Optional[StoredResponse] = None
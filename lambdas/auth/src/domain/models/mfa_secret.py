@@ -2,12 +2,12 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MFASecret:
     secret: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MFASecretResponse:
     mensaje: str
     resultado: Optional[MFASecret] = None
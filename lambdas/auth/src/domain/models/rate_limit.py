@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: float
+    retry_after_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class TokenBucketPolicy:
+    """
+    Token bucket: up to ``capacity`` attempts in a burst, refilled at
+    ``refill_per_second`` tokens per second.
+    """
+
+    capacity: float
+    refill_per_second: float
+
+    def seconds_to_full(self) -> float:
+        if self.refill_per_second <= 0:
+            return 0.0
+        return self.capacity / self.refill_per_second
+
+    def take(
+        self, tokens: float, elapsed_seconds: float, cost: float, force: bool = False
+    ) -> Tuple[float, RateLimitDecision]:
+        """
+        Refill a bucket for the elapsed time and take ``cost`` tokens from it.
+
+        Args:
+            tokens: Tokens in the bucket at its last update
+            elapsed_seconds: Time since that update
+            cost: Tokens to take
+            force: Take them even when there are not enough, down to -capacity
+
+        Returns:
+            The tokens left in the bucket and the decision for the attempt.
+        """
+        tokens = min(
+            self.capacity, tokens + max(elapsed_seconds, 0) * self.refill_per_second
+        )
+
+        if tokens >= cost:
+            tokens -= cost
+            return tokens, RateLimitDecision(allowed=True, remaining=tokens)
+
+        if force:
+            tokens = max(tokens - cost, -self.capacity)
+
+        retry_after = (
+            (cost - tokens) / self.refill_per_second
+            if self.refill_per_second > 0
+            else self.seconds_to_full()
+        )
+
+        return tokens, RateLimitDecision(
+            allowed=False, remaining=max(tokens, 0), retry_after_seconds=retry_after
+        )
@@ -51,21 +51,38 @@ class SignInVerifyRequest(BaseModel):
         return v
 
 
-@dataclass
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(
+        ..., min_length=1, description="The refresh token returned by the sign in"
+    )
+    user: Optional[str] = Field(
+        None,
+        description="Cognito username (the sub for email sign ins); required "
+        "to compute SECRET_HASH when the app client has a secret",
+    )
+
+    @field_validator("refresh_token")
+    def refresh_token_not_empty(cls, v):
+        if not v.strip():
+            raise ValueError("Refresh token cannot be empty or just spaces")
+        return v
+
+
+@dataclass(slots=True)
 class SignInResult:
     challege_parameters: Optional[CognitoChallengeParameters]
     authentication_result: Optional[AuthenticationResult] = None
     retry_attempts: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SignInMFAResult:
     challenge_name: Optional[ChallengesMFATypeEnum]
     session: Optional[str]
     retry_attempts: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class SignInResponse:
     mensaje: str
     resultado: Optional[SignInResult | SignInMFAResult] = None
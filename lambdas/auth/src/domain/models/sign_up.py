@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
@@ -55,7 +55,32 @@ class ConfirmSignUpRequest(BaseModel):
         return v
 
 
-@dataclass
+@dataclass(slots=True)
 class SignUpResponse:
     mensaje: str
     resultado: Optional[Any] = None
+
+
+@dataclass
+class BulkSignUpRowResult:
+    row: int
+    # created | rejected | invalid | failed
+    status: str
+    status_code: int
+    email: Optional[str] = None
+    mensaje: Optional[str] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+    user_sub: Optional[str] = None
+
+
+@dataclass
+class BulkSignUpSummary:
+    total: int = 0
+    created: int = 0
+    rejected: int = 0
+    invalid: int = 0
+    failed: int = 0
+
+    def add(self, result: BulkSignUpRowResult) -> None:
+        self.total += 1
+        setattr(self, result.status, getattr(self, result.status) + 1)
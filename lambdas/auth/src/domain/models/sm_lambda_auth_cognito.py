@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
+from pydantic import ConfigDict, with_config
 
+
+# Claves desconocidas en el secreto son un error, como con dacite strict
+@with_config(ConfigDict(extra="forbid"))
 @dataclass
 class SmLambdaAuthCognito:
     name: str
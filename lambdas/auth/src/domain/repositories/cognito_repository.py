@@ -11,6 +11,12 @@ class ICognitoRepository(ABC):
     ) -> Optional[CognitoInitiateAuth | CognitoInitiateAuthMFA]:
         pass
 
+    @abstractmethod
+    def refresh_tokens(
+        refresh_token: str, username: Optional[str] = None
+    ) -> CognitoInitiateAuth:
+        pass
+
     @abstractmethod
     def get_mfa_secret(access_token: str) -> Optional[str]:
         pass
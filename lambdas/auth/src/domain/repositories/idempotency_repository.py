@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.models.idempotency import IdempotencyRecord, StoredResponse
+
+
+class IIdempotencyRepository(ABC):
+    @abstractmethod
+    def claim(
+        self, key: str, fingerprint: str, lock_seconds: float
+    ) -> Optional[IdempotencyRecord]:
+        """
+        Atomically mark ``key`` as in progress unless it already has a record.
+
+        Args:
+            key: Scoped idempotency key
+            fingerprint: Hash of the request body
+            lock_seconds: Time after which an unfinished claim can be taken
+                again (the request that made it died)
+
+        Returns:
+            None when the key was claimed, otherwise the existing record.
+        """
+        pass
+
+    @abstractmethod
+    def complete(
+        self,
+        key: str,
+        fingerprint: str,
+        response: StoredResponse,
+        ttl_seconds: float,
+    ) -> None:
+        """
+        Store the response of a claimed key to replay it to later retries.
+
+        Args:
+            key: Scoped idempotency key
+            fingerprint: Hash of the request body
+            response: Response sent to the first request
+            ttl_seconds: Time the response is replayed
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Drop the record of ``key`` so the next retry runs again."""
+        pass
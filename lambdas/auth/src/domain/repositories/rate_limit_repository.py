@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.rate_limit import RateLimitDecision, TokenBucketPolicy
+
+
+class IRateLimitRepository(ABC):
+    @abstractmethod
+    def consume(
+        self,
+        key: str,
+        policy: TokenBucketPolicy,
+        cost: float = 1,
+        force: bool = False,
+    ) -> RateLimitDecision:
+        """
+        Take ``cost`` tokens from the bucket stored under ``key``.
+
+        Args:
+            key: Bucket identifier
+            policy: Capacity and refill rate of the bucket
+            cost: Tokens to take
+            force: Take the tokens even if the bucket does not have them,
+                leaving it in debt (down to -capacity)
+
+        Returns:
+            Whether the attempt is allowed and the tokens left.
+        """
+        pass
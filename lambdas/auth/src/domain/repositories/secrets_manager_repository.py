@@ -1,8 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 
 class ISecretsManagerRepository(ABC):
     @abstractmethod
     def get_secret(self, secret_name: str) -> Optional[str | dict]:
         pass
+
+    def get_secret_version(
+        self, secret_name: str, version_stage: Optional[str] = None
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Fetch a secret together with the version id it was read from.
+
+        Implementations that can not resolve version ids return None as the
+        second element.
+        """
+        return self.get_secret(secret_name), None
+
+    def get_secret_versions(
+        self, secret_names: Sequence[str], version_stage: Optional[str] = None
+    ) -> Dict[str, Tuple[Optional[Any], Optional[str]]]:
+        """
+        Fetch several secrets, with their version ids, keyed by secret name.
+
+        Secrets that do not exist map to (None, None). Implementations that can
+        read several secrets in a single call override this one-by-one default.
+        """
+        return {
+            secret_name: self.get_secret_version(
+                secret_name, version_stage=version_stage
+            )
+            for secret_name in secret_names
+        }
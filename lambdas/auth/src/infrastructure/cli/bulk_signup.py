@@ -0,0 +1,90 @@
+"""
+Sign up the users of a JSON Lines or CSV file from a workstation or a job.
+
+Uses the same BulkSignUpService as POST /auth/signup/bulk, without the row
+limit of the endpoint, and writes one JSON line per row plus a final summary
+as the sign ups finish. Requires AWS credentials and the same environment as
+the Lambda (REGION, SMLAMBDAAUTHORIZERCOGNITO).
+
+Usage (from lambdas/auth):
+    python -m src.infrastructure.cli.bulk_signup users.csv --output report.jsonl
+    python -m src.infrastructure.cli.bulk_signup users.jsonl --validate-only
+"""
+
+import argparse
+import sys
+from contextlib import nullcontext
+from dataclasses import asdict
+from typing import Iterator
+
+from src.application.bulk_sign_up_service import BulkSignUpService
+from src.application.services import container
+from src.domain.models.sign_up import BulkSignUpRowResult, BulkSignUpSummary
+from src.infrastructure.utils.bulk_input import (
+    CSV,
+    NDJSON,
+    RowRecord,
+    detect_format,
+    iter_records,
+)
+from src.infrastructure.utils.json_encoder import dumps
+
+
+def validate_only(
+    service: BulkSignUpService, records: Iterator[RowRecord]
+) -> Iterator[BulkSignUpRowResult]:
+    """Report the invalid rows without calling Cognito."""
+    for row, fields in records:
+        result = service.validate_row(row, fields)
+        if isinstance(result, BulkSignUpRowResult):
+            yield result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file", help="JSON Lines or CSV file, '-' for stdin")
+    parser.add_argument("--format", choices=[NDJSON, CSV])
+    parser.add_argument("--output", help="Report file, stdout by default")
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=10, help="Sign ups per second")
+    parser.add_argument("--validate-only", action="store_true")
+    args = parser.parse_args()
+
+    service = BulkSignUpService(
+        logger=container.resolve("logger"),
+        signup_service=container.resolve("signup_service"),
+        max_concurrency=args.concurrency,
+        rate_per_second=args.rate,
+    )
+    fmt = args.format or detect_format(filename=args.file)
+
+    source = (
+        nullcontext(sys.stdin)
+        if args.file == "-"
+        else open(args.file, encoding="utf-8-sig", newline="")
+    )
+    output = open(args.output, "w") if args.output else nullcontext(sys.stdout)
+    summary = BulkSignUpSummary()
+
+    with source as lines, output as report:
+        records = iter_records(lines, fmt)
+        results = (
+            validate_only(service, records)
+            if args.validate_only
+            else service.execute(records)
+        )
+
+        for result in results:
+            summary.add(result)
+            report.write(dumps(asdict(result)) + "\n")
+            report.flush()
+
+        report.write(dumps({"summary": asdict(summary)}) + "\n")
+
+    print(dumps(asdict(summary)), file=sys.stderr)
+    if summary.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
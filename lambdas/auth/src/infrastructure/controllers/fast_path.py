@@ -0,0 +1,309 @@
+import base64
+import math
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from src.application.rate_limiter import RateLimiter
+from src.domain.enums.messages import MessagesEnum
+from src.domain.enums.paths_enum import PathsEnum
+from src.domain.models.dev_response import DevResponse
+from src.domain.models.sign_in import SignInRequest, SignInVerifyRequest
+from src.infrastructure.middlewares.rate_limit_middleware import (
+    DEFAULT_FAILURE_STATUS_CODES,
+    DEFAULT_LIMITED_PATHS,
+)
+from src.infrastructure.utils.client_ip import ClientIpResolver
+from src.infrastructure.utils.json_response import encode_result, message_body
+from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.metrics import MetricsEmitter
+from src.infrastructure.utils.request_context import (
+    RequestContext,
+    reset_request_context,
+    set_request_context,
+)
+from src.infrastructure.utils.resilience import CircuitOpenError
+
+
+@dataclass(frozen=True)
+class FastRoute:
+    """
+    A POST endpoint served without the ASGI stack.
+
+    Attributes:
+        request_model: Pydantic model of the JSON body
+        service_provider: Returns the service whose ``execute`` handles the body
+    """
+
+    request_model: Type[BaseModel]
+    service_provider: Callable[[], Any]
+
+
+@dataclass
+class _Request:
+    path: str
+    headers: Dict[str, str]
+    body: bytes
+    source_ip: Optional[str]
+
+
+class FastPathRouter:
+    """
+    Serves the hot JSON endpoints straight from API Gateway events.
+
+    Handles REST (v1) and HTTP API (v2) events for the registered routes,
+    calling the service synchronously on the Lambda thread: no Mangum, no
+    event loop, no routing or dependency resolution. It keeps what the ASGI
+    middlewares add (request context and metrics, rate limiting, CORS
+    headers, 503 on an open circuit) and returns None for anything it does
+    not fully understand (other paths or methods, non JSON bodies, invalid
+    payloads), so the caller can hand the event to Mangum instead and the
+    client gets exactly the same response as before.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, FastRoute],
+        logger: CustomLogger,
+        metrics: Optional[MetricsEmitter] = None,
+        rate_limiter_provider: Callable[[], Optional[RateLimiter]] = lambda: None,
+        limited_paths: Iterable[str] = DEFAULT_LIMITED_PATHS,
+        failure_status_codes: Iterable[int] = DEFAULT_FAILURE_STATUS_CODES,
+        allow_origins: Iterable[str] = ("*",),
+        allow_credentials: bool = False,
+        client_ip_resolver: Optional[ClientIpResolver] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            routes: Routes by path (all POST)
+            logger: Logger object
+            metrics: Emitter of the per request metrics
+            rate_limiter_provider: Same provider used by RateLimitMiddleware
+            limited_paths: Paths subject to the rate limits
+            failure_status_codes: Status codes charged as failed attempts
+            allow_origins: Same origins given to CORSMiddleware
+            allow_credentials: Same flag given to CORSMiddleware
+            client_ip_resolver: Same resolver given to RateLimitMiddleware
+        """
+        self.routes = routes
+        self.logger = logger
+        self.metrics = metrics
+        self.rate_limiter_provider = rate_limiter_provider
+        self.limited_paths = frozenset(limited_paths)
+        self.failure_status_codes: FrozenSet[int] = frozenset(failure_status_codes)
+        self.allow_origins = frozenset(allow_origins)
+        self.allow_credentials = allow_credentials
+        self.client_ip_resolver = client_ip_resolver or ClientIpResolver()
+
+    def __call__(self, event: dict, context: Any) -> Optional[dict]:
+        """
+        Handle the event if it targets a fast route.
+
+        Args:
+            event: API Gateway proxy event
+            context: Lambda context
+
+        Returns:
+            The API Gateway proxy response, or None to fall back to Mangum.
+        """
+        is_v2 = event.get("version") == "2.0"
+        request = self._parse(event, is_v2)
+        if request is None:
+            return None
+
+        route = self.routes[request.path]
+        try:
+            payload = route.request_model.model_validate_json(request.body)
+        except ValidationError:
+            # FastAPI arma la respuesta 422 con el formato de siempre
+            return None
+
+        request_context = RequestContext(
+            request_id=getattr(context, "aws_request_id", None)
+            or request.headers.get("x-request-id")
+            or str(uuid.uuid4()),
+            path=request.path,
+            method="POST",
+            lambda_context=context,
+        )
+        token = set_request_context(request_context)
+        status_code = 500
+
+        try:
+            status_code, body, headers = self._dispatch(route, request, payload)
+        except Exception as err:
+            self.logger.error("Unhandled error", extra={"error": str(err)})
+            body, headers = b"Internal Server Error", {
+                "content-type": "text/plain; charset=utf-8"
+            }
+        finally:
+            self.logger.info(
+                "Request completed",
+                extra={
+                    "statusCode": status_code,
+                    "latency_ms": request_context.elapsed_ms(),
+                    "phases_ms": request_context.phases,
+                    "fast_path": True,
+                },
+            )
+            if self.metrics is not None:
+                self.metrics.emit_request(request_context, status_code)
+            reset_request_context(token)
+
+        return self._response(status_code, body, headers, request.headers, is_v2)
+
+    def _dispatch(
+        self, route: FastRoute, request: _Request, payload: BaseModel
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        rate_limiter = (
+            self.rate_limiter_provider() if request.path in self.limited_paths else None
+        )
+        user = getattr(payload, "user", None)
+
+        if rate_limiter is not None:
+            try:
+                decision = rate_limiter.check(request.path, user, request.source_ip)
+            except Exception as err:
+                self.logger.error("Rate limiter unavailable", extra={"error": str(err)})
+                rate_limiter = None
+            else:
+                if not decision.allowed:
+                    self.logger.warning(
+                        "Rate limit exceeded",
+                        extra={"retry_after_seconds": decision.retry_after_seconds},
+                    )
+                    return self._error(
+                        429,
+                        MessagesEnum.LIMIT_EXCEEDED,
+                        decision.retry_after_seconds,
+                    )
+
+        try:
+            result: DevResponse = route.service_provider().execute(payload)
+        except CircuitOpenError as err:
+            return self._error(
+                503, MessagesEnum.SERVICE_UNAVAILABLE, err.retry_after_seconds
+            )
+
+        body = encode_result(result.result)
+
+        if rate_limiter is not None and result.statusCode in self.failure_status_codes:
+            try:
+                rate_limiter.record_failure(request.path, user, request.source_ip)
+            except Exception as err:
+                self.logger.error("Rate limiter unavailable", extra={"error": str(err)})
+
+        headers = {"content-type": "application/json"}
+        if result.headers:
+            headers.update(
+                (name.lower(), value) for name, value in result.headers.items()
+            )
+
+        return result.statusCode, body, headers
+
+    def _parse(self, event: dict, is_v2: bool) -> Optional[_Request]:
+        request_context = event.get("requestContext") or {}
+
+        if is_v2:
+            http = request_context.get("http") or {}
+            method, path = http.get("method"), event.get("rawPath")
+        else:
+            method, path = event.get("httpMethod"), event.get("path")
+
+        if method != "POST" or path not in self.routes:
+            return None
+
+        headers = {
+            name.lower(): value for name, value in (event.get("headers") or {}).items()
+        }
+        content_type = headers.get("content-type")
+        if content_type is not None and "json" not in content_type.lower():
+            return None
+
+        body = event.get("body") or ""
+        body = (
+            base64.b64decode(body)
+            if event.get("isBase64Encoded")
+            else body.encode("utf-8")
+        )
+
+        source_ip = self.client_ip_resolver.from_event(
+            event
+        ) or self.client_ip_resolver.resolve(None, headers.get("x-forwarded-for"))
+
+        return _Request(path=path, headers=headers, body=body, source_ip=source_ip)
+
+    def _response(
+        self,
+        status_code: int,
+        body: bytes,
+        headers: Dict[str, str],
+        request_headers: Dict[str, str],
+        is_v2: bool,
+    ) -> dict:
+        headers = {"content-length": str(len(body)), **headers}
+        headers.update(self._cors_headers(request_headers.get("origin")))
+
+        response = {
+            "statusCode": status_code,
+            "headers": headers,
+            "body": body.decode("utf-8"),
+            "isBase64Encoded": False,
+        }
+        if not is_v2:
+            response["multiValueHeaders"] = {}
+
+        return response
+
+    def _cors_headers(self, origin: Optional[str]) -> Dict[str, str]:
+        # Mismos headers que CORSMiddleware agrega a una respuesta simple
+        if origin is None:
+            return {"vary": "Origin"}
+
+        headers = {}
+        if "*" in self.allow_origins:
+            headers["access-control-allow-origin"] = "*"
+        if self.allow_credentials:
+            headers["access-control-allow-credentials"] = "true"
+
+        if ("*" in self.allow_origins and self.allow_credentials) or (
+            origin in self.allow_origins
+        ):
+            headers["access-control-allow-origin"] = origin
+
+        headers["vary"] = "Origin"
+        return headers
+
+    @staticmethod
+    def _error(
+        status_code: int, message: MessagesEnum, retry_after_seconds: float
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        return (
+            status_code,
+            message_body(message),
+            {
+                "content-type": "application/json",
+                "retry-after": str(max(math.ceil(retry_after_seconds), 1)),
+            },
+        )
+
+
+def default_routes(
+    signin_service_provider: Callable[[], Any],
+    verify_mfa_service_provider: Callable[[], Any],
+) -> Dict[str, FastRoute]:
+    """Fast routes of /auth/signin and /auth/mfa/verify."""
+    return {
+        PathsEnum.sign_in.value: FastRoute(
+            request_model=SignInRequest,
+            service_provider=signin_service_provider,
+        ),
+        PathsEnum.mfa_verify.value: FastRoute(
+            request_model=SignInVerifyRequest,
+            service_provider=verify_mfa_service_provider,
+        ),
+    }
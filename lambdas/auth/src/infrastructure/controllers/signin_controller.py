@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, Request
 
 from src.application.resend_mfa import ResendMFAService
 from src.domain.models.mfa_resend_code import ResendRequest
@@ -6,16 +6,24 @@ from src.application.confirm_mfa import ConfirmMFAService
 from src.domain.models.confirm_mfa import ConfirmMFARequest, ConfirmMFAResponse
 from src.application.get_mfa_secret import GetMFASecretService
 from src.domain.models.mfa_secret import MFASecretResponse
+from src.infrastructure.utils.json_response import to_response
 from src.infrastructure.utils.logger import CustomLogger
 
 from src.domain.enums.paths_enum import PathsEnum
-from src.domain.models.sign_in import SignInRequest, SignInResponse, SignInVerifyRequest
+from src.domain.models.sign_in import (
+    RefreshTokenRequest,
+    SignInRequest,
+    SignInResponse,
+    SignInVerifyRequest,
+)
+from src.application.refresh_token_service import RefreshTokenService
 from src.application.sign_in_service import SignInService
 from src.application.verify_mfa_token import VerifyMFATokenService
 from src.application.services import (
     confirm_mfa_service,
     get_logger,
     get_mfa_secret_service,
+    get_refresh_token_service,
     get_resend_mfa_service,
     get_signin_service,
     get_verify_mfa_service,
@@ -33,7 +41,6 @@ router = APIRouter()
 )
 async def signin(
     payload: SignInRequest,
-    response: Response,
     signin_service: SignInService = Depends(get_signin_service),
     logger: CustomLogger = Depends(get_logger),
 ):
@@ -42,16 +49,36 @@ async def signin(
         extra={"path": "POST /auth/signin", "payload": payload},
     )
 
-    proccess = signin_service.execute(payload)
-
-    response.status_code = proccess.statusCode
+    proccess = await signin_service.execute_async(payload)
 
     logger.info(
         "Login is successfully",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
+
+
+@router.post(
+    PathsEnum.token_refresh.value,
+    response_model=SignInResponse,
+    responses={
+        200: {"model": SignInResponse, "description": "tokens are refreshed"},
+    },
+)
+async def refresh_token(
+    payload: RefreshTokenRequest,
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
+    logger: CustomLogger = Depends(get_logger),
+):
+    # El payload no se registra: contiene el refresh token
+    logger.info("Refresh Token Proccess", extra={"path": "POST /auth/token/refresh"})
+
+    proccess = await refresh_token_service.execute_async(payload)
+
+    logger.info("Refresh is finished", extra={"statusCode": proccess.statusCode})
+
+    return to_response(proccess)
 
 
 @router.post(
@@ -62,7 +89,6 @@ async def signin(
     },
 )
 async def verify_mfa(
-    response: Response,
     payload: SignInVerifyRequest,
     verify_mfa_service: VerifyMFATokenService = Depends(get_verify_mfa_service),
     logger: CustomLogger = Depends(get_logger),
@@ -72,16 +98,14 @@ async def verify_mfa(
         extra={"path": "POST /auth/mfa/verify", "payload": payload},
     )
 
-    proccess = verify_mfa_service.execute(payload)
-
-    response.status_code = proccess.statusCode
+    proccess = await verify_mfa_service.execute_async(payload)
 
     logger.info(
         "MFA Code Verified",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
 
 
 @router.get(
@@ -93,7 +117,6 @@ async def verify_mfa(
     tags=["MFA"],
 )
 async def get_mfa_secret(
-    response: Response,
     request: Request,
     get_mfa_secret_service: GetMFASecretService = Depends(get_mfa_secret_service),
     logger: CustomLogger = Depends(get_logger),
@@ -105,16 +128,14 @@ async def get_mfa_secret(
 
     token = request.headers["authorization"]
 
-    proccess = get_mfa_secret_service.execute(token)
-
-    response.status_code = proccess.statusCode
+    proccess = await get_mfa_secret_service.execute_async(token)
 
     logger.info(
         "MFA Secret is successfully",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
 
 
 @router.post(
@@ -126,7 +147,6 @@ async def get_mfa_secret(
     tags=["MFA"],
 )
 async def confirm_mfa(
-    response: Response,
     payload: ConfirmMFARequest,
     confirm_mfa_service: ConfirmMFAService = Depends(confirm_mfa_service),
     logger: CustomLogger = Depends(get_logger),
@@ -136,21 +156,18 @@ async def confirm_mfa(
         extra={"path": "POST /" + PathsEnum.mfa_challenge.value},
     )
 
-    proccess = confirm_mfa_service.execute(payload)
-
-    response.status_code = proccess.statusCode
+    proccess = await confirm_mfa_service.execute_async(payload)
 
     logger.info(
         "Proccess is finished",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
 
 
 @router.post(PathsEnum.mfa_resend.value)
 async def resend_mfa(
-    response: Response,
     payload: ResendRequest,
     resend_mfa_service: ResendMFAService = Depends(get_resend_mfa_service),
     logger: CustomLogger = Depends(get_logger),
@@ -160,13 +177,11 @@ async def resend_mfa(
         extra={"path": "POST /auth/mfa/resend", "payload": payload},
     )
 
-    proccess = resend_mfa_service.execute(payload)
-
-    response.status_code = proccess.statusCode
+    proccess = await resend_mfa_service.execute_async(payload)
 
     logger.info(
         "Proccess is finished",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
@@ -1,21 +1,29 @@
+from dataclasses import asdict
 from typing import Any
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from src.infrastructure.utils.exceptions import process_validation_error
+from src.infrastructure.utils.bulk_input import detect_format, iter_records
+from src.infrastructure.utils.json_encoder import dumps
+from src.infrastructure.utils.json_response import to_response
 from src.infrastructure.utils.logger import CustomLogger
 from src.domain.models.sign_up import (
+    BulkSignUpSummary,
     ConfirmSignUpRequest,
     SignUpRequest,
     SignUpResponse,
 )
 from src.domain.enums.paths_enum import PathsEnum
 from src.application.services import (
+    get_bulk_signup_service,
     get_confirm_signup_service,
     get_logger,
     get_signup_service,
 )
 from src.application.sign_up_service import SignUpService
+from src.application.bulk_sign_up_service import BulkSignUpService
 
 signup_router = APIRouter()
 
@@ -29,7 +37,6 @@ signup_router = APIRouter()
 )
 async def signup(
     payload: SignUpRequest,
-    response: Response,
     signup_service: SignUpService = Depends(get_signup_service),
     logger: CustomLogger = Depends(get_logger),
 ):
@@ -39,23 +46,21 @@ async def signup(
             extra={"path": PathsEnum.sign_up.value, "payload": payload},
         )
 
-        proccess = signup_service.execute(payload)
+        proccess = await signup_service.execute_async(payload)
 
         logger.info(
             "Proccess >>>>>>>",
             extra={"proccess": proccess},
         )
 
-        response.status_code = proccess.statusCode
-
         logger.info(
             "Proccess is finished",
             extra={"statusCode": proccess.statusCode, "response": proccess.result},
         )
 
-        return proccess.result
+        return to_response(proccess)
     except ValidationError as e:
-        return process_validation_error(e)
+        return to_response(process_validation_error(e))
 
 
 @signup_router.post(
@@ -66,7 +71,6 @@ async def signup(
     },
 )
 async def confirm_sign_up(
-    response: Response,
     payload: ConfirmSignUpRequest,
     confirm_signup_service=Depends(get_confirm_signup_service),
     logger: CustomLogger = Depends(get_logger),
@@ -76,18 +80,58 @@ async def confirm_sign_up(
         extra={"path": PathsEnum.confirm_sign_up.value},
     )
 
-    proccess = confirm_signup_service.execute(payload)
+    proccess = await confirm_signup_service.execute_async(payload)
 
     logger.info(
         "Proccess >>>>>>>",
         extra={"proccess": proccess},
     )
 
-    response.status_code = proccess.statusCode
-
     logger.info(
         "Proccess is finished",
         extra={"statusCode": proccess.statusCode, "response": proccess.result},
     )
 
-    return proccess.result
+    return to_response(proccess)
+
+
+@signup_router.post(
+    PathsEnum.sign_up_bulk.value,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One JSON line per row and a final summary line",
+        },
+    },
+)
+async def bulk_signup(
+    request: Request,
+    bulk_signup_service: BulkSignUpService = Depends(get_bulk_signup_service),
+    logger: CustomLogger = Depends(get_logger),
+):
+    """
+    Sign up the users of a JSON Lines (default) or CSV (Content-Type text/csv)
+    body with the fields of SignUpRequest.
+    """
+    body = (await request.body()).decode("utf-8-sig")
+    fmt = detect_format(content_type=request.headers.get("content-type"))
+
+    logger.info(
+        "Init Proccess",
+        extra={"path": PathsEnum.sign_up_bulk.value, "format": fmt},
+    )
+
+    records = iter_records(body.splitlines(), fmt)
+
+    def report():
+        summary = BulkSignUpSummary()
+
+        for result in bulk_signup_service.execute(records):
+            summary.add(result)
+            yield dumps(asdict(result)) + "\n"
+
+        logger.info("Proccess is finished", extra={"summary": asdict(summary)})
+        yield dumps({"summary": asdict(summary)}) + "\n"
+
+    return StreamingResponse(report(), media_type="application/x-ndjson")
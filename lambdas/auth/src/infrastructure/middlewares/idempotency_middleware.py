@@ -0,0 +1,262 @@
+import asyncio
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.application.idempotency_guard import IdempotencyGuard
+from src.domain.enums.idempotency_status import IdempotencyStatusEnum
+from src.domain.enums.messages import MessagesEnum
+from src.domain.enums.paths_enum import PathsEnum
+from src.domain.models.idempotency import IdempotencyRecord, StoredResponse
+from src.infrastructure.middlewares.rate_limit_middleware import buffer_body
+from src.infrastructure.utils.executor import run_blocking
+from src.infrastructure.utils.json_response import message_body
+from src.infrastructure.utils.logger import CustomLogger
+
+DEFAULT_IDEMPOTENT_ROUTES: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ("POST", PathsEnum.sign_up.value),
+        ("POST", PathsEnum.confirm_sign_up.value),
+        # Cada llamada a associate_software_token rota el secreto del usuario
+        ("GET", PathsEnum.mfa_code.value),
+    }
+)
+
+MAX_KEY_LENGTH = 255
+
+# Las respuestas de estos endpoints son de unos cientos de bytes
+MAX_STORED_BODY_BYTES = 64 * 1024
+
+REPLAYED_HEADER = (b"idempotent-replayed", b"true")
+
+
+class IdempotencyMiddleware:
+    """
+    ASGI middleware that makes the routes in ``routes`` idempotent for
+    requests carrying an ``Idempotency-Key`` header.
+
+    The first request of a key runs and its response, if successful, is
+    stored; retries with the same key and body get that response again (with
+    an ``Idempotent-Replayed`` header) without reaching the endpoint. Concurrent
+    duplicates in the same container wait for the first one and share its
+    response; a duplicate still running in another container answers 409
+    with Retry-After, and the same key with another body answers 422.
+    Requests without the header, and any error of the store, go through as
+    if the middleware was not there.
+    """
+
+    def __init__(
+        self,
+        app,
+        idempotency_guard_provider: Callable[[], Optional[IdempotencyGuard]],
+        logger: CustomLogger,
+        routes: Iterable[Tuple[str, str]] = DEFAULT_IDEMPOTENT_ROUTES,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            idempotency_guard_provider: Returns the guard, or None when
+                disabled; called per request so the store is created on first use
+            logger: Logger object
+            routes: (method, path) pairs that honor the header
+        """
+        self.app = app
+        self.idempotency_guard_provider = idempotency_guard_provider
+        self.logger = logger
+        self.routes = frozenset(routes)
+        # Requests en curso de este contenedor, por llave
+        self._in_flight: Dict[str, "asyncio.Future[Optional[IdempotencyRecord]]"] = {}
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or (scope.get("method"), scope.get("path")) not in self.routes
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = self._header(scope, b"idempotency-key")
+        guard = self.idempotency_guard_provider() if idempotency_key else None
+        if guard is None:
+            await self.app(scope, receive, send)
+            return
+
+        if len(idempotency_key) > MAX_KEY_LENGTH or not idempotency_key.strip():
+            await self._reject(send, 400, MessagesEnum.PAYLOAD_ERROR)
+            return
+
+        body, receive = await buffer_body(receive)
+        key = guard.key(
+            scope["method"],
+            scope["path"],
+            idempotency_key,
+            self._header(scope, b"authorization"),
+        )
+        fingerprint = guard.fingerprint(body)
+
+        # Duplicado concurrente: se espera al primero en lugar de ir al store.
+        # Si el primero falló (None) se vuelve a intentar como uno nuevo.
+        while key in self._in_flight:
+            record = await asyncio.shield(self._in_flight[key])
+            if record is not None:
+                await self._answer(send, record, fingerprint)
+                return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        record = None
+        try:
+            record = await self._run_first(
+                scope, receive, send, guard, key, fingerprint
+            )
+        finally:
+            del self._in_flight[key]
+            future.set_result(record)
+
+    async def _run_first(
+        self, scope, receive, send, guard: IdempotencyGuard, key: str, fingerprint: str
+    ) -> Optional[IdempotencyRecord]:
+        try:
+            existing = await run_blocking(guard.begin, key, fingerprint)
+        except Exception as err:
+            self.logger.error(
+                "Idempotency store unavailable", extra={"error": str(err)}
+            )
+            await self.app(scope, receive, send)
+            return None
+
+        if existing is not None:
+            await self._answer(send, existing, fingerprint)
+            return existing
+
+        captured = _CapturedResponse()
+
+        async def send_wrapper(message):
+            captured.add(message)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            response = captured.response()
+            try:
+                await run_blocking(
+                    guard.finish, key, fingerprint, response, scope["path"]
+                )
+            except Exception as err:
+                self.logger.error(
+                    "Idempotency store unavailable", extra={"error": str(err)}
+                )
+
+        if response is None:
+            return None
+
+        return IdempotencyRecord(
+            fingerprint=fingerprint,
+            status=IdempotencyStatusEnum.COMPLETED,
+            response=response,
+        )
+
+    async def _answer(self, send, record: IdempotencyRecord, fingerprint: str) -> None:
+        if record.fingerprint != fingerprint:
+            self.logger.warning("Idempotency key reused with another payload")
+            await self._reject(send, 422, MessagesEnum.IDEMPOTENCY_KEY_REUSED)
+            return
+
+        if record.response is None:
+            self.logger.warning("Idempotency key in progress")
+            await self._reject(
+                send,
+                409,
+                MessagesEnum.IDEMPOTENCY_IN_PROGRESS,
+                headers=[(b"retry-after", b"1")],
+            )
+            return
+
+        self.logger.info(
+            "Idempotent response replayed",
+            extra={"statusCode": record.response.status_code},
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": record.response.status_code,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in record.response.headers
+                ]
+                + [REPLAYED_HEADER],
+            }
+        )
+        await send({"type": "http.response.body", "body": record.response.body})
+
+    @staticmethod
+    def _header(scope, name: bytes) -> Optional[str]:
+        for header, value in scope.get("headers", []):
+            if header == name:
+                return value.decode("latin-1")
+
+        return None
+
+    @staticmethod
+    async def _reject(
+        send,
+        status_code: int,
+        message: MessagesEnum,
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    ) -> None:
+        body = message_body(message)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ]
+                + (headers or []),
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class _CapturedResponse:
+    """Copy of the ASGI messages of a response, to store it once complete."""
+
+    def __init__(self):
+        self.status_code: Optional[int] = None
+        self.headers: List[Tuple[str, str]] = []
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.complete = False
+
+    def add(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+            self.headers = [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in message.get("headers", [])
+            ]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            self.size += len(body)
+            # Respuestas demasiado grandes no se guardan (ni se copian)
+            if self.size <= MAX_STORED_BODY_BYTES:
+                self.chunks.append(body)
+            self.complete = not message.get("more_body", False)
+
+    def response(self) -> Optional[StoredResponse]:
+        """The response, or None if it did not finish or is too large to keep."""
+        if (
+            self.status_code is None
+            or not self.complete
+            or self.size > MAX_STORED_BODY_BYTES
+        ):
+            return None
+
+        return StoredResponse(
+            status_code=self.status_code,
+            headers=tuple(self.headers),
+            body=b"".join(self.chunks),
+        )
@@ -0,0 +1,175 @@
+import json
+import math
+from typing import Callable, FrozenSet, Iterable, Optional, Tuple
+
+from src.application.rate_limiter import RateLimiter
+from src.domain.enums.messages import MessagesEnum
+from src.domain.enums.paths_enum import PathsEnum
+from src.infrastructure.utils.client_ip import ClientIpResolver
+from src.infrastructure.utils.executor import run_blocking
+from src.infrastructure.utils.json_response import message_body
+from src.infrastructure.utils.logger import CustomLogger
+
+DEFAULT_LIMITED_PATHS: FrozenSet[str] = frozenset(
+    {
+        PathsEnum.sign_in.value,
+        PathsEnum.mfa_verify.value,
+        PathsEnum.mfa_resend.value,
+    }
+)
+
+# Respuestas que cuentan como intento fallido (credenciales o código inválido)
+DEFAULT_FAILURE_STATUS_CODES: FrozenSet[int] = frozenset({400, 401, 403, 404})
+
+# Los payloads de estos endpoints son de unos cientos de bytes
+MAX_INSPECTED_BODY_BYTES = 16 * 1024
+
+
+async def buffer_body(receive) -> Tuple[bytes, Callable]:
+    """
+    Read the whole request body and return it with a ``receive`` that replays
+    it to the application unchanged.
+    """
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay():
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return body, replay
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware that answers 429 before the request reaches the endpoint
+    (and Cognito) when the user or source IP ran out of attempts.
+
+    The body is buffered to read ``user`` and replayed to the application
+    unchanged. Failed attempts are charged again once the response status is
+    known. Errors of the limiter store let the request through.
+    """
+
+    def __init__(
+        self,
+        app,
+        rate_limiter_provider: Callable[[], Optional[RateLimiter]],
+        logger: CustomLogger,
+        paths: Iterable[str] = DEFAULT_LIMITED_PATHS,
+        failure_status_codes: Iterable[int] = DEFAULT_FAILURE_STATUS_CODES,
+        client_ip_resolver: Optional[ClientIpResolver] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            rate_limiter_provider: Returns the limiter, or None when disabled;
+                called per request so the store is created on first use
+            logger: Logger object
+            paths: Paths subject to the limits
+            failure_status_codes: Status codes charged as failed attempts
+            client_ip_resolver: Finds the source IP; by default no proxy is
+                trusted to set X-Forwarded-For
+        """
+        self.app = app
+        self.rate_limiter_provider = rate_limiter_provider
+        self.logger = logger
+        self.paths = frozenset(paths)
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self.client_ip_resolver = client_ip_resolver or ClientIpResolver()
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "POST"
+            or scope.get("path") not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        rate_limiter = self.rate_limiter_provider()
+        if rate_limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        body, receive = await buffer_body(receive)
+        path = scope["path"]
+        user = self._user(body)
+        source_ip = self.client_ip_resolver.from_scope(scope)
+
+        try:
+            decision = await run_blocking(rate_limiter.check, path, user, source_ip)
+        except Exception as err:
+            self.logger.error("Rate limiter unavailable", extra={"error": str(err)})
+            await self.app(scope, receive, send)
+            return
+
+        if not decision.allowed:
+            self.logger.warning(
+                "Rate limit exceeded",
+                extra={"retry_after_seconds": decision.retry_after_seconds},
+            )
+            await self._reject(send, decision.retry_after_seconds)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if status_code in self.failure_status_codes:
+            try:
+                await run_blocking(rate_limiter.record_failure, path, user, source_ip)
+            except Exception as err:
+                self.logger.error("Rate limiter unavailable", extra={"error": str(err)})
+
+    @staticmethod
+    def _user(body: bytes) -> Optional[str]:
+        if not body or len(body) > MAX_INSPECTED_BODY_BYTES:
+            return None
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+
+        user = payload.get("user") if isinstance(payload, dict) else None
+        return user if isinstance(user, str) and user.strip() else None
+
+    @staticmethod
+    async def _reject(send, retry_after_seconds: float) -> None:
+        body = message_body(MessagesEnum.LIMIT_EXCEEDED)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (
+                        b"retry-after",
+                        str(max(math.ceil(retry_after_seconds), 1)).encode(),
+                    ),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
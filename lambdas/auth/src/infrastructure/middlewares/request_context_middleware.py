@@ -0,0 +1,74 @@
+import uuid
+from typing import Optional
+
+from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.metrics import MetricsEmitter
+from src.infrastructure.utils.request_context import (
+    RequestContext,
+    reset_request_context,
+    set_request_context,
+)
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware that binds request id / path / method to the logs of the
+    request, writes a single access log line with status and latency, and
+    emits the per-phase latency metrics of the request.
+    """
+
+    def __init__(
+        self, app, logger: CustomLogger, metrics: Optional[MetricsEmitter] = None
+    ):
+        self.app = app
+        self.logger = logger
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        lambda_context = scope.get("aws.context")
+        context = RequestContext(
+            request_id=self._request_id(scope, lambda_context),
+            path=scope.get("path"),
+            method=scope.get("method"),
+            lambda_context=lambda_context,
+        )
+        token = set_request_context(context)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.logger.info(
+                "Request completed",
+                extra={
+                    "statusCode": status_code,
+                    "latency_ms": context.elapsed_ms(),
+                    "phases_ms": context.phases,
+                },
+            )
+            if self.metrics is not None:
+                self.metrics.emit_request(context, status_code)
+            reset_request_context(token)
+
+    @staticmethod
+    def _request_id(scope, lambda_context) -> str:
+        if lambda_context is not None and getattr(
+            lambda_context, "aws_request_id", None
+        ):
+            return lambda_context.aws_request_id
+
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                return value.decode("latin-1")
+
+        return str(uuid.uuid4())
@@ -0,0 +1,300 @@
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.domain.repositories.secrets_manager_repository import (
+    ISecretsManagerRepository,
+)
+from src.infrastructure.utils.logger import CustomLogger
+
+DEFAULT_VERSION_STAGE = "AWSCURRENT"
+
+
+@dataclass
+class SecretCacheStats:
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    stale_served: int = 0
+
+
+@dataclass
+class _SecretCacheEntry:
+    value: Any
+    version_id: Optional[str]
+    fetched_at: float
+    expires_at: float
+
+
+class CachedSecretsManagerRepositoryImpl(ISecretsManagerRepository):
+    """
+    Caching layer in front of another ISecretsManagerRepository.
+
+    Secrets are kept per (secret name, version stage) for ``ttl_seconds``.
+    Entries close to expiry are refreshed by the first request that sees them
+    in that window, on its own thread: Lambda freezes the environment once
+    the invocation returns, so a background thread could stop halfway while
+    holding the key. Concurrent callers do not wait for that refresh and keep
+    getting the cached value. When Secrets Manager fails the last known value
+    is served for up to ``max_stale_seconds`` after expiry.
+    """
+
+    def __init__(
+        self,
+        sm_repository: ISecretsManagerRepository,
+        logger: CustomLogger,
+        ttl_seconds: float = 300,
+        refresh_ahead_seconds: float = 30,
+        max_stale_seconds: float = 3600,
+        default_version_stage: str = DEFAULT_VERSION_STAGE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            sm_repository: Repository used to actually fetch the secrets
+            logger: Logger object
+            ttl_seconds: Time a fetched secret is considered fresh
+            refresh_ahead_seconds: Window before expiry in which a refresh is started
+            max_stale_seconds: Time after expiry a stale value may be served on errors
+            default_version_stage: Version stage used when none is requested
+            clock: Monotonic clock, injectable for tests
+        """
+        self.sm_repository = sm_repository
+        self.logger = logger
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = min(refresh_ahead_seconds, ttl_seconds)
+        self.max_stale_seconds = max_stale_seconds
+        self.default_version_stage = default_version_stage
+        self.clock = clock
+        self.stats = SecretCacheStats()
+
+        self._entries: Dict[Tuple[str, str], _SecretCacheEntry] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._batch_lock = threading.Lock()
+
+    def get_secret(
+        self,
+        secret_name: str,
+        default: Optional[Any] = None,
+        version_stage: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Return the cached secret, fetching it when missing or expired.
+
+        Args:
+            secret_name: The name of the secret to retrieve.
+            default: Value returned when the secret does not exist.
+            version_stage: Staging label, defaults to ``default_version_stage``.
+
+        Returns:
+            The deserialized secret value, or default if not found.
+        """
+        value, _ = self.get_secret_version(
+            secret_name, version_stage=version_stage, default=default
+        )
+        return value
+
+    def get_secret_version(
+        self,
+        secret_name: str,
+        version_stage: Optional[str] = None,
+        default: Optional[Any] = None,
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        key = (secret_name, version_stage or self.default_version_stage)
+        entry = self._entries.get(key)
+        now = self.clock()
+
+        if entry is not None and now < entry.expires_at:
+            self.stats.hits += 1
+
+            if now >= entry.expires_at - self.refresh_ahead_seconds:
+                entry = self._refresh_ahead(key, entry)
+
+            return self._result(entry, default)
+
+        with self._key_lock(key):
+            # Another caller may have refreshed the entry while we waited
+            entry = self._entries.get(key)
+            now = self.clock()
+            if entry is not None and now < entry.expires_at:
+                self.stats.hits += 1
+                return self._result(entry, default)
+
+            self.stats.misses += 1
+
+            try:
+                entry = self._fetch(key)
+            except Exception as err:
+                if (
+                    entry is not None
+                    and now < entry.expires_at + self.max_stale_seconds
+                ):
+                    self.stats.stale_served += 1
+                    self.logger.warning(
+                        "Serving stale secret after fetch failure",
+                        extra={"secret_name": secret_name, "error": str(err)},
+                    )
+                    return self._result(entry, default)
+                raise
+
+        return self._result(entry, default)
+
+    def get_secret_versions(
+        self,
+        secret_names: Sequence[str],
+        version_stage: Optional[str] = None,
+    ) -> Dict[str, Tuple[Optional[Any], Optional[str]]]:
+        """
+        Return several secrets, loading all the missing or expired ones with a
+        single batch call to the wrapped repository.
+
+        If the batch fails, each secret falls back to ``get_secret_version``
+        so stale values can still be served one by one.
+        """
+        stage = version_stage or self.default_version_stage
+        results, missing = self._cached_versions(secret_names, stage)
+        if not missing:
+            return results
+
+        with self._batch_lock:
+            # Otra invocación pudo cargar el lote mientras esperábamos
+            found, missing = self._cached_versions(missing, stage)
+            results.update(found)
+
+            if missing:
+                try:
+                    fetched = self.sm_repository.get_secret_versions(
+                        missing, version_stage=stage
+                    )
+                except Exception as err:
+                    self.logger.warning(
+                        "Batch secret fetch failed, falling back to single fetches",
+                        extra={"secret_names": missing, "error": str(err)},
+                    )
+                    fetched = None
+
+                if fetched is not None:
+                    self.stats.misses += len(missing)
+                    for name in missing:
+                        value, version_id = fetched.get(name, (None, None))
+                        entry = self._store((name, stage), value, version_id)
+                        results[name] = (entry.value, entry.version_id)
+                    return results
+
+        for name in missing:
+            results[name] = self.get_secret_version(name, version_stage=stage)
+
+        return results
+
+    def invalidate(self, secret_name: Optional[str] = None) -> None:
+        """Drop one secret (all stages) or the whole cache."""
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == secret_name]:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return a snapshot of the hit/miss/refresh counters."""
+        return asdict(self.stats)
+
+    @staticmethod
+    def _result(
+        entry: _SecretCacheEntry, default: Optional[Any]
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        if entry.value is None:
+            return default, None
+        return entry.value, entry.version_id
+
+    def _cached_versions(
+        self, secret_names: Sequence[str], stage: str
+    ) -> Tuple[Dict[str, Tuple[Optional[Any], Optional[str]]], List[str]]:
+        results, missing = {}, []
+        now = self.clock()
+
+        for name in secret_names:
+            entry = self._entries.get((name, stage))
+            if entry is None or now >= entry.expires_at:
+                missing.append(name)
+                continue
+
+            self.stats.hits += 1
+            if now >= entry.expires_at - self.refresh_ahead_seconds:
+                entry = self._refresh_ahead((name, stage), entry)
+            results[name] = (entry.value, entry.version_id)
+
+        return results, missing
+
+    def _fetch(self, key: Tuple[str, str]) -> _SecretCacheEntry:
+        secret_name, version_stage = key
+        value, version_id = self.sm_repository.get_secret_version(
+            secret_name, version_stage=version_stage
+        )
+
+        return self._store(key, value, version_id)
+
+    def _store(
+        self, key: Tuple[str, str], value: Any, version_id: Optional[str]
+    ) -> _SecretCacheEntry:
+        # Los secretos inexistentes también se recuerdan durante el TTL
+        now = self.clock()
+        previous = self._entries.get(key)
+
+        # Keep the same object when the version did not change so consumers
+        # holding on to it (e.g. configured repositories) stay valid.
+        if (
+            previous is not None
+            and version_id is not None
+            and previous.version_id == version_id
+        ):
+            value = previous.value
+
+        entry = _SecretCacheEntry(
+            value=value,
+            version_id=version_id,
+            fetched_at=now,
+            expires_at=now + self.ttl_seconds,
+        )
+        self._entries[key] = entry
+
+        return entry
+
+    def _refresh_ahead(
+        self, key: Tuple[str, str], entry: _SecretCacheEntry
+    ) -> _SecretCacheEntry:
+        """Refresh an entry about to expire, or return it as is if busy."""
+        lock = self._key_lock(key)
+        # Si otro request ya lo está refrescando se sigue con el valor actual
+        if not lock.acquire(blocking=False):
+            return entry
+
+        try:
+            if self._entries.get(key) is not entry:
+                return self._entries.get(key) or entry
+
+            entry = self._fetch(key)
+            self.stats.refreshes += 1
+        except Exception as err:
+            self.stats.refresh_errors += 1
+            self.logger.warning(
+                "Secret refresh ahead of expiry failed",
+                extra={"secret_name": key[0], "error": str(err)},
+            )
+        finally:
+            lock.release()
+
+        return entry
+
+    def _key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
@@ -1,5 +1,6 @@
-from typing import Any, Optional, Self
+from typing import Any, Callable, Dict, Optional, Self
 from botocore.client import BaseClient
+from botocore.exceptions import ClientError
 
 from src.domain.models.sm_lambda_auth_cognito import (
     SmLambdaAuthCognito,
@@ -7,6 +8,9 @@ from src.domain.models.sm_lambda_auth_cognito import (
 from src.domain.repositories.cognito_repository import ICognitoRepository
 from src.domain.models.cognito import CognitoInitiateAuth, CognitoInitiateAuthMFA
 from src.infrastructure.utils.logger import CustomLogger
+from src.infrastructure.utils.metrics import record_cognito_error, timed
+from src.infrastructure.utils.resilience import ResilientCaller
+from src.infrastructure.utils.secret_hash import SecretHashCalculator
 
 
 class CognitoRepositoryImpl(ICognitoRepository):
@@ -18,7 +22,10 @@ class CognitoRepositoryImpl(ICognitoRepository):
         self,
         logger: CustomLogger,
         cognito_client: BaseClient,
-        cognito_configs: SmLambdaAuthCognito,
+        cognito_configs: Optional[SmLambdaAuthCognito] = None,
+        cognito_configs_provider: Optional[Callable[[], SmLambdaAuthCognito]] = None,
+        resilient_caller: Optional[ResilientCaller] = None,
+        secret_hash_cache_size: int = 1024,
     ):
         """
         Initialize CognitoRepository with a specific type.
@@ -27,10 +34,97 @@ class CognitoRepositoryImpl(ICognitoRepository):
             logger: Logger object
             cognito_client: Boto3 cognito client
             cognito_configs: Configuration values for the Cognito client
+            cognito_configs_provider: Callable returning the current configuration,
+                used instead of cognito_configs so a long-lived repository
+                follows secret rotations
+            resilient_caller: Retries and circuit breaker applied to every
+                call; calls are made once when omitted
+            secret_hash_cache_size: SECRET_HASH values kept per username when
+                the app client has a secret
         """
+        if cognito_configs is None and cognito_configs_provider is None:
+            raise ValueError(
+                "Either cognito_configs or cognito_configs_provider must be provided"
+            )
+
         self.logger = logger
         self.cognito_client = cognito_client
-        self.cognito_configs = cognito_configs
+        self._cognito_configs = cognito_configs
+        self.cognito_configs_provider = cognito_configs_provider
+        self.resilient_caller = resilient_caller
+        self.secret_hash_cache_size = secret_hash_cache_size
+        self._secret_hash_calculator: Optional[SecretHashCalculator] = None
+
+    @property
+    def cognito_configs(self) -> SmLambdaAuthCognito:
+        if self.cognito_configs_provider is not None:
+            return self.cognito_configs_provider()
+
+        return self._cognito_configs
+
+    def _secret_hash(self: Self, username: str) -> Optional[str]:
+        """
+        SECRET_HASH for ``username``, or None when the app client has no secret.
+
+        The calculator is rebuilt only when the client credentials change
+        (e.g. after a secret rotation).
+        """
+        configs = self.cognito_configs
+        if not configs.client_secret:
+            return None
+
+        calculator = self._secret_hash_calculator
+        if calculator is None or not calculator.matches(
+            configs.client_id, configs.client_secret
+        ):
+            calculator = SecretHashCalculator(
+                configs.client_id,
+                configs.client_secret,
+                cache_size=self.secret_hash_cache_size,
+            )
+            self._secret_hash_calculator = calculator
+
+        return calculator.compute(username)
+
+    def _with_secret_hash(
+        self: Self, username: str, parameters: Dict[str, Any], key: str
+    ) -> Dict[str, Any]:
+        secret_hash = self._secret_hash(username)
+        if secret_hash is not None:
+            parameters[key] = secret_hash
+
+        return parameters
+
+    def _call(
+        self: Self, operation_name: str, idempotent: bool = False, **kwargs
+    ) -> Any:
+        """
+        Call a Cognito operation through the resilient caller, recording its
+        latency and error code in the metrics of the current request.
+
+        Args:
+            operation_name: Name of the boto3 client method
+            idempotent: Whether the operation may be retried after a 5xx or
+                a timeout, when Cognito may already have processed it
+            kwargs: Arguments of the operation
+
+        Returns:
+            The response of the operation.
+        """
+        if self.resilient_caller is None:
+            return self._invoke(operation_name, **kwargs)
+
+        return self.resilient_caller.call(
+            self._invoke, idempotent=idempotent, operation_name=operation_name, **kwargs
+        )
+
+    def _invoke(self: Self, operation_name: str, **kwargs) -> Any:
+        with timed("Cognito"):
+            try:
+                return getattr(self.cognito_client, operation_name)(**kwargs)
+            except ClientError as err:
+                record_cognito_error(err.response["Error"]["Code"])
+                raise
 
     def signin_with_email(
         self, email: str, password: str
@@ -45,12 +139,44 @@ class CognitoRepositoryImpl(ICognitoRepository):
         Returns:
             The access token if the user is successfully signed in, None otherwise
         """
-        return self.cognito_client.initiate_auth(
+        return self._call(
+            "initiate_auth",
+            idempotent=True,
             AuthFlow="USER_PASSWORD_AUTH",
-            AuthParameters={
-                "USERNAME": email,
-                "PASSWORD": password,
-            },
+            AuthParameters=self._with_secret_hash(
+                email,
+                {
+                    "USERNAME": email,
+                    "PASSWORD": password,
+                },
+                "SECRET_HASH",
+            ),
+            ClientId=self.cognito_configs.client_id,
+        )
+
+    def refresh_tokens(
+        self: Self, refresh_token: str, username: Optional[str] = None
+    ) -> CognitoInitiateAuth:
+        """
+        Get new access and id tokens with a refresh token (REFRESH_TOKEN_AUTH).
+
+        Args:
+            refresh_token: Refresh token returned by a previous sign in
+            username: Cognito username, used for SECRET_HASH when the app
+                client has a secret
+
+        Returns:
+            The InitiateAuth response, without a new refresh token.
+        """
+        auth_parameters = {"REFRESH_TOKEN": refresh_token}
+        if username:
+            self._with_secret_hash(username, auth_parameters, "SECRET_HASH")
+
+        return self._call(
+            "initiate_auth",
+            idempotent=True,
+            AuthFlow="REFRESH_TOKEN_AUTH",
+            AuthParameters=auth_parameters,
             ClientId=self.cognito_configs.client_id,
         )
 
@@ -62,8 +188,8 @@ class CognitoRepositoryImpl(ICognitoRepository):
                         authentication.
         :return: An MFA token that can be used to set up an MFA application.
         """
-        response = self.cognito_client.associate_software_token(
-            AccessToken=access_token
+        response = self._call(
+            "associate_software_token", idempotent=True, AccessToken=access_token
         )
 
         return response["SecretCode"]
@@ -86,12 +212,12 @@ class CognitoRepositoryImpl(ICognitoRepository):
             True if MFA was successfully verified, False otherwise.
         """
         if access_token:
-            response = self.cognito_client.verify_software_token(
-                AccessToken=access_token, UserCode=mfa_code
+            response = self._call(
+                "verify_software_token", AccessToken=access_token, UserCode=mfa_code
             )
         else:
-            response = self.cognito_client.verify_software_token(
-                Session=session, UserCode=mfa_code
+            response = self._call(
+                "verify_software_token", Session=session, UserCode=mfa_code
             )
 
         self.logger.info("MFA verified successfully.", extra={"res": response})
@@ -101,14 +227,19 @@ class CognitoRepositoryImpl(ICognitoRepository):
     def software_token_auth_challenge(
         self, username: str, session: str, authenticator_code: str
     ):
-        return self.cognito_client.respond_to_auth_challenge(
+        return self._call(
+            "respond_to_auth_challenge",
             ClientId=self.cognito_configs.client_id,
             Session=session,
             ChallengeName="SOFTWARE_TOKEN_MFA",
-            ChallengeResponses={
-                "USERNAME": username,
-                "SOFTWARE_TOKEN_MFA_CODE": authenticator_code,
-            },
+            ChallengeResponses=self._with_secret_hash(
+                username,
+                {
+                    "USERNAME": username,
+                    "SOFTWARE_TOKEN_MFA_CODE": authenticator_code,
+                },
+                "SECRET_HASH",
+            ),
         )
 
     def signup(self: Self, email: str, password: str, name: str) -> Any:
@@ -123,14 +254,18 @@ class CognitoRepositoryImpl(ICognitoRepository):
         Returns:
             The access token if the user is successfully signed up, None otherwise
         """
-        return self.cognito_client.sign_up(
-            ClientId=self.cognito_configs.client_id,
-            Username=email,
-            Password=password,
-            UserAttributes=[
+        kwargs = {
+            "ClientId": self.cognito_configs.client_id,
+            "Username": email,
+            "Password": password,
+            "UserAttributes": [
                 {"Name": "email", "Value": email},
                 {"Name": "name", "Value": name},
             ],
+        }
+
+        return self._call(
+            "sign_up", **self._with_secret_hash(email, kwargs, "SecretHash")
         )
 
     def confirm_user_sign_up(self, user: str, confirmation_code: str) -> bool:
@@ -149,7 +284,9 @@ class CognitoRepositoryImpl(ICognitoRepository):
             "ConfirmationCode": confirmation_code,
         }
 
-        confirm = self.cognito_client.confirm_sign_up(**kwargs)
+        confirm = self._call(
+            "confirm_sign_up", **self._with_secret_hash(user, kwargs, "SecretHash")
+        )
 
         self.logger.info("User confirmed successfully.", extra={"res": confirm})
 
@@ -173,7 +310,10 @@ class CognitoRepositoryImpl(ICognitoRepository):
         """
         kwargs = {"ClientId": self.cognito_configs.client_id, "Username": user}
 
-        response = self.cognito_client.resend_confirmation_code(**kwargs)
+        response = self._call(
+            "resend_confirmation_code",
+            **self._with_secret_hash(user, kwargs, "SecretHash"),
+        )
 
         delivery = response["CodeDeliveryDetails"]
 
@@ -191,7 +331,9 @@ class CognitoRepositoryImpl(ICognitoRepository):
             software_token_mfa_settings: The MFA settings for the user
             access_token: The access token of the user
         """
-        return self.cognito_client.set_user_mfa_preference(
+        return self._call(
+            "set_user_mfa_preference",
+            idempotent=True,
             SoftwareTokenMfaSettings=software_token_mfa_settings,
             AccessToken=access_token,
         )
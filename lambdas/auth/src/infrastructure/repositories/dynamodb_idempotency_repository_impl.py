@@ -0,0 +1,139 @@
+import json
+import math
+import time
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import ClientError
+
+from src.domain.enums.idempotency_status import IdempotencyStatusEnum
+from src.domain.models.idempotency import IdempotencyRecord, StoredResponse
+from src.domain.repositories.idempotency_repository import IIdempotencyRepository
+from src.infrastructure.utils.metrics import timed
+
+
+class DynamoDBIdempotencyRepositoryImpl(IIdempotencyRepository):
+    """
+    Idempotency records shared by every Lambda container through a DynamoDB
+    table.
+
+    Each key is one item ``{key, status, fingerprint, expires_at}`` plus
+    ``status_code``, ``headers`` and ``body`` once completed. The claim is a
+    conditional put, so only one container runs a given key; an item past
+    ``expires_at`` counts as missing even before DynamoDB TTL deletes it.
+
+    The table only needs a string partition key named ``key``. For local runs
+    point boto3 to DynamoDB Local with AWS_ENDPOINT_URL_DYNAMODB.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client: Any,
+        table_name: str,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            dynamodb_client: boto3 DynamoDB client
+            table_name: Name of the table holding the records
+            max_retries: Attempts when the item changes between the claim
+                and the read of the existing record
+            clock: Wall clock shared by every container
+        """
+        self.dynamodb_client = dynamodb_client
+        self.table_name = table_name
+        self.max_retries = max_retries
+        self.clock = clock
+
+    def claim(
+        self, key: str, fingerprint: str, lock_seconds: float
+    ) -> Optional[IdempotencyRecord]:
+        for _ in range(self.max_retries):
+            now = self.clock()
+
+            try:
+                with timed("Idempotency"):
+                    self.dynamodb_client.put_item(
+                        TableName=self.table_name,
+                        Item={
+                            "key": {"S": key},
+                            "status": {"S": IdempotencyStatusEnum.IN_PROGRESS.value},
+                            "fingerprint": {"S": fingerprint},
+                            "expires_at": {"N": str(math.ceil(now + lock_seconds))},
+                        },
+                        ConditionExpression=(
+                            "attribute_not_exists(#key) OR #expires_at <= :now"
+                        ),
+                        ExpressionAttributeNames={
+                            "#key": "key",
+                            "#expires_at": "expires_at",
+                        },
+                        ExpressionAttributeValues={":now": {"N": str(int(now))}},
+                    )
+                return None
+            except ClientError as err:
+                if err.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+
+            with timed("Idempotency"):
+                item = self.dynamodb_client.get_item(
+                    TableName=self.table_name,
+                    Key={"key": {"S": key}},
+                    ConsistentRead=True,
+                ).get("Item")
+
+            # Liberado o expirado entre las dos llamadas: se intenta de nuevo
+            if item is not None and int(item["expires_at"]["N"]) > int(now):
+                return self._record(item)
+
+        # Contención alta sobre la misma llave: se trata como en curso
+        return IdempotencyRecord(
+            fingerprint=fingerprint, status=IdempotencyStatusEnum.IN_PROGRESS
+        )
+
+    def complete(
+        self,
+        key: str,
+        fingerprint: str,
+        response: StoredResponse,
+        ttl_seconds: float,
+    ) -> None:
+        with timed("Idempotency"):
+            self.dynamodb_client.put_item(
+                TableName=self.table_name,
+                Item={
+                    "key": {"S": key},
+                    "status": {"S": IdempotencyStatusEnum.COMPLETED.value},
+                    "fingerprint": {"S": fingerprint},
+                    "expires_at": {"N": str(math.ceil(self.clock() + ttl_seconds))},
+                    "status_code": {"N": str(response.status_code)},
+                    "headers": {"S": json.dumps(response.headers)},
+                    "body": {"B": response.body},
+                },
+            )
+
+    def release(self, key: str) -> None:
+        with timed("Idempotency"):
+            self.dynamodb_client.delete_item(
+                TableName=self.table_name, Key={"key": {"S": key}}
+            )
+
+    @staticmethod
+    def _record(item: dict) -> IdempotencyRecord:
+        status = IdempotencyStatusEnum(item["status"]["S"])
+        response = None
+
+        if status is IdempotencyStatusEnum.COMPLETED:
+            response = StoredResponse(
+                status_code=int(item["status_code"]["N"]),
+                headers=tuple(
+                    (name, value) for name, value in json.loads(item["headers"]["S"])
+                ),
+                body=bytes(item["body"]["B"]),
+            )
+
+        return IdempotencyRecord(
+            fingerprint=item["fingerprint"]["S"], status=status, response=response
+        )
@@ -0,0 +1,121 @@
+import math
+import time
+from typing import Any, Callable
+
+from botocore.exceptions import ClientError
+
+from src.domain.models.rate_limit import RateLimitDecision, TokenBucketPolicy
+from src.domain.repositories.rate_limit_repository import IRateLimitRepository
+from src.infrastructure.utils.metrics import timed
+
+
+class DynamoDBRateLimitRepositoryImpl(IRateLimitRepository):
+    """
+    Token buckets shared by every Lambda container through a DynamoDB table.
+
+    Each bucket is one item ``{key, tokens, updated_at, version, expires_at}``.
+    Updates are conditional on ``version`` (optimistic locking) and retried a
+    few times when another container won the race. ``expires_at`` is meant
+    for DynamoDB TTL: once a bucket would be full again the item can go.
+
+    The table only needs a string partition key named ``key``. For local runs
+    point boto3 to DynamoDB Local with AWS_ENDPOINT_URL_DYNAMODB.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client: Any,
+        table_name: str,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            dynamodb_client: boto3 DynamoDB client
+            table_name: Name of the table holding the buckets
+            max_retries: Attempts when a concurrent update is detected
+            clock: Wall clock shared by every container
+        """
+        self.dynamodb_client = dynamodb_client
+        self.table_name = table_name
+        self.max_retries = max_retries
+        self.clock = clock
+
+    def consume(
+        self,
+        key: str,
+        policy: TokenBucketPolicy,
+        cost: float = 1,
+        force: bool = False,
+    ) -> RateLimitDecision:
+        for _ in range(self.max_retries):
+            with timed("RateLimit"):
+                item = self.dynamodb_client.get_item(
+                    TableName=self.table_name,
+                    Key={"key": {"S": key}},
+                    ConsistentRead=True,
+                ).get("Item")
+
+            now = self.clock()
+            if item is None:
+                tokens, updated_at, version = policy.capacity, now, 0
+            else:
+                tokens = float(item["tokens"]["N"])
+                updated_at = float(item["updated_at"]["N"])
+                version = int(item["version"]["N"])
+
+            tokens, decision = policy.take(tokens, now - updated_at, cost, force)
+
+            # Un intento rechazado sin force no modifica el bucket
+            if not decision.allowed and not force:
+                return decision
+
+            try:
+                with timed("RateLimit"):
+                    self._put(key, policy, tokens, now, version)
+            except ClientError as err:
+                if err.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                continue
+
+            return decision
+
+        # Contención alta sobre la misma llave: se trata como límite alcanzado
+        return RateLimitDecision(allowed=False, remaining=0, retry_after_seconds=1)
+
+    def _put(
+        self,
+        key: str,
+        policy: TokenBucketPolicy,
+        tokens: float,
+        now: float,
+        version: int,
+    ) -> None:
+        # A bucket in debt takes longer than seconds_to_full to be full again
+        expires_at = now + policy.seconds_to_full() * 2 + 60
+
+        if version == 0:
+            condition = {
+                "ConditionExpression": "attribute_not_exists(#key)",
+                "ExpressionAttributeNames": {"#key": "key"},
+            }
+        else:
+            condition = {
+                "ConditionExpression": "#version = :version",
+                "ExpressionAttributeNames": {"#version": "version"},
+                "ExpressionAttributeValues": {":version": {"N": str(version)}},
+            }
+
+        self.dynamodb_client.put_item(
+            TableName=self.table_name,
+            Item={
+                "key": {"S": key},
+                "tokens": {"N": f"{tokens:.6f}"},
+                "updated_at": {"N": f"{now:.6f}"},
+                "version": {"N": str(version + 1)},
+                "expires_at": {"N": str(math.ceil(expires_at))},
+            },
+            **condition,
+        )
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from src.domain.enums.idempotency_status import IdempotencyStatusEnum
+from src.domain.models.idempotency import IdempotencyRecord, StoredResponse
+from src.domain.repositories.idempotency_repository import IIdempotencyRepository
+from src.infrastructure.utils.ttl_cache import TTLCache
+
+
+class InMemoryIdempotencyRepositoryImpl(IIdempotencyRepository):
+    """
+    Idempotency records kept in the memory of the Lambda container.
+
+    Only retries landing on the same warm container are replayed; use
+    DynamoDBIdempotencyRepositoryImpl to share the records. The least recently
+    used keys are evicted past ``max_keys``.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_keys: Maximum number of keys kept
+            clock: Monotonic clock, injectable for tests
+        """
+        self._records: TTLCache[str, IdempotencyRecord] = TTLCache(
+            ttl_seconds=0, max_size=max_keys, clock=clock
+        )
+        # TTLCache no tiene un "set si no existe" atómico
+        self._lock = threading.Lock()
+
+    def claim(
+        self, key: str, fingerprint: str, lock_seconds: float
+    ) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                return record
+
+            self._records.set(
+                key,
+                IdempotencyRecord(
+                    fingerprint=fingerprint, status=IdempotencyStatusEnum.IN_PROGRESS
+                ),
+                ttl_seconds=lock_seconds,
+            )
+
+        return None
+
+    def complete(
+        self,
+        key: str,
+        fingerprint: str,
+        response: StoredResponse,
+        ttl_seconds: float,
+    ) -> None:
+        self._records.set(
+            key,
+            IdempotencyRecord(
+                fingerprint=fingerprint,
+                status=IdempotencyStatusEnum.COMPLETED,
+                response=response,
+            ),
+            ttl_seconds=ttl_seconds,
+        )
+
+    def release(self, key: str) -> None:
+        self._records.delete(key)
@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from src.domain.models.rate_limit import RateLimitDecision, TokenBucketPolicy
+from src.domain.repositories.rate_limit_repository import IRateLimitRepository
+
+
+class InMemoryRateLimitRepositoryImpl(IRateLimitRepository):
+    """
+    Token buckets kept in the memory of the Lambda container.
+
+    Limits are per container: with N warm containers an attacker gets up to N
+    times the configured rate. Use DynamoDBRateLimitRepositoryImpl to share
+    the buckets. The least recently used buckets are evicted past ``max_keys``
+    so a flood of distinct keys cannot grow the process memory.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_keys: Maximum number of buckets kept
+            clock: Monotonic clock, injectable for tests
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(
+        self,
+        key: str,
+        policy: TokenBucketPolicy,
+        cost: float = 1,
+        force: bool = False,
+    ) -> RateLimitDecision:
+        with self._lock:
+            now = self.clock()
+            tokens, updated_at = self._buckets.pop(key, (policy.capacity, now))
+
+            tokens, decision = policy.take(tokens, now - updated_at, cost, force)
+
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return decision
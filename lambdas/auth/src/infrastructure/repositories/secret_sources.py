@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from src.infrastructure.utils.logger import CustomLogger
+
+# Respuesta de GetSecretValue: SecretString, VersionId, ...
+SecretValue = Dict[str, Any]
+# (valores encontrados, ids inexistentes, ids que hay que leer uno por uno)
+BatchResult = Tuple[Dict[str, SecretValue], Set[str], List[str]]
+
+# Máximo de SecretIdList por llamada a BatchGetSecretValue
+BATCH_SIZE = 20
+EXTENSION_DEFAULT_PORT = 2773
+
+
+class SecretSource(ABC):
+    """Where SecretsManagerRepositoryImpl reads the raw secret values from."""
+
+    @abstractmethod
+    def get_secret_value(
+        self, secret_id: str, version_stage: Optional[str] = None
+    ) -> Optional[SecretValue]:
+        """
+        Return the GetSecretValue response of a secret.
+
+        Returns:
+            The response, or None if the secret does not exist.
+        """
+
+    def batch_get_secret_values(self, secret_ids: Sequence[str]) -> BatchResult:
+        """
+        Read the AWSCURRENT version of several secrets at once.
+
+        Sources without a batch operation leave every id to be read one by one.
+        """
+        return {}, set(), list(secret_ids)
+
+
+class SdkSecretSource(SecretSource):
+    """Secrets Manager through boto3."""
+
+    def __init__(self, sm_client: BaseClient):
+        self.sm_client = sm_client
+
+    def get_secret_value(
+        self, secret_id: str, version_stage: Optional[str] = None
+    ) -> Optional[SecretValue]:
+        request = {"SecretId": secret_id}
+        if version_stage:
+            request["VersionStage"] = version_stage
+
+        try:
+            return self.sm_client.get_secret_value(**request)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                return None
+            raise e
+
+    def batch_get_secret_values(self, secret_ids: Sequence[str]) -> BatchResult:
+        """
+        One BatchGetSecretValue call per 20 secrets.
+
+        Chunks that fail (e.g. missing secretsmanager:BatchGetSecretValue
+        permission) and per-secret errors other than not found are left to be
+        read one by one, which raises the actual error if there is one.
+        """
+        found: Dict[str, SecretValue] = {}
+        not_found: Set[str] = set()
+        pending: List[str] = []
+
+        for start in range(0, len(secret_ids), BATCH_SIZE):
+            chunk = list(secret_ids[start : start + BATCH_SIZE])
+            try:
+                response = self.sm_client.batch_get_secret_value(SecretIdList=chunk)
+            except ClientError:
+                pending.extend(chunk)
+                continue
+
+            by_id = {}
+            for secret in response.get("SecretValues", []):
+                by_id[secret.get("Name")] = secret
+                by_id[secret.get("ARN")] = secret
+
+            errors = {
+                error.get("SecretId")
+                for error in response.get("Errors", [])
+                if error.get("ErrorCode") == "ResourceNotFoundException"
+            }
+
+            for secret_id in chunk:
+                if secret_id in by_id:
+                    found[secret_id] = by_id[secret_id]
+                elif secret_id in errors:
+                    not_found.add(secret_id)
+                else:
+                    pending.append(secret_id)
+
+        return found, not_found, pending
+
+
+class ExtensionSecretSource(SecretSource):
+    """
+    AWS Parameters and Secrets Lambda Extension, over its localhost HTTP cache.
+
+    Avoids the TLS handshake with Secrets Manager on cold starts. When the
+    extension is not installed or not ready yet (e.g. during the init phase)
+    the call goes to ``fallback`` instead, which is only built the first time
+    it is needed.
+    """
+
+    def __init__(
+        self,
+        fallback: Callable[[], SecretSource],
+        logger: CustomLogger,
+        port: int = EXTENSION_DEFAULT_PORT,
+        timeout: float = 1.0,
+        token: Optional[str] = None,
+    ):
+        """
+        Initialize the source.
+
+        Args:
+            fallback: Factory of the source used when the extension fails
+            logger: Logger object
+            port: PARAMETERS_SECRETS_EXTENSION_HTTP_PORT of the extension
+            timeout: Seconds to wait for the extension
+            token: Session token sent in X-Aws-Parameters-Secrets-Token,
+                AWS_SESSION_TOKEN by default
+        """
+        self.base_url = f"http://localhost:{port}/secretsmanager/get"
+        self.logger = logger
+        self.timeout = timeout
+        self.token = token
+        self._fallback_factory = fallback
+        self._fallback: Optional[SecretSource] = None
+        self._lock = threading.Lock()
+
+    def get_secret_value(
+        self, secret_id: str, version_stage: Optional[str] = None
+    ) -> Optional[SecretValue]:
+        query = {"secretId": secret_id}
+        if version_stage:
+            query["versionStage"] = version_stage
+
+        request = urllib.request.Request(
+            f"{self.base_url}?{urllib.parse.urlencode(query)}",
+            headers={
+                "X-Aws-Parameters-Secrets-Token": self.token
+                or os.getenv("AWS_SESSION_TOKEN", "")
+            },
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            body = e.read().decode("utf-8", "replace")
+            if e.code == 404 or "ResourceNotFoundException" in body:
+                return None
+            error = f"HTTP {e.code}: {body[:200]}"
+        except (OSError, ValueError) as e:
+            error = str(e)
+
+        self.logger.warning(
+            "Secrets extension unavailable, using the fallback source",
+            extra={"secret_name": secret_id, "error": error},
+        )
+        return self.fallback().get_secret_value(secret_id, version_stage)
+
+    def fallback(self) -> SecretSource:
+        with self._lock:
+            if self._fallback is None:
+                self._fallback = self._fallback_factory()
+            return self._fallback
+
+
+class LocalFileSecretSource(SecretSource):
+    """
+    Secrets from a local JSON file, for ``sam local`` and offline runs.
+
+    The file maps each secret name to its value, either as a JSON object or
+    as the raw SecretString:
+
+        {"auth-cognito": {"client_id": "...", "user_pool_id": "..."}}
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the source, loading the file once.
+
+        Args:
+            path: Path of the JSON file
+        """
+        self.path = path
+
+        with open(path, encoding="utf-8") as file:
+            secrets = json.load(file)
+
+        self._values: Dict[str, SecretValue] = {}
+        for name, value in secrets.items():
+            secret_string = value if isinstance(value, str) else json.dumps(value)
+            self._values[name] = {
+                "Name": name,
+                "SecretString": secret_string,
+                # Versión estable mientras no cambie el contenido
+                "VersionId": hashlib.sha256(secret_string.encode()).hexdigest()[:32],
+            }
+
+    def get_secret_value(
+        self, secret_id: str, version_stage: Optional[str] = None
+    ) -> Optional[SecretValue]:
+        return self._values.get(secret_id)
+
+    def batch_get_secret_values(self, secret_ids: Sequence[str]) -> BatchResult:
+        found = {
+            name: self._values[name] for name in secret_ids if name in self._values
+        }
+        return found, set(secret_ids) - set(found), []
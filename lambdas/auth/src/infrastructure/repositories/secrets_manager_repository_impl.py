@@ -1,114 +1,168 @@
-import json
-import dacite
-from typing import TypeVar, Optional, Type
-from botocore.exceptions import ClientError
-from botocore.client import BaseClient
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple, TypeVar, Optional
 
 from src.domain.repositories.secrets_manager_repository import (
     ISecretsManagerRepository,
 )
-
+from src.infrastructure.repositories.secret_sources import SecretSource
+from src.infrastructure.utils.metrics import timed
+from src.infrastructure.utils.secret_decoders import SecretDecoders
 
 # Define el tipo genérico T
 T = TypeVar("T")
 
+# BatchGetSecretValue solo devuelve la versión AWSCURRENT
+BATCH_VERSION_STAGES = (None, "AWSCURRENT")
+
 
 class SecretsManagerRepositoryImpl(ISecretsManagerRepository):
     """
     Implementation of the SecretsManagerRepository interface.
-    This class interacts with AWS Secrets Manager and fetches secrets,
-    returning them as either a raw string, dictionary, or dataclass.
+    This class fetches secrets from a SecretSource (the SDK, the Parameters
+    and Secrets Lambda Extension or a local file) and decodes each one into
+    the type registered for its name in ``decoders``.
     """
 
-    def __init__(self, sm_client: BaseClient, secret_type: Type[T]):
+    def __init__(
+        self, source: SecretSource, decoders: SecretDecoders, max_workers: int = 8
+    ):
         """
-        Initialize the SecretsManagerRepositoryImpl with a Boto3 client and secret type.
+        Initialize the SecretsManagerRepositoryImpl with a secret source and decoders.
 
         Args:
-            sm_client: Boto3 secrets manager client
-            secret_type: Type of the secret (dataclass, primitive type, etc.)
+            source: Where the raw secret values are read from
+            decoders: Decoder of each secret (str, dict, dataclass, etc.)
+            max_workers: Parallel reads when batching is not possible
         """
-        self.sm_client = sm_client
-        self.secret_type = secret_type
-
-    def get_secret(self, secret_name: str, default: Optional[T] = None) -> Optional[T]:
+        self.source = source
+        self.decoders = decoders
+        self.max_workers = max_workers
+
+    def get_secret(
+        self,
+        secret_name: str,
+        default: Optional[T] = None,
+        version_stage: Optional[str] = None,
+    ) -> Optional[T]:
         """
         Fetch a secret from AWS Secrets Manager and deserialize it into the desired type.
 
         Args:
             secret_name: The name of the secret to retrieve from Secrets Manager.
             default: A default value to return if the secret is not found or can't be parsed.
+            version_stage: Optional staging label (e.g. AWSCURRENT, AWSPENDING).
 
         Returns:
             The secret value as the specified type T, or default if not found.
 
         Raises:
             ClientError: If an error occurs while accessing Secrets Manager.
-            json.JSONDecodeError: If the secret can't be parsed as JSON.
-            dacite.DaciteError: If the secret can't be converted to the dataclass.
+            ValueError: If the secret can't be parsed or converted to its type.
         """
-        try:
-            # Attempt to retrieve the secret from AWS Secrets Manager
-            get_secret_value_response = self.sm_client.get_secret_value(
-                SecretId=secret_name
-            )
-        except ClientError as e:
-            # If the secret is not found, return the default value
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                return default
-            # Re-raise the exception for other client errors
-            raise e
-
-        secret_string = get_secret_value_response.get("SecretString", "")
-        if not secret_string:
-            raise ValueError(
-                f"Secret {secret_name} does not contain valid string data."
+        value, _ = self.get_secret_version(
+            secret_name, version_stage=version_stage, default=default
+        )
+        return value
+
+    def get_secret_version(
+        self,
+        secret_name: str,
+        version_stage: Optional[str] = None,
+        default: Optional[T] = None,
+    ) -> Tuple[Optional[T], Optional[str]]:
+        """
+        Fetch a secret and the id of the version that was read.
+
+        Args:
+            secret_name: The name of the secret to retrieve from Secrets Manager.
+            version_stage: Optional staging label (e.g. AWSCURRENT, AWSPENDING).
+            default: A default value to return if the secret is not found.
+
+        Returns:
+            A tuple with the deserialized secret (or default) and its VersionId.
+        """
+        with timed("SecretsManager"):
+            get_secret_value_response = self.source.get_secret_value(
+                secret_name, version_stage
             )
 
-        return self._deserialize_secret(secret_string, secret_name)
+        # If the secret is not found, return the default value
+        if get_secret_value_response is None:
+            return default, None
+
+        return self._decode(secret_name, get_secret_value_response)
 
-    def _deserialize_secret(self, secret_string: str, secret_name: str) -> Optional[T]:
+    def get_secret_versions(
+        self,
+        secret_names: Sequence[str],
+        version_stage: Optional[str] = None,
+    ) -> Dict[str, Tuple[Optional[Any], Optional[str]]]:
         """
-        Deserialize the secret string into the desired type (e.g., str, dict, dataclass).
+        Fetch several secrets with the batch read of the source (one
+        BatchGetSecretValue call per 20 secrets with the SDK).
+
+        Secrets the batch can not return (other version stages, sources
+        without batch reads, missing secretsmanager:BatchGetSecretValue
+        permission, per-secret errors other than not found) are read with
+        concurrent single reads, which raise the actual error if there is one.
 
         Args:
-            secret_string: The string representation of the secret.
-            secret_name: The name of the secret, used for error logging.
+            secret_names: Names or ARNs of the secrets.
+            version_stage: Optional staging label (e.g. AWSCURRENT, AWSPENDING).
 
         Returns:
-            The deserialized secret value.
-
-        Raises:
-            JSONDecodeError: If the secret can't be parsed as JSON.
-            ValueError: If the secret can't be converted into the specified dataclass.
+            A dict of secret name to (deserialized secret or None, VersionId).
         """
-        try:
-            secret_dict = json.loads(secret_string)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(
-                f"Secret {secret_name} could not be parsed as JSON: {e.msg}",
-                e.doc,
-                e.pos,
-            ) from e
-
-        if self.secret_type is str:
-            return secret_string  # Type directly returned if the expected type is str
-
-        if self.secret_type is dict:
-            return secret_dict  # Type directly returned if the expected type is dict
-
-        if hasattr(self.secret_type, "__dataclass_fields__"):
-            # If the type is a dataclass, deserialize it using dacite
-            try:
-                return dacite.from_dict(
-                    data_class=self.secret_type,
-                    data=secret_dict,
-                    config=dacite.Config(strict=True),
+        names = list(dict.fromkeys(secret_names))
+        if len(names) <= 1 or version_stage not in BATCH_VERSION_STAGES:
+            return self._get_concurrently(names, version_stage)
+
+        with timed("SecretsManager"):
+            found, not_found, pending = self.source.batch_get_secret_values(names)
+
+        results: Dict[str, Tuple[Optional[Any], Optional[str]]] = {
+            name: self._decode(name, secret_value)
+            for name, secret_value in found.items()
+        }
+        results.update({name: (None, None) for name in not_found})
+        results.update(self._get_concurrently(pending, version_stage))
+        return results
+
+    def _get_concurrently(
+        self, secret_names: List[str], version_stage: Optional[str]
+    ) -> Dict[str, Tuple[Optional[Any], Optional[str]]]:
+        if len(secret_names) <= 1:
+            return {
+                name: self.get_secret_version(name, version_stage=version_stage)
+                for name in secret_names
+            }
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(secret_names))
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    contextvars.copy_context().run,
+                    self.get_secret_version,
+                    name,
+                    version_stage=version_stage,
                 )
-            except dacite.DaciteError as e:
-                raise ValueError(
-                    f"Could not convert secret {secret_name} to {self.secret_type.__name__}: {e}"
-                ) from e
+                for name in secret_names
+            }
+
+            return {name: future.result() for name, future in futures.items()}
+
+    def _decode(
+        self, secret_name: str, secret_value: Dict[str, Any]
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        secret_string = secret_value.get("SecretString", "")
+        if not secret_string:
+            raise ValueError(
+                f"Secret {secret_name} does not contain valid string data."
+            )
 
-        # If the type is not handled, assume it's a primitive type and return the dict
-        return secret_dict  # Default case for unsupported types
+        return (
+            self.decoders.for_secret(secret_name).decode(secret_string, secret_name),
+            secret_value.get("VersionId"),
+        )
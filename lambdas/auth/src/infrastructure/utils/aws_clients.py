@@ -0,0 +1,157 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+# boto3/botocore se importan en el primer uso: importar este módulo no debe
+# pagar su costo durante el cold start.
+if TYPE_CHECKING:
+    import boto3
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
+
+_session: Optional["boto3.Session"] = None
+_session_lock = threading.Lock()
+
+# Valores por defecto pensados para llamadas cortas a Cognito / Secrets Manager:
+# una llamada colgada debe fallar en segundos, no consumir el timeout de Lambda.
+DEFAULT_CLIENT_SETTINGS: Dict[str, Any] = {
+    "MAX_POOL_CONNECTIONS": 10,
+    "RETRY_MODE": "standard",
+    "MAX_ATTEMPTS": 3,
+    "CONNECT_TIMEOUT": 2.0,
+    "READ_TIMEOUT": 5.0,
+    "TCP_KEEPALIVE": True,
+}
+
+# Valores por servicio que reemplazan a DEFAULT_CLIENT_SETTINGS. Cognito no
+# reintenta en botocore: lo hace CognitoRepositoryImpl con backoff acotado al
+# tiempo restante de la invocación y circuit breaker.
+SERVICE_CLIENT_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "cognito-idp": {"MAX_ATTEMPTS": 1},
+}
+
+
+def get_session() -> "boto3.Session":
+    """Return the boto3 session shared by every client of the container."""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import boto3
+
+                _session = boto3.Session()
+
+    return _session
+
+
+def _setting(service_name: str, name: str) -> Any:
+    """
+    Resolve a client setting from the environment.
+
+    ``AWS_<SERVICE>_<NAME>`` (e.g. AWS_COGNITO_IDP_READ_TIMEOUT) wins over
+    SERVICE_CLIENT_SETTINGS, then the shared ``AWS_CLIENT_<NAME>`` and last
+    DEFAULT_CLIENT_SETTINGS.
+    """
+    service_prefix = service_name.upper().replace("-", "_")
+    default = DEFAULT_CLIENT_SETTINGS[name]
+    service_settings = SERVICE_CLIENT_SETTINGS.get(service_name, {})
+
+    raw = os.getenv(f"AWS_{service_prefix}_{name}")
+    if raw is None and name in service_settings:
+        return service_settings[name]
+    if raw is None:
+        raw = os.getenv(f"AWS_CLIENT_{name}")
+    if raw is None:
+        return default
+
+    if isinstance(default, bool):
+        return raw.strip().lower() in ("1", "true", "yes")
+    if isinstance(default, int):
+        return int(raw)
+    if isinstance(default, float):
+        return float(raw)
+
+    return raw
+
+
+def build_client_config(service_name: str) -> "Config":
+    """
+    Build the botocore Config for a service from environment variables.
+
+    Args:
+        service_name: Boto3 service name (e.g. "cognito-idp")
+
+    Returns:
+        Config with pool size, retry mode/attempts, timeouts and TCP keepalive.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=_setting(service_name, "MAX_POOL_CONNECTIONS"),
+        retries={
+            "mode": _setting(service_name, "RETRY_MODE"),
+            "total_max_attempts": _setting(service_name, "MAX_ATTEMPTS"),
+        },
+        connect_timeout=_setting(service_name, "CONNECT_TIMEOUT"),
+        read_timeout=_setting(service_name, "READ_TIMEOUT"),
+        tcp_keepalive=_setting(service_name, "TCP_KEEPALIVE"),
+    )
+
+
+def create_boto3_client(
+    service_name: str, region: Optional[str], config: Optional["Config"] = None
+) -> "BaseClient":
+    """
+    Create a boto3 client from the shared session with a tuned Config.
+
+    Args:
+        service_name: Boto3 service name
+        region: AWS region of the client
+        config: Optional Config, built from the environment when omitted
+
+    Returns:
+        The boto3 client.
+    """
+    return get_session().client(
+        service_name,
+        region_name=region,
+        config=config or build_client_config(service_name),
+    )
+
+
+def prime_connections(client: "BaseClient", count: int, call: Callable[[], Any]) -> int:
+    """
+    Open up to ``count`` pooled connections of a client ahead of traffic.
+
+    ``call`` is run concurrently so each run needs its own connection; the
+    connections stay in the client's pool once the responses arrive. Error
+    responses are fine: the TLS connection is open all the same.
+
+    Args:
+        client: boto3 client whose pool is filled
+        count: Connections to open, capped to the client's max_pool_connections
+        call: Cheap request made with ``client``
+
+    Returns:
+        Number of calls that got a response from the service.
+    """
+    from botocore.exceptions import ClientError
+
+    count = min(count, client.meta.config.max_pool_connections)
+    if count <= 0:
+        return 0
+
+    def attempt() -> bool:
+        try:
+            call()
+        except ClientError:
+            pass
+        except Exception:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return sum(executor.map(lambda _: attempt(), range(count)))
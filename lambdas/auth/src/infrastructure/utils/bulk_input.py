@@ -0,0 +1,75 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+# (número de fila empezando en 1, campos de la fila o el error al leerla)
+RowRecord = Tuple[int, Union[Dict[str, Any], ValueError]]
+
+
+def detect_format(
+    content_type: Optional[str] = None, filename: Optional[str] = None
+) -> str:
+    """
+    Pick the input format from a Content-Type header or a file name.
+
+    Args:
+        content_type: e.g. "text/csv" or "application/x-ndjson"
+        filename: e.g. "users.csv" or "users.jsonl"
+
+    Returns:
+        CSV or NDJSON (the default).
+    """
+    if content_type and "csv" in content_type.lower():
+        return CSV
+    if filename and filename.lower().endswith(".csv"):
+        return CSV
+
+    return NDJSON
+
+
+def iter_ndjson(lines: Iterable[str]) -> Iterator[RowRecord]:
+    """Yield one record per non blank JSON Lines row."""
+    row = 0
+    for line in lines:
+        if not line.strip():
+            continue
+
+        row += 1
+        try:
+            value = json.loads(line)
+        except ValueError as err:
+            yield row, ValueError(f"Invalid JSON: {err}")
+            continue
+
+        if not isinstance(value, dict):
+            yield row, ValueError("Each line must be a JSON object")
+        else:
+            yield row, value
+
+
+def iter_csv(lines: Iterable[str]) -> Iterator[RowRecord]:
+    """Yield one record per CSV row; the first row holds the column names."""
+    reader = csv.DictReader(lines)
+
+    for row, value in enumerate(reader, start=1):
+        if None in value:
+            yield row, ValueError("Row has more columns than the header")
+        else:
+            yield row, {key.strip(): item for key, item in value.items() if key}
+
+
+def iter_records(lines: Iterable[str], fmt: str) -> Iterator[RowRecord]:
+    """
+    Parse rows lazily so large files are never fully loaded in memory.
+
+    Args:
+        lines: Text lines of the file or request body
+        fmt: CSV or NDJSON
+
+    Returns:
+        Iterator of (row number, fields or error).
+    """
+    return iter_csv(lines) if fmt == CSV else iter_ndjson(lines)
@@ -0,0 +1,94 @@
+import ipaddress
+from typing import Iterable, Optional
+
+
+class ClientIpResolver:
+    """
+    Finds the address of the client behind a request, for the per-IP limits.
+
+    On Lambda the address comes from the API Gateway ``requestContext``
+    (``identity.sourceIp`` or ``http.sourceIp``), which the client cannot
+    set. Elsewhere (ALB events, uvicorn behind a load balancer) it comes from
+    the peer of the connection, and ``X-Forwarded-For`` is only read when
+    that peer is one of ``trusted_proxies``: the hops are walked from the
+    right and the first one that is not a trusted proxy is the client. The
+    left-most values are whatever the client sent and are never used.
+    """
+
+    def __init__(self, trusted_proxies: Iterable[str] = ()):
+        """
+        Initialize the resolver.
+
+        Args:
+            trusted_proxies: Addresses or CIDR blocks of the load balancers
+                and proxies allowed to set ``X-Forwarded-For``
+        """
+        self.trusted_proxies = tuple(
+            ipaddress.ip_network(proxy.strip(), strict=False)
+            for proxy in trusted_proxies
+            if proxy.strip()
+        )
+
+    def from_scope(self, scope) -> Optional[str]:
+        """Client address of an ASGI ``scope`` (Mangum or a plain server)."""
+        event = scope.get("aws.event")
+        if event is not None:
+            source_ip = self.from_event(event)
+            if source_ip:
+                return source_ip
+
+        forwarded_for = [
+            value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+            if name == b"x-forwarded-for"
+        ]
+
+        # Mangum pone en client el X-Forwarded-For crudo de los eventos de
+        # ALB: ahí el peer es el ALB, que agrega la IP real al final del header
+        client = scope.get("client")
+        peer = client[0] if client and event is None else None
+
+        return self.resolve(peer, ",".join(forwarded_for) or None)
+
+    @staticmethod
+    def from_event(event: dict) -> Optional[str]:
+        """Source IP API Gateway recorded in a REST (v1) or HTTP API (v2) event."""
+        request_context = event.get("requestContext") or {}
+
+        return (request_context.get("http") or {}).get("sourceIp") or (
+            request_context.get("identity") or {}
+        ).get("sourceIp")
+
+    def resolve(
+        self, peer: Optional[str], forwarded_for: Optional[str]
+    ) -> Optional[str]:
+        """
+        Client address given the connection peer and ``X-Forwarded-For``.
+
+        Args:
+            peer: Address of the connection, None when it is a proxy outside
+                this process that always appends the client (ALB)
+            forwarded_for: Value of the ``X-Forwarded-For`` header(s)
+
+        Returns:
+            The first untrusted address, or None if there is none.
+        """
+        if peer is not None and not self._is_trusted(peer):
+            return peer
+
+        hops = [hop.strip() for hop in (forwarded_for or "").split(",")]
+        hops = [hop for hop in hops if hop]
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+
+        # Todos los saltos son proxies conocidos: el más lejano es el cliente
+        return hops[0] if hops else peer
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+
+        return any(ip in network for network in self.trusted_proxies)
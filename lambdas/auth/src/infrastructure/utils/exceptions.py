@@ -1,6 +1,12 @@
+import math
+
+from fastapi import Request, status
 from pydantic import ValidationError
 
+from src.domain.enums.messages import MessagesEnum
 from src.domain.models.dev_response import DevResponse
+from src.infrastructure.utils.json_response import FastJSONResponse, message_body
+from src.infrastructure.utils.resilience import CircuitOpenError
 
 
 def process_validation_error(err: ValidationError) -> DevResponse:
@@ -25,3 +31,17 @@ def process_validation_error(err: ValidationError) -> DevResponse:
             "errors": errors,
         },
     )
+
+
+async def circuit_open_handler(
+    request: Request, err: CircuitOpenError
+) -> FastJSONResponse:
+    """
+    Responde 503 con Retry-After cuando el circuit breaker de una dependencia
+    está abierto, en lugar de esperar a que la llamada falle.
+    """
+    return FastJSONResponse(
+        message_body(MessagesEnum.SERVICE_UNAVAILABLE),
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(math.ceil(err.retry_after_seconds), 1))},
+    )
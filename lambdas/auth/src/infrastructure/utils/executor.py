@@ -0,0 +1,47 @@
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the bounded thread pool used to run blocking AWS calls.
+
+    The pool is created on first use and sized with COGNITO_MAX_WORKERS so it
+    never holds more threads than the botocore connection pool can serve.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("COGNITO_MAX_WORKERS", "10")),
+                    thread_name_prefix="cognito",
+                )
+
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable in the bounded pool without blocking the event loop.
+
+    The current context is copied so context variables (container overrides,
+    request data) are visible from the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+
+    return await loop.run_in_executor(
+        get_executor(), partial(context.run, func, *args, **kwargs)
+    )
@@ -0,0 +1,45 @@
+import dataclasses
+import json
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    # orjson ya serializa dataclasses (también con __slots__) y enums; el
+    # módulo json no, así que ambos caminos quedan iguales.
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: getattr(value, field.name)
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+
+    return str(value)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, using orjson when installed.
+
+    Dataclasses, enums and pydantic models are serialized by field and value;
+    other unknown types are converted with ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+
+    return json.dumps(
+        value, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def dumps(value: Any) -> str:
+    """Same as dumps_bytes, as a string."""
+    return dumps_bytes(value).decode("utf-8")
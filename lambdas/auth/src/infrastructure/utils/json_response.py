@@ -0,0 +1,68 @@
+from typing import Any, Dict
+
+from starlette.responses import JSONResponse
+
+from src.domain.enums.messages import MessagesEnum
+from src.domain.models.dev_response import DevResponse
+from src.infrastructure.utils.json_encoder import dumps_bytes
+
+# {"mensaje": ..., "resultado": null} de cada mensaje, codificado una sola vez
+_MESSAGE_BODIES: Dict[str, bytes] = {
+    message.value: dumps_bytes({"mensaje": message.value, "resultado": None})
+    for message in MessagesEnum
+}
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with json_encoder (orjson when installed).
+
+    Dataclass results are serialized directly, without jsonable_encoder, and
+    already encoded ``bytes`` are sent as they are.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return dumps_bytes(content)
+
+
+def message_body(message: MessagesEnum) -> bytes:
+    """Encoded body of a response that only carries ``message``."""
+    return _MESSAGE_BODIES[message.value]
+
+
+def encode_result(result: Any) -> bytes:
+    """
+    Serialize the result of a service in a single pass.
+
+    Results with only a message (``resultado`` None), like most error
+    responses, reuse their pre-encoded body.
+
+    Args:
+        result: Response dataclass (mensaje, resultado) or plain dict
+
+    Returns:
+        The JSON body.
+    """
+    if getattr(result, "resultado", True) is None:
+        body = _MESSAGE_BODIES.get(result.mensaje)
+        if body is not None:
+            return body
+
+    return dumps_bytes(result)
+
+
+def to_response(process: DevResponse) -> FastJSONResponse:
+    """
+    Build the HTTP response of a service result.
+
+    Route handlers return it directly, so FastAPI neither validates nor
+    re-encodes the result; their ``response_model`` only documents it.
+    """
+    return FastJSONResponse(
+        encode_result(process.result),
+        status_code=process.statusCode,
+        headers=process.headers,
+    )
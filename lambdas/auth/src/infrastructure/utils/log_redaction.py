@@ -0,0 +1,165 @@
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional
+
+REDACTED = "***"
+
+# Campos que nunca deben llegar a CloudWatch, en cualquier nivel de anidación
+DEFAULT_DENY_KEYS: FrozenSet[str] = frozenset(
+    {
+        "password",
+        "repeat_password",
+        "session",
+        "authenticator_code",
+        "mfa_code",
+        "confirmation_code",
+        "access_token",
+        "id_token",
+        "refresh_token",
+        "authorization",
+        "secret",
+        "client_secret",
+        "Session",
+        "AccessToken",
+        "IdToken",
+        "RefreshToken",
+        "SecretCode",
+    }
+)
+
+
+@dataclass(frozen=True)
+class RedactionRule:
+    """
+    Fields of a model that may be logged.
+
+    When ``allow`` is set only those fields are kept; ``deny`` fields are
+    masked on top of DEFAULT_DENY_KEYS.
+    """
+
+    allow: Optional[FrozenSet[str]] = None
+    deny: FrozenSet[str] = frozenset()
+
+
+MODEL_RULES: Dict[str, RedactionRule] = {
+    "SignInRequest": RedactionRule(allow=frozenset({"user"})),
+    "SignUpRequest": RedactionRule(allow=frozenset({"email", "name"})),
+    "SignInVerifyRequest": RedactionRule(allow=frozenset({"user"})),
+    "ConfirmMFARequest": RedactionRule(allow=frozenset()),
+}
+
+
+class LogRedactor:
+    """
+    Masks secrets and truncates large values before a log record is serialized.
+
+    pydantic models and dataclasses are filtered with the rule registered for
+    their class name, mappings by key, and long strings / collections are cut
+    so a single log line stays small.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Mapping[str, RedactionRule]] = None,
+        deny_keys: Iterable[str] = DEFAULT_DENY_KEYS,
+        max_string_length: int = 256,
+        max_items: int = 20,
+        max_depth: int = 5,
+    ):
+        """
+        Initialize the redactor.
+
+        Args:
+            rules: Rules per model class name
+            deny_keys: Keys masked everywhere
+            max_string_length: Strings longer than this are truncated
+            max_items: Maximum number of items kept from lists and mappings
+            max_depth: Nesting level after which values are replaced by a marker
+        """
+        self.rules = dict(MODEL_RULES if rules is None else rules)
+        self.deny_keys = frozenset(deny_keys)
+        self.max_string_length = max_string_length
+        self.max_items = max_items
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_env(cls) -> "LogRedactor":
+        """
+        Build a redactor from LOG_REDACT_EXTRA_KEYS (comma separated),
+        LOG_MAX_FIELD_LENGTH and LOG_MAX_ITEMS.
+        """
+        extra_keys = [
+            key.strip()
+            for key in os.getenv("LOG_REDACT_EXTRA_KEYS", "").split(",")
+            if key.strip()
+        ]
+
+        return cls(
+            deny_keys=DEFAULT_DENY_KEYS | frozenset(extra_keys),
+            max_string_length=int(os.getenv("LOG_MAX_FIELD_LENGTH", "256")),
+            max_items=int(os.getenv("LOG_MAX_ITEMS", "20")),
+        )
+
+    def redact(self, value: Any, depth: int = 0) -> Any:
+        """Return a log-safe version of ``value``."""
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+
+        if isinstance(value, str):
+            return self._truncate(value)
+
+        if depth >= self.max_depth:
+            return f"<{type(value).__name__}>"
+
+        if isinstance(value, Mapping):
+            return self._redact_mapping(value, None, depth)
+
+        if hasattr(value, "model_fields"):
+            rule = self.rules.get(type(value).__name__)
+            return self._redact_mapping(vars(value), rule, depth)
+
+        # Las dataclasses de respuesta usan __slots__ y no tienen __dict__
+        if hasattr(value, "__dataclass_fields__"):
+            rule = self.rules.get(type(value).__name__)
+            fields = {name: getattr(value, name) for name in value.__dataclass_fields__}
+            return self._redact_mapping(fields, rule, depth)
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = [
+                self.redact(item, depth + 1) for item in list(value)[: self.max_items]
+            ]
+            if len(value) > self.max_items:
+                items.append(f"...(+{len(value) - self.max_items} items)")
+            return items
+
+        return self._truncate(str(value))
+
+    def _redact_mapping(
+        self, mapping: Mapping, rule: Optional[RedactionRule], depth: int
+    ) -> Dict[str, Any]:
+        redacted: Dict[str, Any] = {}
+
+        for index, (key, item) in enumerate(mapping.items()):
+            if index >= self.max_items:
+                redacted["..."] = f"+{len(mapping) - self.max_items} keys"
+                break
+
+            if rule is not None:
+                if rule.allow is not None and key not in rule.allow:
+                    continue
+                if key in rule.deny:
+                    redacted[key] = REDACTED
+                    continue
+
+            if key in self.deny_keys:
+                redacted[key] = REDACTED
+            else:
+                redacted[key] = self.redact(item, depth + 1)
+
+        return redacted
+
+    def _truncate(self, value: str) -> str:
+        if len(value) <= self.max_string_length:
+            return value
+
+        return f"{value[: self.max_string_length]}...(+{len(value) - self.max_string_length})"
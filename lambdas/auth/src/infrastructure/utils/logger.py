@@ -1,16 +1,41 @@
-import json
-import os
-from logging import Formatter, NullHandler, StreamHandler, getLogger
+import sys
+import threading
+import time
+from logging import (
+    CRITICAL,
+    DEBUG,
+    ERROR,
+    INFO,
+    WARNING,
+    Formatter,
+    StreamHandler,
+    getLogger,
+)
 from typing import Any, Dict, Optional
 
+from src.infrastructure.utils.json_encoder import dumps
+from src.infrastructure.utils.log_redaction import LogRedactor
+from src.infrastructure.utils.request_context import get_request_context
+
+_configured_loggers = set()
+_configure_lock = threading.Lock()
+
 
 class CustomLogger:
     """
-    A custom logger class optimized for AWS Lambda environments.
+    Structured JSON logger optimized for AWS Lambda environments.
+
+    Each call writes one JSON object per line with the request id, path and
+    elapsed time of the current request. Disabled levels return before any
+    formatting, extra fields go through a LogRedactor before serialization,
+    and the underlying handler is configured once per process.
     """
 
     def __init__(
-        self, logger_name: Optional[str] = None, level_log: str = "INFO"
+        self,
+        logger_name: Optional[str] = None,
+        level_log: str = "INFO",
+        redactor: Optional[LogRedactor] = None,
     ) -> None:
         """
         Initialize a new CustomLogger instance.
@@ -18,84 +43,85 @@ class CustomLogger:
         self.logger_name = logger_name or __name__
         self.level_log = level_log.upper()
         self.logger = getLogger(self.logger_name)
-        self.is_lambda = "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+        self.redactor = redactor or LogRedactor.from_env()
         self._setup_logger()
 
     def _setup_logger(self) -> None:
-        """Configure the logger based on the environment."""
-        # Clear any existing handlers
-        if self.logger.handlers:
+        """Configure the logger once per process."""
+        with _configure_lock:
+            self.logger.setLevel(self.level_log)
+
+            if self.logger_name in _configured_loggers:
+                return
+
+            # One line per record; the JSON is built by _log
+            handler = StreamHandler(sys.stdout)
+            handler.setFormatter(Formatter("%(message)s"))
+
             self.logger.handlers.clear()
+            self.logger.addHandler(handler)
+            self.logger.propagate = False
+
+            _configured_loggers.add(self.logger_name)
+
+    def _log(
+        self, level: int, message: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+
+        started = time.perf_counter()
+        record: Dict[str, Any] = {
+            "timestamp": round(time.time(), 3),
+            "level": _LEVEL_NAMES[level],
+            "message": self.redactor.redact(message),
+        }
+
+        context = get_request_context()
+        if context is not None:
+            record["request_id"] = context.request_id
+            record["path"] = context.path
+            record["elapsed_ms"] = context.elapsed_ms()
 
-        # Set logging level
-        self.logger.setLevel(self.level_log)
-
-        if not self.is_lambda:
-            # Only add StreamHandler if not in Lambda environment
-            console_handler = StreamHandler()
-            console_handler.setLevel(self.level_log)
-
-            formatter = Formatter(
-                fmt="%(name)s: %(asctime)s | %(levelname)s | %(filename)s:%(lineno)s | %(process)d >>> %(message)s",
-                datefmt="%m/%d/%Y %I:%M:%S %p",
-            )
-
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
-        else:
-            # In Lambda, we'll just use print for the actual logging
-            self.logger.addHandler(NullHandler())
-
-    def _format_message(
-        self, message: str, extra: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """Format the message with extra parameters."""
         if extra:
-            try:
-                extra_str = json.dumps(extra, default=str)
-                return f"{message} | {extra_str}"
-            except Exception:
-                return f"{message} | {str(extra)}"
-        return message
+            record.update(self.redactor.redact(extra))
+
+        try:
+            line = dumps(record)
+        except Exception:
+            record = {key: str(value) for key, value in record.items()}
+            line = dumps(record)
+
+        self.logger.log(level, line)
+
+        if context is not None:
+            context.add_phase("Logging", (time.perf_counter() - started) * 1000)
 
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log an info message."""
-        formatted_message = self._format_message(message, extra)
-        if self.is_lambda:
-            print(
-                formatted_message
-            )  # Lambda will automatically add timestamp and request ID
-        else:
-            self.logger.info(formatted_message)
+        self._log(INFO, message, extra)
 
     def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log an error message."""
-        formatted_message = self._format_message(message, extra)
-        if self.is_lambda:
-            print(f"ERROR: {formatted_message}")
-        else:
-            self.logger.error(formatted_message)
+        self._log(ERROR, message, extra)
 
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log a debug message."""
-        formatted_message = self._format_message(message, extra)
-        if self.is_lambda:
-            print(f"DEBUG: {formatted_message}")
-        else:
-            self.logger.debug(formatted_message)
+        self._log(DEBUG, message, extra)
 
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log a warning message."""
-        formatted_message = self._format_message(message, extra)
-        if self.is_lambda:
-            print(f"WARNING: {formatted_message}")
-        else:
-            self.logger.warning(formatted_message)
+        self._log(WARNING, message, extra)
 
     def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log a critical message."""
-        formatted_message = self._format_message(message, extra)
-        if self.is_lambda:
-            print(f"CRITICAL: {formatted_message}")
-        else:
-            self.logger.critical(formatted_message)
+        self._log(CRITICAL, message, extra)
+
+
+_LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+    CRITICAL: "CRITICAL",
+}
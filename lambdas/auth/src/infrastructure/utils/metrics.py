@@ -0,0 +1,149 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from src.domain.enums.paths_enum import PathsEnum
+from src.infrastructure.utils.json_encoder import dumps
+from src.infrastructure.utils.request_context import (
+    RequestContext,
+    get_request_context,
+)
+
+KNOWN_PATHS = frozenset(path.value for path in PathsEnum)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Add the duration of the block to ``phase`` of the current request.
+
+    Outside of a request (e.g. warm-up) the block just runs.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        context = get_request_context()
+        if context is not None:
+            context.add_phase(phase, (time.perf_counter() - started) * 1000)
+
+
+def record_cognito_error(error_code: str) -> None:
+    """Remember the Cognito error code of the current request for its metrics."""
+    context = get_request_context()
+    if context is not None:
+        context.cognito_error_code = error_code
+
+
+class MetricsEmitter:
+    """
+    Writes CloudWatch Embedded Metric Format lines to stdout.
+
+    CloudWatch Logs extracts the metrics from the log line, so no network
+    call is made from the function.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "AuthApi",
+        service: str = "auth",
+        enabled: bool = True,
+    ):
+        """
+        Initialize the emitter.
+
+        Args:
+            namespace: CloudWatch metrics namespace
+            service: Value of the Service dimension
+            enabled: When False nothing is written
+        """
+        self.namespace = namespace
+        self.service = service
+        self.enabled = enabled
+        self._cold_start = True
+
+    @classmethod
+    def from_env(cls) -> "MetricsEmitter":
+        return cls(
+            namespace=os.getenv("METRICS_NAMESPACE", "AuthApi"),
+            service=os.getenv("METRICS_SERVICE", "auth"),
+            enabled=os.getenv("METRICS_ENABLED", "true").lower() == "true",
+        )
+
+    def emit(
+        self,
+        metrics: Dict[str, float],
+        dimensions: Dict[str, str],
+        units: Optional[Dict[str, str]] = None,
+        properties: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """
+        Write one EMF record.
+
+        Args:
+            metrics: Metric name -> value
+            dimensions: Dimension name -> value, emitted as one dimension set
+            units: Metric name -> unit, Milliseconds by default
+            properties: Extra searchable fields that are not metrics
+        """
+        if not self.enabled or not metrics:
+            return
+
+        units = units or {}
+        dimensions = {"Service": self.service, **dimensions}
+        definitions: List[Dict[str, str]] = [
+            {"Name": name, "Unit": units.get(name, "Milliseconds")} for name in metrics
+        ]
+
+        record = {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": self.namespace,
+                        "Dimensions": [list(dimensions)],
+                        "Metrics": definitions,
+                    }
+                ],
+            },
+            **(properties or {}),
+            **dimensions,
+            **{name: round(value, 3) for name, value in metrics.items()},
+        }
+
+        sys.stdout.write(dumps(record) + "\n")
+
+    def emit_request(self, context: RequestContext, status_code: int) -> None:
+        """Emit latency per phase for a finished request."""
+        total = context.elapsed_ms()
+        phases = {f"{name}Latency": value for name, value in context.phases.items()}
+
+        metrics = {
+            "Latency": total,
+            # Routing, validación pydantic y serialización de la respuesta
+            "OverheadLatency": max(total - sum(context.phases.values()), 0.0),
+            **phases,
+        }
+        units = {}
+
+        if context.retries:
+            metrics["Retries"] = context.retries
+            units["Retries"] = "Count"
+
+        if self._cold_start:
+            metrics["ColdStart"] = 1
+            units["ColdStart"] = "Count"
+            self._cold_start = False
+
+        self.emit(
+            metrics=metrics,
+            units=units,
+            dimensions={
+                "Path": context.path if context.path in KNOWN_PATHS else "other",
+                "StatusCode": str(status_code),
+                "CognitoErrorCode": context.cognito_error_code or "none",
+            },
+            properties={"request_id": context.request_id, "method": context.method},
+        )
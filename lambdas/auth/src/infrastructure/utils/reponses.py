@@ -1,10 +1,11 @@
 import json
 
 from src.domain.models.dev_response import DevResponse
+from src.infrastructure.utils.json_encoder import dumps
 
 
 class ResponsesHelper:
     @staticmethod
     def to_json(reponse: DevResponse) -> str:
-        dump = json.dumps(reponse.__dict__)
+        dump = dumps(reponse)
         return json.loads(dump)
@@ -0,0 +1,43 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class RequestContext:
+    request_id: str
+    path: Optional[str] = None
+    method: Optional[str] = None
+    lambda_context: Optional[Any] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    # Milisegundos acumulados por fase (Cognito, SecretsManager, Logging, ...)
+    phases: Dict[str, float] = field(default_factory=dict)
+    cognito_error_code: Optional[str] = None
+    # Reintentos hechos a dependencias remotas durante el request
+    retries: int = 0
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000, 3)
+
+    def add_phase(self, name: str, duration_ms: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + duration_ms
+
+
+_current: ContextVar[Optional[RequestContext]] = ContextVar(
+    "request_context", default=None
+)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """Return the context of the request being handled, if any."""
+    return _current.get()
+
+
+def set_request_context(context: Optional[RequestContext]):
+    """Set the current request context and return the token to reset it."""
+    return _current.set(context)
+
+
+def reset_request_context(token) -> None:
+    _current.reset(token)
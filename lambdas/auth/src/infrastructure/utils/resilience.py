@@ -0,0 +1,318 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, FrozenSet, Optional, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from src.infrastructure.utils.request_context import get_request_context
+
+# LimitExceededException no está aquí: en Cognito significa que un usuario
+# agotó sus intentos (confirm_sign_up, resend, ...), no que el servicio esté
+# saturado. Reintentarlo o contarlo en el breaker dejaría que un solo usuario
+# abriera el circuito para todos.
+THROTTLING_ERROR_CODES: FrozenSet[str] = frozenset(
+    {
+        "TooManyRequestsException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+
+SERVER_ERROR_CODES: FrozenSet[str] = frozenset(
+    {"InternalErrorException", "InternalFailure", "ServiceUnavailable"}
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_after_seconds: float):
+        super().__init__(f"Circuit breaker '{name}' is open")
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitState(Enum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+def is_throttling_error(err: Exception) -> bool:
+    return (
+        isinstance(err, ClientError)
+        and err.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    )
+
+
+def is_server_error(err: Exception) -> bool:
+    """5xx responses and transport errors (timeouts, connection resets)."""
+    if isinstance(err, BotoCoreError):
+        return True
+
+    if not isinstance(err, ClientError):
+        return False
+
+    status_code = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    code = err.response.get("Error", {}).get("Code")
+
+    return status_code >= 500 or code in SERVER_ERROR_CODES
+
+
+def remaining_time_ms() -> Optional[float]:
+    """Milliseconds left in the current Lambda invocation, None outside Lambda."""
+    context = get_request_context()
+    lambda_context = context.lambda_context if context is not None else None
+
+    if lambda_context is None or not hasattr(
+        lambda_context, "get_remaining_time_in_millis"
+    ):
+        return None
+
+    return lambda_context.get_remaining_time_in_millis()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Jittered exponential backoff.
+
+    Attempt ``n`` (0 based) waits a random time between 0 and
+    ``min(max_delay, base_delay * 2**n)`` ("full jitter"), and no retry is
+    made when less than ``min_remaining_ms`` would be left of the invocation
+    after waiting.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    min_remaining_ms: float = 1500
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        return rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def can_retry(self, attempt: int, delay: float) -> bool:
+        if attempt + 1 >= self.max_attempts:
+            return False
+
+        remaining = remaining_time_ms()
+        return remaining is None or remaining - delay * 1000 > self.min_remaining_ms
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker.
+
+    While CLOSED, the outcome of every call in the last ``window_seconds`` is
+    kept; once at least ``minimum_calls`` were made and the failure ratio
+    reaches ``failure_threshold`` the breaker OPENs and calls fail fast for
+    ``open_seconds``. Then it is HALF_OPEN: ``half_open_max_calls`` trial calls
+    are let through, closing it on success and opening it again on failure.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        window_seconds: float = 30,
+        open_seconds: float = 30,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str, CircuitState], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Name of the protected dependency, used in errors and metrics
+            failure_threshold: Failure ratio (0-1) that opens the breaker
+            minimum_calls: Calls in the window needed before it can open
+            window_seconds: Length of the sliding window
+            open_seconds: Time calls fail fast before trying again
+            half_open_max_calls: Trial calls allowed while half open
+            on_state_change: Called with (name, new state) on every transition
+            clock: Monotonic clock, injectable for tests
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self.clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state(self.clock())
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError when the call must not be made."""
+        with self._lock:
+            now = self.clock()
+            state = self._current_state(now)
+
+            if state is CircuitState.OPEN:
+                raise CircuitOpenError(
+                    self.name, self._opened_at + self.open_seconds - now
+                )
+
+            if state is CircuitState.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 1)
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+                return
+            self._record(False)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self.clock()
+            state = self._current_state(now)
+
+            # Llamadas lentas que empezaron antes de abrir el circuito: no
+            # vuelven a abrirlo ni alargan open_seconds
+            if state is CircuitState.OPEN:
+                return
+
+            if state is CircuitState.HALF_OPEN:
+                self._opened_at = now
+                self._transition(CircuitState.OPEN)
+                return
+
+            self._record(True)
+
+            calls = len(self._outcomes)
+            if (
+                calls >= self.minimum_calls
+                and self._failures / calls >= self.failure_threshold
+            ):
+                self._opened_at = now
+                self._transition(CircuitState.OPEN)
+
+    def _current_state(self, now: float) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and now >= self._opened_at + self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+        return self._state
+
+    def _record(self, failed: bool) -> None:
+        now = self.clock()
+        self._outcomes.append((now, failed))
+        self._failures += failed
+
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            _, old_failed = self._outcomes.popleft()
+            self._failures -= old_failed
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._half_open_calls = 0
+        self._outcomes.clear()
+        self._failures = 0
+
+        if self.on_state_change is not None:
+            self.on_state_change(self.name, state)
+
+
+class ResilientCaller:
+    """
+    Runs calls to a remote dependency through a CircuitBreaker and retries
+    throttling (and, for idempotent calls, server) errors with a RetryPolicy.
+    """
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the caller.
+
+        Args:
+            retry_policy: Backoff and attempts
+            circuit_breaker: Breaker of the dependency, None to disable it
+            sleep: Sleep function, injectable for tests
+            rng: Random generator used for the jitter
+        """
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+
+    def call(self, func: Callable, idempotent: bool = False, **kwargs):
+        """
+        Call ``func(**kwargs)``.
+
+        Args:
+            func: Remote call
+            idempotent: Also retry 5xx and transport errors, whose request may
+                have been processed
+            kwargs: Arguments of the call
+
+        Returns:
+            The result of the call.
+        """
+        attempt = 0
+
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_call()
+
+            try:
+                result = func(**kwargs)
+            except Exception as err:
+                throttled = is_throttling_error(err)
+                server_error = is_server_error(err)
+
+                if self.circuit_breaker is not None:
+                    if throttled or server_error:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+
+                if not (throttled or (server_error and idempotent)):
+                    raise
+
+                delay = self.retry_policy.delay(attempt, self.rng)
+                if not self.retry_policy.can_retry(attempt, delay):
+                    raise
+
+                self._backoff(delay)
+                attempt += 1
+                continue
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+
+            return result
+
+    def _backoff(self, delay: float) -> None:
+        context = get_request_context()
+        if context is not None:
+            context.retries += 1
+            context.add_phase("Backoff", delay * 1000)
+
+        self.sleep(delay)
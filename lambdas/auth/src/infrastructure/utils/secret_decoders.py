@@ -0,0 +1,144 @@
+import dataclasses
+import json
+import os
+from typing import Any, Dict, Generic, List, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+T = TypeVar("T")
+
+
+class SecretDecoder(Generic[T]):
+    """
+    Converts the SecretString of a secret into ``secret_type``.
+
+    The pydantic validator of the type is built once, here, instead of
+    inspecting the type on every fetch. Fields can be overridden with
+    environment variables named ``env_prefix`` + field name in upper case
+    (e.g. COGNITO_CONFIG_CLIENT_ID); the overrides are read when the decoder
+    is created, so they behave like the rest of the configuration.
+    """
+
+    def __init__(
+        self,
+        secret_type: Type[T],
+        env_prefix: Optional[str] = None,
+        environ: Mapping[str, str] = os.environ,
+    ):
+        """
+        Initialize the decoder.
+
+        Args:
+            secret_type: str, dict, a dataclass or a pydantic model
+            env_prefix: Prefix of the variables that override fields
+            environ: Environment to read the overrides from
+        """
+        self.secret_type = secret_type
+        self._adapter: Optional[TypeAdapter] = (
+            None if secret_type is str else TypeAdapter(secret_type)
+        )
+        self.overrides = (
+            self._read_overrides(secret_type, env_prefix, environ) if env_prefix else {}
+        )
+
+    def decode(self, secret_string: str, secret_name: str) -> T:
+        """
+        Decode a SecretString.
+
+        Args:
+            secret_string: The string representation of the secret.
+            secret_name: The name of the secret, used in error messages.
+
+        Returns:
+            The secret as ``secret_type``.
+
+        Raises:
+            ValueError: If the secret is not valid JSON or does not match the type.
+        """
+        if self._adapter is None:
+            return secret_string
+
+        try:
+            if not self.overrides:
+                # JSON y validación en una sola pasada de pydantic-core
+                return self._adapter.validate_json(secret_string)
+
+            return self._adapter.validate_python(
+                {**json.loads(secret_string), **self.overrides}
+            )
+        except (ValidationError, ValueError, TypeError) as e:
+            raise ValueError(
+                f"Could not convert secret {secret_name} to "
+                f"{self.secret_type.__name__}: {e}"
+            ) from e
+
+    @staticmethod
+    def _read_overrides(
+        secret_type: Type, env_prefix: str, environ: Mapping[str, str]
+    ) -> Dict[str, Any]:
+        if dataclasses.is_dataclass(secret_type):
+            field_types = {
+                field.name: field.type for field in dataclasses.fields(secret_type)
+            }
+        elif isinstance(secret_type, type) and issubclass(secret_type, BaseModel):
+            field_types = {
+                name: field.annotation
+                for name, field in secret_type.model_fields.items()
+            }
+        else:
+            raise TypeError(
+                f"Environment overrides need a dataclass or pydantic model, "
+                f"not {secret_type!r}"
+            )
+
+        overrides = {}
+        for name, field_type in field_types.items():
+            raw = environ.get(f"{env_prefix}{name.upper()}")
+            if raw is None:
+                continue
+
+            # Los campos que no son texto (dict, int, ...) se escriben en JSON
+            overrides[name] = raw if field_type in (str, "str") else json.loads(raw)
+
+        return overrides
+
+
+class SecretDecoders:
+    """
+    Registry of the decoder of each secret name.
+
+    Secrets without a registered type are decoded with ``default_type``.
+    """
+
+    def __init__(self, default_type: Type = dict):
+        self.default = SecretDecoder(default_type)
+        self._decoders: Dict[str, SecretDecoder] = {}
+
+    def register(
+        self,
+        secret_name: str,
+        secret_type: Type[T],
+        env_prefix: Optional[str] = None,
+        environ: Mapping[str, str] = os.environ,
+    ) -> SecretDecoder[T]:
+        """
+        Declare the type of a secret.
+
+        Args:
+            secret_name: Name or ARN used to fetch the secret
+            secret_type: Type the secret is decoded into
+            env_prefix: Prefix of the variables that override its fields
+
+        Returns:
+            The compiled decoder.
+        """
+        decoder = SecretDecoder(secret_type, env_prefix=env_prefix, environ=environ)
+        self._decoders[secret_name] = decoder
+        return decoder
+
+    def for_secret(self, secret_name: str) -> SecretDecoder:
+        return self._decoders.get(secret_name, self.default)
+
+    def names(self) -> List[str]:
+        """Names of the registered secrets, in registration order."""
+        return list(self._decoders)
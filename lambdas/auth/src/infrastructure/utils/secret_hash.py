@@ -0,0 +1,41 @@
+import base64
+import hashlib
+import hmac
+from functools import lru_cache
+
+
+class SecretHashCalculator:
+    """
+    SECRET_HASH of Cognito app clients that have a client secret:
+    Base64(HMAC-SHA256(client_secret, username + client_id)).
+
+    The HMAC keyed with the client secret is prepared once and copied for each
+    username, and the last ``cache_size`` hashes are kept, so repeated calls
+    for the same user (sign in, then the MFA challenge) cost a dict lookup.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, cache_size: int = 1024):
+        """
+        Initialize the calculator.
+
+        Args:
+            client_id: Id of the app client
+            client_secret: Secret of the app client
+            cache_size: Hashes kept, by username
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self._keyed = hmac.new(client_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._suffix = client_id.encode("utf-8")
+        self.compute = lru_cache(maxsize=cache_size)(self._compute)
+
+    def matches(self, client_id: str, client_secret: str) -> bool:
+        """Whether this calculator was built for the given client credentials."""
+        return self.client_id == client_id and hmac.compare_digest(
+            self.client_secret.encode("utf-8"), client_secret.encode("utf-8")
+        )
+
+    def _compute(self, username: str) -> str:
+        digest = self._keyed.copy()
+        digest.update(username.encode("utf-8") + self._suffix)
+        return base64.b64encode(digest.digest()).decode("ascii")
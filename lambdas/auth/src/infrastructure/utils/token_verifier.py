@@ -0,0 +1,224 @@
+import base64
+import json
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, Optional
+
+from src.domain.models.sm_lambda_auth_cognito import SmLambdaAuthCognito
+from src.infrastructure.utils.logger import CustomLogger
+
+
+class TokenVerificationError(Exception):
+    """Raised when a token is certainly invalid (bad signature, expired, ...)."""
+
+
+class JWKSCache:
+    """
+    Per-container cache of a JSON Web Key Set.
+
+    Keys are reloaded after ``ttl_seconds`` or when a token is signed with an
+    unknown ``kid`` (key rotation), at most once every ``min_refresh_seconds``.
+    """
+
+    def __init__(
+        self,
+        jwks_url_provider: Callable[[], str],
+        ttl_seconds: float = 3600,
+        min_refresh_seconds: float = 60,
+        timeout_seconds: float = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            jwks_url_provider: Callable returning the JWKS url
+            ttl_seconds: Time a downloaded key set is used before reloading
+            min_refresh_seconds: Minimum time between reloads on unknown kids
+            timeout_seconds: HTTP timeout for the JWKS download
+            clock: Monotonic clock, injectable for tests
+        """
+        self.jwks_url_provider = jwks_url_provider
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_seconds = min_refresh_seconds
+        self.timeout_seconds = timeout_seconds
+        self.clock = clock
+
+        self._url: Optional[str] = None
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get_key(self, kid: str) -> Optional[Any]:
+        """
+        Return the public key for ``kid``, reloading the key set if needed.
+
+        Raises:
+            OSError: If the key set can not be downloaded and none is cached.
+        """
+        url = self.jwks_url_provider()
+
+        if self._needs_load(url, kid, self.clock()):
+            with self._lock:
+                # Otro request pudo haber cargado las llaves mientras esperábamos
+                now = self.clock()
+                if self._needs_load(url, kid, now):
+                    if self._fetched_at is None or url != self._url:
+                        self._load(url)
+                    else:
+                        self._reload(url, now)
+
+        return self._keys.get(kid)
+
+    def warm_up(self) -> None:
+        """Download the key set ahead of the first request."""
+        with self._lock:
+            self._load(self.jwks_url_provider())
+
+    def _needs_load(self, url: str, kid: str, now: float) -> bool:
+        if self._fetched_at is None or url != self._url:
+            return True
+
+        if now - self._fetched_at >= self.ttl_seconds:
+            return True
+
+        # Kid desconocido: Cognito pudo haber rotado las llaves
+        return (
+            kid not in self._keys and now - self._fetched_at >= self.min_refresh_seconds
+        )
+
+    def _reload(self, url: str, now: float) -> None:
+        try:
+            self._load(url)
+        except (OSError, ValueError):
+            if not self._keys:
+                raise
+
+            # Keep serving the known keys and try again after min_refresh_seconds
+            self._fetched_at = now - self.ttl_seconds + self.min_refresh_seconds
+
+    def _load(self, url: str) -> None:
+        """Download the key set; callers hold ``_lock``."""
+        from authlib.jose import JsonWebKey
+
+        with urllib.request.urlopen(url, timeout=self.timeout_seconds) as response:
+            jwks = json.loads(response.read())
+
+        self._keys = {
+            key["kid"]: JsonWebKey.import_key(key) for key in jwks.get("keys", [])
+        }
+        self._url = url
+        self._fetched_at = self.clock()
+
+
+class CognitoAccessTokenVerifier:
+    """
+    Local pre-check for Cognito access tokens.
+
+    Validates signature, ``exp``, ``iss``, ``client_id`` and ``token_use``
+    before the token is forwarded to Cognito, so garbage or expired tokens are
+    rejected without a network call. When the key set can not be downloaded
+    the check is skipped and Cognito stays the source of truth.
+    """
+
+    def __init__(
+        self,
+        logger: CustomLogger,
+        cognito_configs_provider: Callable[[], SmLambdaAuthCognito],
+        jwks_cache: Optional[JWKSCache] = None,
+        jwks_ttl_seconds: float = 3600,
+        jwks_min_refresh_seconds: float = 60,
+        leeway_seconds: int = 5,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            logger: Logger object
+            cognito_configs_provider: Callable returning the Cognito configuration
+            jwks_cache: Key set cache, built from the configuration when omitted
+            jwks_ttl_seconds: TTL of the key set cache built by default
+            jwks_min_refresh_seconds: Minimum time between reloads on unknown kids
+            leeway_seconds: Clock skew tolerated on ``exp``
+        """
+        self.logger = logger
+        self.cognito_configs_provider = cognito_configs_provider
+        self.jwks_cache = jwks_cache or JWKSCache(
+            jwks_url_provider=lambda: f"{self.issuer}/.well-known/jwks.json",
+            ttl_seconds=jwks_ttl_seconds,
+            min_refresh_seconds=jwks_min_refresh_seconds,
+        )
+        self.leeway_seconds = leeway_seconds
+
+    @property
+    def issuer(self) -> str:
+        return self.cognito_configs_provider().authority.rstrip("/")
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify an access token.
+
+        Args:
+            token: Raw JWT, without the "Bearer " prefix
+
+        Returns:
+            The token claims, or None when the check could not be performed.
+
+        Raises:
+            TokenVerificationError: If the token is invalid.
+        """
+        from authlib.jose import JsonWebToken
+        from authlib.jose.errors import JoseError
+
+        kid = self._get_kid(token)
+
+        try:
+            key = self.jwks_cache.get_key(kid)
+        except (OSError, ValueError) as err:
+            self.logger.warning(
+                "JWKS unavailable, skipping local token check",
+                extra={"error": str(err)},
+            )
+            return None
+
+        if key is None:
+            raise TokenVerificationError("Unknown signing key")
+
+        try:
+            claims = JsonWebToken(["RS256"]).decode(
+                token,
+                key,
+                claims_options={
+                    "iss": {"essential": True, "value": self.issuer},
+                    "exp": {"essential": True},
+                    "client_id": {
+                        "essential": True,
+                        "value": self.cognito_configs_provider().client_id,
+                    },
+                    "token_use": {"essential": True, "value": "access"},
+                },
+            )
+            claims.validate(leeway=self.leeway_seconds)
+        except JoseError as err:
+            raise TokenVerificationError(str(err)) from err
+
+        return dict(claims)
+
+    def warm_up(self) -> None:
+        """Download the signing keys ahead of the first request."""
+        self.jwks_cache.warm_up()
+
+    @staticmethod
+    def _get_kid(token: str) -> str:
+        try:
+            header = token.split(".")[0]
+            padded = header + "=" * (-len(header) % 4)
+            kid = json.loads(base64.urlsafe_b64decode(padded)).get("kid")
+        except (ValueError, AttributeError) as err:
+            raise TokenVerificationError("Malformed token") from err
+
+        if not kid:
+            raise TokenVerificationError("Token without kid")
+
+        return kid
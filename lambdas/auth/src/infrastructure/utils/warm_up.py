@@ -0,0 +1,84 @@
+from typing import Any, Mapping
+
+from fastapi import APIRouter
+
+# Origen de los eventos que envía serverless-plugin-warmup
+WARMUP_PLUGIN_SOURCE = "serverless-plugin-warmup"
+
+
+def is_warm_up_event(event: Any) -> bool:
+    """
+    Tell whether a Lambda event is a keep-warm ping instead of an HTTP request.
+
+    Accepted shapes:
+        - ``{"warmer": true, ...}``: custom payload, e.g. the Input of an
+          EventBridge schedule
+        - ``{"source": "serverless-plugin-warmup"}``
+        - A bare EventBridge "Scheduled Event"
+
+    Args:
+        event: Raw event received by lambda_handler
+
+    Returns:
+        True when the event should not be routed to the API.
+    """
+    if not isinstance(event, Mapping):
+        return False
+
+    warmer = event.get("warmer")
+    if warmer is True or str(warmer).lower() == "true":
+        return True
+
+    source = event.get("source")
+    if source == WARMUP_PLUGIN_SOURCE:
+        return True
+
+    return source == "aws.events" and event.get("detail-type") == "Scheduled Event"
+
+
+def warm_up_connections(event: Mapping, default: int = 0) -> int:
+    """
+    Number of Cognito connections the warm-up should open.
+
+    Args:
+        event: Warm-up event, may carry ``connections``
+        default: Value used when the event does not set it
+
+    Returns:
+        A non negative number of connections.
+    """
+    try:
+        return max(int(event.get("connections", default)), 0)
+    except (TypeError, ValueError):
+        return max(default, 0)
+
+
+def warm_up_validators(*routers: APIRouter) -> int:
+    """
+    Run the request body validator of every route of ``routers`` once.
+
+    pydantic builds its validators on import, but the first validation still
+    pays for lazy imports and the error formatting path. An empty body is
+    validated, so every route goes through that path without side effects.
+
+    Args:
+        routers: Routers included in the application
+
+    Returns:
+        Number of validators exercised.
+    """
+    exercised = 0
+
+    for route in (route for router in routers for route in router.routes):
+        body_field = getattr(route, "body_field", None)
+        if body_field is None:
+            continue
+
+        try:
+            body_field.validate({}, {}, loc=("body",))
+        except Exception:
+            continue
+
+        exercised += 1
+
+    return exercised
@@ -0,0 +1,34 @@
+from typing import Any, Iterator, Tuple
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.infrastructure.utils.logger import CustomLogger
+
+
+@pytest.fixture
+def logger() -> CustomLogger:
+    return CustomLogger(logger_name="tests", level_log="CRITICAL")
+
+
+@pytest.fixture
+def dynamodb_table(monkeypatch) -> Iterator[Tuple[Any, str]]:
+    """
+    moto stand-in of a table with the schema of template.yaml (string
+    partition key ``key``). Yields the client and the table name.
+    """
+    # moto intercepta las llamadas; las credenciales solo evitan buscar reales
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_ENDPOINT_URL_DYNAMODB", raising=False)
+
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="table",
+            AttributeDefinitions=[{"AttributeName": "key", "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": "key", "KeyType": "HASH"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield client, "table"
@@ -0,0 +1,146 @@
+import threading
+from typing import Optional
+
+import pytest
+
+from src.infrastructure.repositories.cached_secrets_manager_repository_impl import (
+    CachedSecretsManagerRepositoryImpl,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SecretsManager:
+    """Secrets Manager whose secret changes version on every fetch."""
+
+    def __init__(self):
+        self.fetches = 0
+        self.error: Optional[Exception] = None
+        self.gate: Optional[threading.Event] = None
+        self.fetching = threading.Event()
+
+    def get_secret_version(self, secret_name, version_stage=None):
+        self.fetching.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+
+        self.fetches += 1
+        return {"value": self.fetches}, f"v{self.fetches}"
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def secrets_manager() -> SecretsManager:
+    return SecretsManager()
+
+
+@pytest.fixture
+def cache(secrets_manager, logger, clock) -> CachedSecretsManagerRepositoryImpl:
+    return CachedSecretsManagerRepositoryImpl(
+        sm_repository=secrets_manager,
+        logger=logger,
+        ttl_seconds=300,
+        refresh_ahead_seconds=30,
+        max_stale_seconds=600,
+        clock=clock,
+    )
+
+
+def test_fresh_entries_are_served_from_the_cache(cache, secrets_manager, clock):
+    assert cache.get_secret_version("s") == ({"value": 1}, "v1")
+
+    clock.now += 269
+    assert cache.get_secret_version("s") == ({"value": 1}, "v1")
+    assert secrets_manager.fetches == 1
+
+
+def test_expired_entries_are_fetched_again(cache, secrets_manager, clock):
+    cache.get_secret("s")
+
+    clock.now += 300
+
+    assert cache.get_secret_version("s") == ({"value": 2}, "v2")
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_refresh_ahead_runs_on_the_calling_thread(cache, secrets_manager, clock):
+    cache.get_secret("s")
+
+    clock.now += 280
+    # Sin hilos en segundo plano: al volver la llamada ya está refrescado
+    assert cache.get_secret_version("s") == ({"value": 2}, "v2")
+    assert cache.get_stats()["refreshes"] == 1
+
+    # El refresco reinicia el TTL
+    clock.now += 269
+    assert cache.get_secret_version("s") == ({"value": 2}, "v2")
+    assert secrets_manager.fetches == 2
+
+
+def test_callers_do_not_wait_for_a_refresh_in_progress(cache, secrets_manager, clock):
+    cache.get_secret("s")
+    clock.now += 280
+    secrets_manager.gate = threading.Event()
+    secrets_manager.fetching.clear()
+
+    refresher = threading.Thread(target=cache.get_secret, args=("s",))
+    refresher.start()
+    secrets_manager.fetching.wait(5)
+    try:
+        assert cache.get_secret_version("s") == ({"value": 1}, "v1")
+    finally:
+        secrets_manager.gate.set()
+        refresher.join(5)
+
+    assert cache.get_secret_version("s") == ({"value": 2}, "v2")
+    assert secrets_manager.fetches == 2
+
+
+def test_failed_refresh_ahead_keeps_serving_the_cached_value(
+    cache, secrets_manager, clock
+):
+    cache.get_secret("s")
+    clock.now += 280
+    secrets_manager.error = RuntimeError("throttled")
+
+    assert cache.get_secret_version("s") == ({"value": 1}, "v1")
+    assert cache.get_stats()["refresh_errors"] == 1
+
+
+def test_stale_value_is_served_up_to_max_stale_after_expiry(
+    cache, secrets_manager, clock
+):
+    cache.get_secret("s")
+    secrets_manager.error = RuntimeError("unavailable")
+
+    clock.now += 300 + 599
+    assert cache.get_secret_version("s") == ({"value": 1}, "v1")
+    assert cache.get_stats()["stale_served"] == 1
+
+    clock.now += 1
+    with pytest.raises(RuntimeError):
+        cache.get_secret("s")
+
+
+def test_same_version_keeps_the_same_object(cache, secrets_manager, clock):
+    secrets_manager.get_secret_version = lambda name, version_stage=None: (
+        {"value": object()},
+        "v1",
+    )
+    first = cache.get_secret("s")
+
+    clock.now += 300
+
+    assert cache.get_secret("s") is first
@@ -0,0 +1,177 @@
+import asyncio
+import json
+from typing import List, Optional
+
+import pytest
+from fastapi import FastAPI
+from mangum import Mangum
+from pydantic import BaseModel
+
+from src.domain.enums.paths_enum import PathsEnum
+from src.domain.models.dev_response import DevResponse
+from src.domain.models.rate_limit import RateLimitDecision
+from src.infrastructure.controllers.fast_path import FastPathRouter, FastRoute
+from src.infrastructure.middlewares.rate_limit_middleware import RateLimitMiddleware
+from src.infrastructure.utils.client_ip import ClientIpResolver
+
+SIGN_IN = PathsEnum.sign_in.value
+BODY = json.dumps({"user": "a@b.com", "password": "Passw0rd!"})
+
+
+class Limiter:
+    """Rate limiter that lets everything through and records the source IPs."""
+
+    def __init__(self):
+        self.source_ips: List[Optional[str]] = []
+
+    def check(self, scope, user, source_ip) -> RateLimitDecision:
+        self.source_ips.append(source_ip)
+        return RateLimitDecision(allowed=True, remaining=1)
+
+    def record_failure(self, scope, user, source_ip) -> None:
+        pass
+
+
+class Payload(BaseModel):
+    user: str
+    password: str
+
+
+@pytest.fixture
+def limiter() -> Limiter:
+    return Limiter()
+
+
+def app(limiter, logger, trusted_proxies=()):
+    api = FastAPI()
+
+    @api.post(SIGN_IN)
+    async def sign_in(payload: Payload):
+        return {}
+
+    api.add_middleware(
+        RateLimitMiddleware,
+        rate_limiter_provider=lambda: limiter,
+        logger=logger,
+        client_ip_resolver=ClientIpResolver(trusted_proxies),
+    )
+    return api
+
+
+def call_asgi(api, client, forwarded_for=None):
+    headers = [(b"content-type", b"application/json")]
+    if forwarded_for:
+        headers.append((b"x-forwarded-for", forwarded_for.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": SIGN_IN,
+        "raw_path": SIGN_IN.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": client,
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": BODY.encode(), "more_body": False}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    asyncio.run(api(scope, receive, send))
+
+
+def rest_event(source_ip, forwarded_for):
+    return {
+        "resource": "/{proxy+}",
+        "path": SIGN_IN,
+        "httpMethod": "POST",
+        "headers": {
+            "content-type": "application/json",
+            "x-forwarded-for": forwarded_for,
+        },
+        "multiValueHeaders": {},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "requestContext": {
+            "resourcePath": "/{proxy+}",
+            "httpMethod": "POST",
+            "path": SIGN_IN,
+            "stage": "dev",
+            "identity": {"sourceIp": source_ip},
+        },
+        "body": BODY,
+        "isBase64Encoded": False,
+    }
+
+
+def test_api_gateway_source_ip_wins_over_forwarded_for(limiter, logger):
+    handler = Mangum(app(limiter, logger), lifespan="off")
+
+    handler(rest_event("203.0.113.10", "198.51.100.1"), None)
+
+    assert limiter.source_ips == ["203.0.113.10"]
+
+
+def test_alb_events_use_the_hop_the_alb_appended(limiter, logger):
+    handler = Mangum(app(limiter, logger), lifespan="off")
+    event = {
+        "requestContext": {"elb": {"targetGroupArn": "arn"}},
+        "httpMethod": "POST",
+        "path": SIGN_IN,
+        "queryStringParameters": {},
+        "headers": {
+            "content-type": "application/json",
+            "x-forwarded-for": "198.51.100.1, 203.0.113.10",
+        },
+        "body": BODY,
+        "isBase64Encoded": False,
+    }
+
+    handler(event, None)
+
+    assert limiter.source_ips == ["203.0.113.10"]
+
+
+def test_forwarded_for_from_untrusted_peers_is_ignored(limiter, logger):
+    call_asgi(app(limiter, logger), ("203.0.113.10", 4321), "198.51.100.1")
+
+    assert limiter.source_ips == ["203.0.113.10"]
+
+
+def test_trusted_proxy_uses_the_right_most_untrusted_hop(limiter, logger):
+    api = app(limiter, logger, trusted_proxies=["10.0.0.0/8"])
+
+    # El cliente falsificó el primer salto; el ALB agregó su IP y la de un proxy
+    call_asgi(api, ("10.0.0.1", 4321), "198.51.100.1, 203.0.113.10, 10.0.0.7")
+    # Cada cliente detrás del balanceador tiene su propio bucket
+    call_asgi(api, ("10.0.0.1", 4321), "203.0.113.20")
+
+    assert limiter.source_ips == ["203.0.113.10", "203.0.113.20"]
+
+
+def test_fast_path_ignores_spoofed_forwarded_for(limiter, logger):
+    service = type("Service", (), {"execute": lambda self, payload: DevResponse()})
+    router = FastPathRouter(
+        routes={SIGN_IN: FastRoute(Payload, service)},
+        logger=logger,
+        rate_limiter_provider=lambda: limiter,
+    )
+
+    response = router(rest_event("203.0.113.10", "198.51.100.1"), None)
+
+    assert response["statusCode"] == 200
+    assert limiter.source_ips == ["203.0.113.10"]
+
+
+def test_resolve_without_forwarded_for_returns_the_peer():
+    resolver = ClientIpResolver(["10.0.0.0/8"])
+
+    assert resolver.resolve("10.0.0.1", None) == "10.0.0.1"
+    assert resolver.resolve(None, None) is None
@@ -0,0 +1,83 @@
+import pytest
+
+from src.domain.enums.idempotency_status import IdempotencyStatusEnum
+from src.domain.models.idempotency import StoredResponse
+from src.infrastructure.repositories.dynamodb_idempotency_repository_impl import (
+    DynamoDBIdempotencyRepositoryImpl,
+)
+
+RESPONSE = StoredResponse(
+    status_code=201,
+    headers=(("content-type", "application/json"), ("content-length", "7")),
+    body=b'{"a":1}',
+)
+
+
+class Clock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def repository(dynamodb_table, clock) -> DynamoDBIdempotencyRepositoryImpl:
+    client, table_name = dynamodb_table
+    return DynamoDBIdempotencyRepositoryImpl(client, table_name, clock=clock)
+
+
+def test_first_claim_wins_and_the_next_sees_it_in_progress(repository):
+    assert repository.claim("k", "fp", lock_seconds=30) is None
+
+    record = repository.claim("k", "other", lock_seconds=30)
+
+    assert record.status is IdempotencyStatusEnum.IN_PROGRESS
+    assert record.fingerprint == "fp"
+    assert record.response is None
+
+
+def test_completed_response_round_trips(repository):
+    repository.claim("k", "fp", lock_seconds=30)
+    repository.complete("k", "fp", RESPONSE, ttl_seconds=3600)
+
+    record = repository.claim("k", "fp", lock_seconds=30)
+
+    assert record.status is IdempotencyStatusEnum.COMPLETED
+    assert record.response == RESPONSE
+
+
+def test_claim_of_a_request_that_never_finished_expires(repository, clock):
+    repository.claim("k", "fp", lock_seconds=30)
+
+    clock.now += 31
+
+    assert repository.claim("k", "fp", lock_seconds=30) is None
+
+
+def test_completed_response_expires_after_its_ttl(repository, clock):
+    repository.claim("k", "fp", lock_seconds=30)
+    repository.complete("k", "fp", RESPONSE, ttl_seconds=300)
+
+    clock.now += 299
+    assert repository.claim("k", "fp", lock_seconds=30).response == RESPONSE
+
+    clock.now += 2
+    assert repository.claim("k", "fp", lock_seconds=30) is None
+
+
+def test_released_key_can_be_claimed_again(repository):
+    repository.claim("k", "fp", lock_seconds=30)
+    repository.release("k")
+
+    assert repository.claim("k", "fp", lock_seconds=30) is None
+
+
+def test_keys_are_independent(repository):
+    assert repository.claim("a", "fp", lock_seconds=30) is None
+    assert repository.claim("b", "fp", lock_seconds=30) is None
@@ -0,0 +1,136 @@
+import pytest
+
+from src.domain.models.rate_limit import TokenBucketPolicy
+from src.infrastructure.repositories.dynamodb_rate_limit_repository_impl import (
+    DynamoDBRateLimitRepositoryImpl,
+)
+
+POLICY = TokenBucketPolicy(capacity=3, refill_per_second=1)
+
+
+class Clock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RacingClient:
+    """
+    DynamoDB client that lets another container write the bucket between
+    the read and the conditional write of ``consume``, ``races`` times.
+    """
+
+    def __init__(self, client, other: DynamoDBRateLimitRepositoryImpl, races: int):
+        self.client = client
+        self.other = other
+        self.races = races
+
+    def get_item(self, **kwargs):
+        return self.client.get_item(**kwargs)
+
+    def put_item(self, **kwargs):
+        if self.races > 0:
+            self.races -= 1
+            self.other.consume(kwargs["Item"]["key"]["S"], POLICY)
+        return self.client.put_item(**kwargs)
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def repository(dynamodb_table, clock) -> DynamoDBRateLimitRepositoryImpl:
+    client, table_name = dynamodb_table
+    return DynamoDBRateLimitRepositoryImpl(client, table_name, clock=clock)
+
+
+def racing_repository(dynamodb_table, clock, races: int):
+    client, table_name = dynamodb_table
+    other = DynamoDBRateLimitRepositoryImpl(client, table_name, clock=clock)
+    return DynamoDBRateLimitRepositoryImpl(
+        RacingClient(client, other, races), table_name, clock=clock
+    )
+
+
+def test_consumes_until_empty_and_refills(repository, clock):
+    decisions = [repository.consume("k", POLICY) for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert decisions[2].remaining == pytest.approx(0)
+    assert decisions[3].retry_after_seconds == pytest.approx(1)
+
+    clock.now += 1
+    assert repository.consume("k", POLICY).allowed
+
+
+def test_rejected_attempt_does_not_write(repository, dynamodb_table):
+    client, table_name = dynamodb_table
+    for _ in range(3):
+        repository.consume("k", POLICY)
+    before = client.get_item(TableName=table_name, Key={"key": {"S": "k"}})["Item"]
+
+    repository.consume("k", POLICY)
+
+    after = client.get_item(TableName=table_name, Key={"key": {"S": "k"}})["Item"]
+    assert after["version"] == before["version"]
+
+
+def test_forced_charge_leaves_the_bucket_in_debt(repository, clock):
+    repository.consume("k", POLICY)
+
+    decision = repository.consume("k", POLICY, cost=4, force=True)
+
+    assert not decision.allowed
+    # 3 - 1 - 4 = -2: hacen falta 3 segundos para el siguiente intento
+    clock.now += 2.9
+    assert not repository.consume("k", POLICY).allowed
+    clock.now += 0.2
+    assert repository.consume("k", POLICY).allowed
+
+
+def test_item_expires_once_the_bucket_would_be_full(repository, dynamodb_table, clock):
+    client, table_name = dynamodb_table
+    repository.consume("k", POLICY)
+
+    item = client.get_item(TableName=table_name, Key={"key": {"S": "k"}})["Item"]
+
+    assert int(item["expires_at"]["N"]) >= clock.now + POLICY.seconds_to_full()
+
+
+def test_concurrent_update_is_retried_on_the_new_version(
+    repository, dynamodb_table, clock
+):
+    repository.consume("k", POLICY)
+    racing = racing_repository(dynamodb_table, clock, races=1)
+
+    decision = racing.consume("k", POLICY)
+
+    # El otro contenedor tomó un token antes: se reintenta sobre su versión
+    assert decision.allowed
+    assert decision.remaining == pytest.approx(0)
+    assert not repository.consume("k", POLICY).allowed
+
+
+def test_concurrent_first_write_is_retried(dynamodb_table, clock):
+    # Ninguno de los dos encontró el item: solo uno puede crearlo
+    repository = racing_repository(dynamodb_table, clock, races=1)
+
+    repository.consume("new", POLICY)
+
+    client, table_name = dynamodb_table
+    item = client.get_item(TableName=table_name, Key={"key": {"S": "new"}})["Item"]
+    assert item["version"]["N"] == "2"
+    assert float(item["tokens"]["N"]) == pytest.approx(1)
+
+
+def test_persistent_contention_is_treated_as_limited(dynamodb_table, clock):
+    repository = racing_repository(dynamodb_table, clock, races=3)
+
+    decision = repository.consume("k", POLICY)
+
+    assert not decision.allowed
+    assert decision.retry_after_seconds == 1
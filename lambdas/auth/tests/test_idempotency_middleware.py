@@ -0,0 +1,200 @@
+import asyncio
+from collections import Counter
+from typing import List
+
+import httpx
+import pytest
+from fastapi import FastAPI, Header, Response
+from pydantic import BaseModel
+
+from src.application.idempotency_guard import IdempotencyGuard
+from src.domain.enums.paths_enum import PathsEnum
+from src.infrastructure.middlewares.idempotency_middleware import (
+    IdempotencyMiddleware,
+)
+from src.infrastructure.repositories.in_memory_idempotency_repository_impl import (
+    InMemoryIdempotencyRepositoryImpl,
+)
+
+SIGN_UP = PathsEnum.sign_up.value
+MFA_CODE = PathsEnum.mfa_code.value
+
+
+class Payload(BaseModel):
+    email: str
+    password: str
+
+
+@pytest.fixture
+def calls() -> Counter:
+    return Counter()
+
+
+@pytest.fixture
+def statuses() -> List[int]:
+    """Status codes the sign up endpoint answers, in order; 200 when empty."""
+    return []
+
+
+@pytest.fixture
+def repository() -> InMemoryIdempotencyRepositoryImpl:
+    return InMemoryIdempotencyRepositoryImpl()
+
+
+@pytest.fixture
+def app(calls, statuses, repository, logger):
+    api = FastAPI()
+
+    @api.post(SIGN_UP)
+    async def sign_up(payload: Payload, response: Response):
+        calls[SIGN_UP] += 1
+        # Deja que los duplicados concurrentes lleguen mientras está en curso
+        await asyncio.sleep(0.05)
+        response.status_code = statuses.pop(0) if statuses else 200
+        return {"email": payload.email, "call": calls[SIGN_UP]}
+
+    @api.get(MFA_CODE)
+    async def mfa_code(authorization: str = Header()):
+        calls[MFA_CODE] += 1
+        return {"secret": f"{authorization}-{calls[MFA_CODE]}"}
+
+    guard = IdempotencyGuard(repository=repository, logger=logger)
+    api.add_middleware(
+        IdempotencyMiddleware, idempotency_guard_provider=lambda: guard, logger=logger
+    )
+    return api
+
+
+def run(app, *requests):
+    """Send ``(method, path, kwargs)`` requests concurrently."""
+
+    async def send_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await asyncio.gather(
+                *(
+                    c.request(method, path, **kwargs)
+                    for method, path, kwargs in requests
+                )
+            )
+
+    return asyncio.run(send_all())
+
+
+def sign_up(key=None, email="a@b.com", **body):
+    headers = {"Idempotency-Key": key} if key else {}
+    payload = {"email": email, "password": "Passw0rd!", **body}
+    return "POST", SIGN_UP, {"json": payload, "headers": headers}
+
+
+def test_retry_gets_the_first_response_without_running_again(app, calls):
+    (first,) = run(app, sign_up("k1"))
+    (retry,) = run(app, sign_up("k1"))
+
+    assert calls[SIGN_UP] == 1
+    assert retry.status_code == first.status_code == 200
+    assert retry.content == first.content
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+
+
+def test_requests_without_key_are_not_deduplicated(app, calls):
+    run(app, sign_up())
+    run(app, sign_up())
+
+    assert calls[SIGN_UP] == 2
+
+
+def test_same_key_with_another_body_answers_422(app, calls):
+    run(app, sign_up("k1"))
+    (other,) = run(app, sign_up("k1", email="c@d.com"))
+
+    assert other.status_code == 422
+    assert calls[SIGN_UP] == 1
+
+
+def test_concurrent_duplicates_share_one_execution(app, calls):
+    responses = run(app, *[sign_up("k1")] * 5)
+
+    assert calls[SIGN_UP] == 1
+    assert {r.content for r in responses} == {responses[0].content}
+    assert (
+        sorted(r.headers.get("idempotent-replayed") for r in responses[1:])
+        == ["true"] * 4
+    )
+
+
+def test_server_errors_are_released_for_the_next_retry(app, calls, statuses):
+    statuses.append(500)
+
+    (failed,) = run(app, sign_up("k1"))
+    (retry,) = run(app, sign_up("k1"))
+
+    assert failed.status_code == 500
+    assert retry.status_code == 200
+    assert "idempotent-replayed" not in retry.headers
+    assert calls[SIGN_UP] == 2
+
+
+def test_client_errors_are_not_stored(app, calls, statuses):
+    statuses.append(400)
+
+    run(app, sign_up("k1"))
+    (retry,) = run(app, sign_up("k1"))
+
+    assert retry.status_code == 200
+    assert calls[SIGN_UP] == 2
+
+
+def test_validation_errors_echoing_the_input_are_not_stored(app, calls):
+    # Sin email FastAPI responde 422 repitiendo el body, contraseña incluida
+    invalid = (
+        "POST",
+        SIGN_UP,
+        {"json": {"password": "Secret1!"}, "headers": {"Idempotency-Key": "k1"}},
+    )
+    (rejected,) = run(app, invalid)
+    assert rejected.status_code == 422
+    assert "Secret1!" in rejected.text
+
+    # Si se hubiera guardado, otro body con la llave respondería 422 de reuso
+    (valid,) = run(app, sign_up("k1"))
+
+    assert valid.status_code == 200
+    assert calls[SIGN_UP] == 1
+
+
+def test_keys_are_scoped_by_authorization(app, calls):
+    def mfa_code(token):
+        headers = {"Idempotency-Key": "m1", "Authorization": token}
+        return "GET", MFA_CODE, {"headers": headers}
+
+    (first,) = run(app, mfa_code("Bearer a"))
+    (same_user,) = run(app, mfa_code("Bearer a"))
+    (other_user,) = run(app, mfa_code("Bearer b"))
+
+    assert same_user.json() == first.json()
+    assert other_user.json() != first.json()
+    assert calls[MFA_CODE] == 2
+
+
+def test_key_in_progress_elsewhere_answers_409(app, repository, logger, calls):
+    method, path, kwargs = sign_up("k1")
+    guard = IdempotencyGuard(repository=repository, logger=logger)
+    key = guard.key(method, path, "k1", None)
+    body = httpx.Request(method, "http://t", json=kwargs["json"]).content
+    # Otro contenedor tomó la llave y no ha terminado
+    repository.claim(key, guard.fingerprint(body), lock_seconds=30)
+
+    (response,) = run(app, sign_up("k1"))
+
+    assert response.status_code == 409
+    assert response.headers["retry-after"] == "1"
+    assert calls[SIGN_UP] == 0
+
+
+def test_too_long_keys_are_rejected(app, calls):
+    (response,) = run(app, sign_up("k" * 256))
+
+    assert response.status_code == 400
+    assert calls[SIGN_UP] == 0
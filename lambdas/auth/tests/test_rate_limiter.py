@@ -0,0 +1,93 @@
+import pytest
+
+from src.application.rate_limiter import RateLimiter, RateLimitRules
+from src.domain.models.rate_limit import TokenBucketPolicy
+from src.infrastructure.repositories.in_memory_rate_limit_repository_impl import (
+    InMemoryRateLimitRepositoryImpl,
+)
+
+SCOPE = "/auth/signin"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+def limiter(clock, logger, user=3, ip=10, failure_cost=1) -> RateLimiter:
+    return RateLimiter(
+        repository=InMemoryRateLimitRepositoryImpl(clock=clock),
+        logger=logger,
+        rules=RateLimitRules(
+            user=TokenBucketPolicy(capacity=user, refill_per_second=1),
+            source_ip=TokenBucketPolicy(capacity=ip, refill_per_second=1),
+            failure_cost=failure_cost,
+        ),
+    )
+
+
+def test_user_runs_out_of_attempts_and_recovers(clock, logger):
+    rate_limiter = limiter(clock, logger)
+
+    allowed = [
+        rate_limiter.check(SCOPE, "a@b.com", "1.1.1.1").allowed for _ in range(4)
+    ]
+    assert allowed == [True, True, True, False]
+
+    clock.now += 1
+    assert rate_limiter.check(SCOPE, "a@b.com", "1.1.1.1").allowed
+
+
+def test_username_is_normalized(clock, logger):
+    rate_limiter = limiter(clock, logger, user=1)
+
+    assert rate_limiter.check(SCOPE, "A@b.com ", None).allowed
+    assert not rate_limiter.check(SCOPE, "a@B.com", None).allowed
+
+
+def test_source_ip_limit_applies_across_users(clock, logger):
+    rate_limiter = limiter(clock, logger, ip=2)
+
+    assert rate_limiter.check(SCOPE, "a@b.com", "1.1.1.1").allowed
+    assert rate_limiter.check(SCOPE, "c@d.com", "1.1.1.1").allowed
+
+    decision = rate_limiter.check(SCOPE, "e@f.com", "1.1.1.1")
+    assert not decision.allowed
+    assert decision.retry_after_seconds > 0
+
+
+def test_scopes_have_separate_buckets(clock, logger):
+    rate_limiter = limiter(clock, logger, user=1)
+
+    assert rate_limiter.check(SCOPE, "a@b.com", None).allowed
+    assert rate_limiter.check("/auth/mfa/resend", "a@b.com", None).allowed
+
+
+def test_failures_cost_extra_even_past_the_limit(clock, logger):
+    rate_limiter = limiter(clock, logger, user=3, failure_cost=2)
+
+    assert rate_limiter.check(SCOPE, "a@b.com", None).allowed
+    rate_limiter.record_failure(SCOPE, "a@b.com", None)
+    rate_limiter.record_failure(SCOPE, "a@b.com", None)
+
+    # 3 - 1 - 2 - 2 = -2: hacen falta 3 segundos para volver a tener un token
+    clock.now += 2
+    assert not rate_limiter.check(SCOPE, "a@b.com", None).allowed
+    clock.now += 1
+    assert rate_limiter.check(SCOPE, "a@b.com", None).allowed
+
+
+def test_failures_are_free_with_zero_cost(clock, logger):
+    rate_limiter = limiter(clock, logger, user=1, failure_cost=0)
+
+    rate_limiter.record_failure(SCOPE, "a@b.com", None)
+
+    assert rate_limiter.check(SCOPE, "a@b.com", None).allowed
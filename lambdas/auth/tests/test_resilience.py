@@ -0,0 +1,270 @@
+import random
+from typing import List
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.infrastructure.utils.request_context import (
+    RequestContext,
+    reset_request_context,
+    set_request_context,
+)
+from src.infrastructure.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ResilientCaller,
+    RetryPolicy,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class MaxRandom(random.Random):
+    """Jitter always at its upper bound, so delays are predictable."""
+
+    def uniform(self, a: float, b: float) -> float:
+        return b
+
+
+class LambdaContext:
+    def __init__(self, remaining_ms: float):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self) -> float:
+        return self.remaining_ms
+
+
+def client_error(code: str, status_code: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
+        "ConfirmSignUp",
+    )
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def transitions() -> List[CircuitState]:
+    return []
+
+
+@pytest.fixture
+def breaker(clock, transitions) -> CircuitBreaker:
+    return CircuitBreaker(
+        name="cognito",
+        failure_threshold=0.5,
+        minimum_calls=4,
+        window_seconds=10,
+        open_seconds=30,
+        on_state_change=lambda name, state: transitions.append(state),
+        clock=clock,
+    )
+
+
+def fail_with(err: Exception, calls: List[int]):
+    def func():
+        calls.append(1)
+        raise err
+
+    return func
+
+
+# RetryPolicy
+
+
+def test_delay_is_capped_exponential_with_full_jitter():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+    assert [policy.delay(n, MaxRandom()) for n in range(4)] == [0.1, 0.2, 0.4, 0.5]
+    assert 0 <= policy.delay(3, random.Random(7)) <= 0.5
+
+
+def test_retries_stop_at_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.can_retry(0, 0)
+    assert policy.can_retry(1, 0)
+    assert not policy.can_retry(2, 0)
+
+
+def test_no_retry_when_the_invocation_is_about_to_time_out():
+    policy = RetryPolicy(min_remaining_ms=1500)
+    token = set_request_context(
+        RequestContext(request_id="r", lambda_context=LambdaContext(2000))
+    )
+    try:
+        assert policy.can_retry(0, delay=0.4)
+        assert not policy.can_retry(0, delay=0.6)
+    finally:
+        reset_request_context(token)
+
+
+# CircuitBreaker
+
+
+def test_opens_once_the_failure_ratio_is_reached_with_enough_calls(
+    breaker, transitions
+):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert transitions == [CircuitState.OPEN]
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_call()
+    assert raised.value.retry_after_seconds == pytest.approx(30)
+
+
+def test_failures_older_than_the_window_are_forgotten(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 11
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_trial_success_closes(breaker, clock, transitions):
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now += 30
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert transitions == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_half_open_trial_failure_opens_again(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 29
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_late_failures_while_open_are_ignored(breaker, clock, transitions):
+    for _ in range(4):
+        breaker.record_failure()
+
+    # Llegan tarde las respuestas de otras llamadas que estaban en curso
+    clock.now += 20
+    for _ in range(4):
+        breaker.record_failure()
+
+    assert transitions == [CircuitState.OPEN]
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_call()
+    assert raised.value.retry_after_seconds == pytest.approx(10)
+
+
+# ResilientCaller
+
+
+def caller(breaker=None, sleeps=None) -> ResilientCaller:
+    return ResilientCaller(
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=1),
+        circuit_breaker=breaker,
+        sleep=(sleeps if sleeps is not None else []).append,
+        rng=MaxRandom(),
+    )
+
+
+def test_throttling_is_retried_with_backoff():
+    sleeps: List[float] = []
+    attempts = iter([client_error("TooManyRequestsException"), None])
+
+    def func():
+        err = next(attempts)
+        if err:
+            raise err
+        return "ok"
+
+    assert caller(sleeps=sleeps).call(func) == "ok"
+    assert sleeps == [0.1]
+
+
+def test_throttling_gives_up_after_max_attempts():
+    calls: List[int] = []
+    sleeps: List[float] = []
+
+    with pytest.raises(ClientError):
+        caller(sleeps=sleeps).call(
+            fail_with(client_error("ThrottlingException"), calls)
+        )
+
+    assert len(calls) == 3
+    assert sleeps == [0.1, 0.2]
+
+
+def test_server_errors_are_only_retried_for_idempotent_calls():
+    error = client_error("InternalErrorException", status_code=500)
+    calls: List[int] = []
+
+    with pytest.raises(ClientError):
+        caller().call(fail_with(error, calls))
+    assert len(calls) == 1
+
+    with pytest.raises(ClientError):
+        caller().call(fail_with(error, calls), idempotent=True)
+    assert len(calls) == 4
+
+
+def test_user_attempt_limit_is_neither_retried_nor_a_breaker_failure(breaker):
+    # LimitExceededException es el límite de intentos de un usuario, no
+    # throttling: un usuario bloqueado no debe abrir el circuito de todos
+    resilient_caller = caller(breaker=breaker)
+    calls: List[int] = []
+
+    for _ in range(10):
+        with pytest.raises(ClientError):
+            resilient_caller.call(
+                fail_with(client_error("LimitExceededException"), calls)
+            )
+
+    assert len(calls) == 10
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_open_breaker_fails_fast_without_calling(breaker):
+    for _ in range(4):
+        breaker.record_failure()
+    calls: List[int] = []
+
+    with pytest.raises(CircuitOpenError):
+        caller(breaker=breaker).call(fail_with(RuntimeError(), calls))
+
+    assert calls == []
@@ -0,0 +1,47 @@
+import pytest
+
+from src.domain.models.rate_limit import TokenBucketPolicy
+
+POLICY = TokenBucketPolicy(capacity=5, refill_per_second=1)
+
+
+def test_takes_tokens_while_there_are_enough():
+    tokens, decision = POLICY.take(tokens=5, elapsed_seconds=0, cost=1)
+
+    assert decision.allowed
+    assert tokens == decision.remaining == 4
+
+
+def test_refills_for_the_elapsed_time_up_to_capacity():
+    tokens, _ = POLICY.take(tokens=0, elapsed_seconds=2, cost=1)
+    assert tokens == 1
+
+    tokens, _ = POLICY.take(tokens=0, elapsed_seconds=60, cost=1)
+    assert tokens == 4
+
+
+def test_rejects_without_touching_the_bucket_and_says_when_to_retry():
+    tokens, decision = POLICY.take(tokens=0.5, elapsed_seconds=0, cost=1)
+
+    assert not decision.allowed
+    assert tokens == 0.5
+    assert decision.retry_after_seconds == pytest.approx(0.5)
+
+
+def test_forced_charge_leaves_the_bucket_in_debt_down_to_minus_capacity():
+    tokens, decision = POLICY.take(tokens=1, elapsed_seconds=0, cost=3, force=True)
+
+    assert not decision.allowed
+    assert tokens == -2
+    assert decision.remaining == 0
+    assert decision.retry_after_seconds == pytest.approx(5)
+
+    tokens, _ = POLICY.take(tokens=-4, elapsed_seconds=0, cost=3, force=True)
+    assert tokens == -5
+
+
+def test_negative_elapsed_time_does_not_drain_the_bucket():
+    tokens, decision = POLICY.take(tokens=3, elapsed_seconds=-10, cost=1)
+
+    assert decision.allowed
+    assert tokens == 2
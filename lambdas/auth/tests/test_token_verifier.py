@@ -0,0 +1,190 @@
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+from authlib.jose import JsonWebKey, JsonWebToken
+
+from src.domain.models.sm_lambda_auth_cognito import SmLambdaAuthCognito
+from src.infrastructure.utils.token_verifier import (
+    CognitoAccessTokenVerifier,
+    JWKSCache,
+    TokenVerificationError,
+)
+
+ISSUER = "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_pool"
+CLIENT_ID = "client"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def rsa_key(kid: str):
+    return JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": kid})
+
+
+@pytest.fixture(scope="module")
+def key():
+    return rsa_key("k1")
+
+
+@pytest.fixture(scope="module")
+def rotated_key():
+    return rsa_key("k2")
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def jwks(tmp_path, key):
+    """Publishes key sets at a file:// url, as Cognito does over HTTPS."""
+    path = tmp_path / "jwks.json"
+
+    def publish(*keys):
+        path.write_text(
+            json.dumps({"keys": [k.as_dict(is_private=False) for k in keys]})
+        )
+
+    publish(key)
+    publish.url = path.as_uri()
+    return publish
+
+
+@pytest.fixture
+def verifier(logger, jwks, clock) -> CognitoAccessTokenVerifier:
+    configs = SmLambdaAuthCognito(
+        name="cognito",
+        authority=ISSUER + "/",
+        client_id=CLIENT_ID,
+        client_secret="",
+        server_metadata_url="",
+        client_kwargs={},
+        user_pool_id="us-east-1_pool",
+    )
+    return CognitoAccessTokenVerifier(
+        logger=logger,
+        cognito_configs_provider=lambda: configs,
+        jwks_cache=JWKSCache(
+            jwks_url_provider=lambda: jwks.url,
+            ttl_seconds=3600,
+            min_refresh_seconds=60,
+            clock=clock,
+        ),
+    )
+
+
+def token(key, kid=None, **claims) -> str:
+    payload = {
+        "iss": ISSUER,
+        "client_id": CLIENT_ID,
+        "token_use": "access",
+        "exp": int(time.time()) + 300,
+        "sub": "user",
+        **claims,
+    }
+    header = {"alg": "RS256", "kid": kid or key.as_dict()["kid"]}
+    payload = {name: value for name, value in payload.items() if value is not None}
+    return JsonWebToken(["RS256"]).encode(header, payload, key).decode()
+
+
+def test_valid_token_returns_its_claims(verifier, key):
+    claims = verifier.verify(token(key))
+
+    assert claims["sub"] == "user"
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": int(time.time()) - 60},
+        {"iss": "https://cognito-idp.us-east-1.amazonaws.com/other"},
+        {"client_id": "other"},
+        {"token_use": "id"},
+    ],
+    ids=["expired", "issuer", "client_id", "token_use"],
+)
+def test_invalid_claims_are_rejected(verifier, key, claims):
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(token(key, **claims))
+
+
+def test_missing_claim_is_rejected(verifier, key):
+    raw = token(key, token_use=None)
+
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(raw)
+
+
+def test_signature_of_another_key_is_rejected(verifier, rotated_key):
+    # Firmado con otra llave privada pero anunciando el kid publicado
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(token(rotated_key, kid="k1"))
+
+
+def test_tampered_payload_is_rejected(verifier, key):
+    header, _, signature = token(key).split(".")
+    forged = token(key, sub="admin").split(".")[1]
+
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(".".join((header, forged, signature)))
+
+
+@pytest.mark.parametrize("raw", ["garbage", "e30.e30.sig"])
+def test_malformed_tokens_are_rejected(verifier, raw):
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(raw)
+
+
+def test_rotated_key_is_picked_up_once_min_refresh_passed(
+    verifier, jwks, clock, key, rotated_key
+):
+    verifier.verify(token(key))
+    jwks(key, rotated_key)
+
+    # Recién descargado: el kid desconocido no provoca otra descarga todavía
+    with pytest.raises(TokenVerificationError, match="Unknown signing key"):
+        verifier.verify(token(rotated_key))
+
+    clock.now += 60
+    assert verifier.verify(token(rotated_key))["sub"] == "user"
+
+
+def test_unavailable_key_set_skips_the_check(logger, key):
+    verifier = CognitoAccessTokenVerifier(
+        logger=logger,
+        cognito_configs_provider=lambda: None,
+        jwks_cache=JWKSCache(jwks_url_provider=lambda: "file:///missing/jwks.json"),
+    )
+
+    assert verifier.verify(token(key)) is None
+
+
+def test_concurrent_first_requests_download_the_key_set_once(
+    verifier, key, monkeypatch
+):
+    downloads = []
+    urlopen = urllib.request.urlopen
+
+    def slow_urlopen(url, timeout):
+        downloads.append(url)
+        time.sleep(0.05)
+        return urlopen(url, timeout=timeout)
+
+    monkeypatch.setattr(urllib.request, "urlopen", slow_urlopen)
+    raw = token(key)
+    threads = [threading.Thread(target=verifier.verify, args=(raw,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(downloads) == 1
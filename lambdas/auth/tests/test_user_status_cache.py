@@ -0,0 +1,129 @@
+from collections import Counter
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.application.confirm_sign_up_service import ConfirmSignUpService
+from src.application.resend_mfa import ResendMFAService
+from src.application.sign_in_service import SignInService
+from src.application.user_status_cache import UserStatusCache
+from src.domain.models.mfa_resend_code import ResendRequest
+from src.domain.models.sign_in import SignInRequest
+from src.domain.models.sign_up import ConfirmSignUpRequest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Cognito:
+    """Cognito whose only user stays unconfirmed until confirmed."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.confirmed = False
+
+    def signin_with_email(self, email: str, password: str):
+        self.calls["InitiateAuth"] += 1
+        if not self.confirmed:
+            raise ClientError(
+                {"Error": {"Code": "UserNotConfirmedException", "Message": ""}},
+                "InitiateAuth",
+            )
+        return {"ChallengeName": "SOFTWARE_TOKEN_MFA", "Session": "s"}
+
+    def confirm_user_sign_up(self, user: str, confirmation_code: str):
+        self.confirmed = True
+        return {}
+
+    def resend_confirmation(self, user: str):
+        return {}
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock) -> UserStatusCache:
+    return UserStatusCache(ttl_seconds=30, unconfirmed_ttl_seconds=5, clock=clock)
+
+
+@pytest.fixture
+def cognito() -> Cognito:
+    return Cognito()
+
+
+@pytest.fixture
+def sign_in(logger, cognito, cache):
+    service = SignInService(
+        logger=logger, cognito_repository=cognito, user_status_cache=cache
+    )
+    return lambda: service.execute(SignInRequest(user="A@b.com", password="Passw0rd!"))
+
+
+def test_remembers_user_state_errors_only(cache):
+    cache.remember("a@b.com", "UserNotConfirmedException")
+    cache.remember("c@d.com", "UserNotFoundException")
+    cache.remember("e@f.com", "NotAuthorizedException")
+
+    assert cache.get(" A@B.com ") == "UserNotConfirmedException"
+    assert cache.get("c@d.com") == "UserNotFoundException"
+    assert cache.get("e@f.com") is None
+
+
+def test_unconfirmed_users_expire_sooner(cache, clock):
+    cache.remember("a@b.com", "UserNotConfirmedException")
+    cache.remember("c@d.com", "UserNotFoundException")
+
+    clock.now += 5
+    assert cache.get("a@b.com") is None
+    assert cache.get("c@d.com") == "UserNotFoundException"
+
+    clock.now += 25
+    assert cache.get("c@d.com") is None
+
+
+def test_zero_unconfirmed_ttl_does_not_keep_them(clock):
+    cache = UserStatusCache(unconfirmed_ttl_seconds=0, clock=clock)
+
+    cache.remember("a@b.com", "UserNotConfirmedException")
+
+    assert cache.get("a@b.com") is None
+
+
+def test_repeated_sign_ins_are_answered_from_the_cache(sign_in, cognito):
+    first = sign_in()
+    second = sign_in()
+
+    assert cognito.calls["InitiateAuth"] == 1
+    assert second.statusCode == first.statusCode == 404
+    assert second.result.mensaje == first.result.mensaje
+
+
+def test_confirming_invalidates_the_user(sign_in, cognito, cache, logger):
+    sign_in()
+    ConfirmSignUpService(
+        logger=logger, cognito_repository=cognito, user_status_cache=cache
+    ).execute(ConfirmSignUpRequest(user="a@b.com", confirmation_code="123456"))
+
+    response = sign_in()
+
+    assert response.statusCode == 200
+    assert cognito.calls["InitiateAuth"] == 2
+
+
+def test_resending_the_code_invalidates_the_user(sign_in, cognito, cache, logger):
+    sign_in()
+    ResendMFAService(
+        logger=logger, cognito_repository=cognito, user_status_cache=cache
+    ).execute(ResendRequest(user="a@b.com"))
+
+    assert cache.get("a@b.com") is None
+    sign_in()
+    assert cognito.calls["InitiateAuth"] == 2